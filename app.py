@@ -5,8 +5,18 @@ import pandas as pd
 import time
 import graphviz
 from src.turing_machine import TuringMachine
-from src.examples import get_example, get_all_examples
-from src.parser import parse_turing_machine_file, validate_turing_machine_file
+from src.tape import Tape
+from src.examples import get_all_examples
+from src.cache import get_example_cached, parse_cached, validate_cached
+
+# Reproducción automática: cuadros por segundo máximos y velocidades disponibles
+FRAME_RATE = 20
+MAX_FRAME_GAP = 0.25  # segundos; evita ráfagas de pasos tras una pausa larga
+SPEED_OPTIONS = [
+    1, 2, 5, 10, 20, 50, 100, 200, 500,
+    1_000, 5_000, 10_000, 50_000, 100_000, 500_000,
+    1_000_000, 2_000_000, 5_000_000
+]
 
 # Configuración de la página
 st.set_page_config(
@@ -96,10 +106,20 @@ def initialize_session_state():
         st.session_state.mode = 'examples'  # 'examples' o 'custom'
     if 'uploaded_file_content' not in st.session_state:
         st.session_state.uploaded_file_content = None
+    if 'last_frame_time' not in st.session_state:
+        st.session_state.last_frame_time = None
+    if 'step_credit' not in st.session_state:
+        st.session_state.step_credit = 0.0
 
 
-def create_state_graph(tm):
+def create_state_graph(tm, current_state=None, edge_heat=None):
     # Crea el grafo de estados de la Máquina de Turing
+    #
+    # Cada estado y cada arista reciben un id estable ('tm-state-N', 'tm-edge-N')
+    # que se conserva en el SVG, para poder resaltar el estado actual y colorear
+    # las aristas según el perfil sin volver a calcular el layout. edge_heat
+    # ({(origen, destino): disparos}) colorea las aristas directamente (solo
+    # cuando no se usa el SVG en caché).
     dot = graphviz.Digraph(comment='Máquina de Turing')
     dot.attr(rankdir='LR', size='8,5')
     
@@ -114,25 +134,28 @@ def create_state_graph(tm):
         states.add(trans.current_state)
         states.add(trans.next_state)
     
+    node_ids = {state: f'tm-state-{index}' for index, state in enumerate(sorted(states))}
+    
     # Agregar nodos
-    for state in states:
+    for state in sorted(states):
+        node_id = node_ids[state]
         if state == tm.initial_state:
             # Estado inicial (con flecha de entrada)
-            dot.node(state, state, shape='circle', fillcolor='lightgreen', style='filled')
+            dot.node(state, state, id=node_id, shape='circle', fillcolor='lightgreen', style='filled')
             dot.node('start', '', shape='none')
             dot.edge('start', state)
         elif state in tm.accept_states:
             # Estado de aceptación (doble círculo)
-            dot.node(state, state, shape='doublecircle', fillcolor='lightgreen', style='filled')
+            dot.node(state, state, id=node_id, shape='doublecircle', fillcolor='lightgreen', style='filled')
         elif state in tm.reject_states:
             # Estado de rechazo
-            dot.node(state, state, shape='doublecircle', fillcolor='salmon', style='filled')
+            dot.node(state, state, id=node_id, shape='doublecircle', fillcolor='salmon', style='filled')
         else:
             # Estado normal
-            dot.node(state, state)
+            dot.node(state, state, id=node_id)
         
-        # Resaltar estado actual
-        if state == tm.current_state and not tm.is_halted:
+        # Resaltar estado actual (solo cuando no se usa el SVG en caché)
+        if state == current_state:
             dot.node(state, state, fillcolor='yellow', style='filled')
     
     # Agregar transiciones
@@ -147,40 +170,161 @@ def create_state_graph(tm):
         else:
             transition_labels[edge_key] = label
     
+    edge_ids = {edge_key: f'tm-edge-{index}' for index, edge_key in enumerate(transition_labels)}
+    hottest = max(edge_heat.values(), default=0) if edge_heat else 0
+    
     for (src, dst), label in transition_labels.items():
+        attributes = {'id': edge_ids[(src, dst)]}
         if src == dst:
             # Auto-loop
-            dot.edge(src, dst, label=label, color='blue')
-        else:
-            dot.edge(src, dst, label=label)
+            attributes['color'] = 'blue'
+        if hottest and edge_heat.get((src, dst)):
+            ratio = edge_heat[(src, dst)] / hottest
+            attributes['color'] = heat_color(ratio)
+            attributes['penwidth'] = f'{1 + 4 * ratio:.1f}'
+        dot.edge(src, dst, label=label, **attributes)
+    
+    return dot, node_ids, edge_ids
+
+
+def heat_color(ratio):
+    # Color del mapa de calor para una fracción del máximo (0 = amarillo, 1 = rojo)
+    return f'#ff{int(200 * (1 - ratio)):02x}00'
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def state_graph_svg(definition_hash, _tm):
+    # Calcula el layout del grafo una sola vez por definición de máquina
+    #
+    # La clave es el hash del contenido de la tabla (_tm no se usa como clave).
+    # Retorna el SVG sin resaltar y el id de cada estado y arista dentro del SVG.
+    dot, node_ids, edge_ids = create_state_graph(_tm)
+    svg = dot.pipe(format='svg').decode('utf-8')
+    # Quitar la cabecera XML/DOCTYPE para poder incrustar el SVG en la página
+    svg = svg[svg.index('<svg'):]
+    return svg, node_ids, edge_ids
+
+
+def render_state_graph(tm):
+    # Muestra el grafo en caché y resalta el estado actual (y el perfil, si hay) mediante CSS
+    current_state = tm.current_state if not tm.is_halted else None
+    edge_heat = tm.profile.edge_counts(tm.transition_function) if tm.profile is not None else None
+    
+    try:
+        svg, node_ids, edge_ids = state_graph_svg(tm.definition_hash(), tm)
+    except graphviz.ExecutableNotFound:
+        # Sin el ejecutable dot se delega el layout al navegador (sin caché)
+        dot, _, _ = create_state_graph(tm, current_state, edge_heat)
+        st.graphviz_chart(dot)
+        return
+    
+    highlight = ''
+    if current_state in node_ids:
+        node_id = node_ids[current_state]
+        highlight = f'#{node_id} ellipse, #{node_id} polygon {{ fill: yellow; }}'
+    
+    # Estados con punto de interrupción: borde rojo
+    for state in tm.breakpoints.states:
+        if state in node_ids:
+            highlight += f'#{node_ids[state]} ellipse {{ stroke: red; stroke-width: 3; }}'
+    
+    # Mapa de calor: color y grosor de cada arista según sus disparos
+    hottest = max(edge_heat.values(), default=0) if edge_heat else 0
+    for edge_key, count in (edge_heat or {}).items():
+        if hottest and edge_key in edge_ids:
+            ratio = count / hottest
+            edge_id = edge_ids[edge_key]
+            highlight += (
+                f'#{edge_id} path {{ stroke: {heat_color(ratio)}; stroke-width: {1 + 4 * ratio:.1f}; }}'
+                f'#{edge_id} polygon {{ fill: {heat_color(ratio)}; stroke: {heat_color(ratio)}; }}'
+            )
     
-    return dot
+    st.markdown(
+        f'<style>{highlight}</style>'
+        f'<div style="overflow: auto; text-align: center;">{svg}</div>',
+        unsafe_allow_html=True
+    )
 
 
-def render_tape(tm, window_size=20):
-    # Renderiza la cinta de la máquina con el cabezal destacado
+def render_tape(tm, window_size=20, tapes=None):
+    # Renderiza la cinta de la máquina con el cabezal destacado (una por cinta si tiene varias)
+    #
+    # tapes permite mostrar otras cintas (p. ej. la de un paso anterior del historial).
     if tm is None or tm.tape is None:
         st.warning("No hay cinta cargada")
         return
     
-    visible, relative_pos, start_offset = tm.tape.get_visible_tape(window_size)
+    tapes = tapes or getattr(tm, 'tapes', [tm.tape])
+    for index, tape in enumerate(tapes):
+        if len(tapes) > 1:
+            st.caption(f"Cinta {index + 1}")
+        st.markdown(tape_html(tape, window_size), unsafe_allow_html=True)
+
+
+def tape_html(tape, window_size):
+    # Genera el HTML de una cinta con el cabezal destacado
+    visible, relative_pos, start_offset = tape.get_visible_tape(window_size)
     
     # Crear HTML para la cinta
-    tape_html = '<div style="display: flex; justify-content: center; flex-wrap: wrap;">'
+    html = '<div style="display: flex; justify-content: center; flex-wrap: wrap;">'
     
     for i, symbol in enumerate(visible):
         cell_class = "tape-cell"
         if i == relative_pos:
             cell_class += " tape-head"
         
-        tape_html += f'<div class="{cell_class}">{symbol if symbol != "_" else "⎵"}</div>'
+        html += f'<div class="{cell_class}">{symbol if symbol != "_" else "⎵"}</div>'
     
-    tape_html += '</div>'
+    html += '</div>'
     
     # Mostrar posición del cabezal
-    tape_html += f'<div style="text-align: center; margin-top: 10px; color: #ff0000; font-weight: bold;">▲ Cabezal (Posición: {tm.tape.get_head_position()})</div>'
+    html += f'<div style="text-align: center; margin-top: 10px; color: #ff0000; font-weight: bold;">▲ Cabezal (Posición: {tape.get_head_position()})</div>'
     
-    st.markdown(tape_html, unsafe_allow_html=True)
+    return html
+
+
+def tape_at_step(tm, step):
+    # Reconstruye la cinta del paso `step` desde el historial; retorna (cinta, estado) o None
+    if step == tm.step_count:
+        return tm.tape, tm.current_state
+    
+    index = tm.history.find(step)
+    if index < 0 or tm.history.step_at(index) != step:
+        return None
+    
+    snapshot = tm.history[index]
+    tape = Tape(blank_symbol=tm.blank_symbol)
+    tape.set_content(snapshot['tape'], snapshot['tape_start'], snapshot['head_position'])
+    return tape, snapshot['state']
+
+
+def render_time_travel(tm):
+    # Deslizador para ver la cinta de cualquier paso del historial y saltar a él
+    last_step = max(tm.step_count, tm.history.step_at(-1) if tm.history else 0)
+    if last_step == 0:
+        st.info("Ejecute algunos pasos para poder recorrerlos.")
+        return
+    
+    step = st.slider("Paso", min_value=0, max_value=last_step, value=tm.step_count)
+    found = tape_at_step(tm, step)
+    if found is None:
+        st.info(
+            f"El paso {step} no está en el historial (se ejecutó con el motor compilado); "
+            "al ir a él se vuelve a ejecutar desde el paso registrado más cercano."
+        )
+    else:
+        tape, state = found
+        caption = f"Estado en el paso {step}: {state}"
+        if hasattr(tm, 'tapes') and step != tm.step_count:
+            # El historial de una máquina de varias cintas solo guarda la primera
+            caption += " (solo la primera cinta)"
+        st.caption(caption)
+        render_tape(tm, tapes=[tape] if step != tm.step_count else None)
+    
+    if st.button("⏩ Ir a este paso", disabled=step == tm.step_count):
+        st.session_state.is_running = False
+        tm.seek(step)
+        st.rerun()
 
 
 def render_status(tm):
@@ -209,6 +353,9 @@ def render_status(tm):
             st.markdown(f'<div class="status-halted">{status_text}</div>', unsafe_allow_html=True)
         else:
             st.markdown(f'<div class="status-running">EJECUTANDO...</div>', unsafe_allow_html=True)
+    
+    if tm.breakpoints.hit and not tm.is_halted:
+        st.warning(f"🔴 Punto de interrupción: {tm.breakpoints.describe()}")
 
 
 def render_transition_table(tm):
@@ -224,20 +371,30 @@ def render_transition_table(tm):
     
     data = []
     current_symbol = tm.tape.read() if tm.tape else None
+    if hasattr(tm, 'tapes') and tm.tape:
+        # Máquina de varias cintas: se compara la tupla leída por todos los cabezales
+        current_symbol = tm.read_symbols()
     
     for trans in transitions:
         is_current = (trans.current_state == tm.current_state and 
-                     trans.read_symbol == current_symbol and 
+                     getattr(trans, 'read_symbols', trans.read_symbol) == current_symbol and 
                      not tm.is_halted)
         
         data.append({
             '🎯': '→' if is_current else '',
+            '🔴': '●' if (trans.current_state, trans.read_symbol) in tm.breakpoints.transitions else '',
             'Estado Actual': trans.current_state,
             'Lee': trans.read_symbol,
             'Escribe': trans.write_symbol,
             'Mueve': trans.move_direction,
             'Siguiente Estado': trans.next_state
         })
+        
+        if tm.profile is not None:
+            # Disparos de la transición y su porcentaje de los pasos perfilados
+            fired = tm.profile.transition_counts.get((trans.current_state, trans.read_symbol), 0)
+            data[-1]['🔥 Disparos'] = fired
+            data[-1]['% Pasos'] = round(100 * tm.profile.share(trans.current_state, trans.read_symbol), 1)
     
     df = pd.DataFrame(data)
     
@@ -249,6 +406,98 @@ def render_transition_table(tm):
     
     styled_df = df.style.apply(highlight_current, axis=1)
     st.dataframe(styled_df, use_container_width=True, hide_index=True)
+    
+    # Puntos de interrupción en transiciones (se detiene antes de dispararlas)
+    keys = sorted({(trans.current_state, trans.read_symbol) for trans in transitions})
+    selected = st.multiselect(
+        "🔴 Puntos de interrupción en transiciones",
+        options=keys,
+        default=[key for key in keys if key in tm.breakpoints.transitions],
+        format_func=lambda key: f"δ({key[0]}, {key[1]})",
+        help="La ejecución se detiene justo antes de disparar estas transiciones"
+    )
+    if set(selected) != tm.breakpoints.transitions:
+        tm.breakpoints.transitions = set(selected)
+        st.rerun()
+
+
+def render_breakpoint_controls(tm):
+    # Puntos de interrupción por posición del cabezal y celdas observadas
+    #
+    # Los de estados y transiciones se eligen en las pestañas del grafo y de la tabla.
+    breakpoints = tm.breakpoints
+    with st.expander("🔴 Puntos de Interrupción"):
+        col1, col2 = st.columns(2)
+        with col1:
+            low = st.number_input("Cabezal desde", value=0, step=1)
+        with col2:
+            high = st.number_input("Cabezal hasta", value=0, step=1)
+        if st.button("Agregar rango del cabezal", use_container_width=True):
+            try:
+                breakpoints.add_head_range(int(low), int(high))
+            except ValueError as e:
+                st.error(str(e))
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            position = st.number_input("Celda", value=0, step=1)
+        with col2:
+            symbol = st.text_input("Pasa a valer", value='', help="Vacío: cualquier cambio")
+        if st.button("Observar celda", use_container_width=True):
+            breakpoints.watch(int(position), symbol or None)
+        
+        if breakpoints:
+            lines = [f"- Estado {state}" for state in sorted(breakpoints.states)]
+            lines += [f"- δ({state}, {symbol})" for state, symbol in sorted(breakpoints.transitions)]
+            lines += [f"- Cabezal en {low}..{high}" for low, high in breakpoints.head_ranges]
+            lines += [
+                f"- Celda {position} {'cambia' if symbol is None else '= ' + symbol}"
+                for position, symbol in sorted(breakpoints.watches.items())
+            ]
+            st.markdown("\n".join(lines))
+            if st.button("Quitar todos", use_container_width=True):
+                breakpoints.clear()
+                st.rerun()
+
+
+def advance_autoplay(tm):
+    # Avanza la máquina los pasos que corresponden al tiempo transcurrido desde el cuadro anterior
+    #
+    # La cantidad de pasos por cuadro no depende de la frecuencia de refresco:
+    # con velocidades bajas se acumula la fracción de paso pendiente y con
+    # velocidades altas advance() usa el motor compilado.
+    now = time.perf_counter()
+    last = st.session_state.last_frame_time
+    st.session_state.last_frame_time = now
+    elapsed = 1 / FRAME_RATE if last is None else min(now - last, MAX_FRAME_GAP)
+    
+    credit = st.session_state.step_credit + st.session_state.speed * elapsed
+    steps = int(credit)
+    st.session_state.step_credit = credit - steps
+    tm.advance(steps, detect_loops=st.session_state.detect_loops)
+    if tm.breakpoints.hit:
+        # Los pasos pendientes se descartan al llegar a un punto de interrupción
+        st.session_state.step_credit = 0.0
+
+
+def render_live_view():
+    # Vista de la máquina que se refresca sola durante la reproducción automática
+    tm = st.session_state.tm
+    if st.session_state.is_running and not tm.is_halted:
+        advance_autoplay(tm)
+    
+    st.subheader("Estado Actual de la Máquina")
+    render_status(tm)
+    
+    st.markdown("---")
+    st.subheader("Cinta de la Máquina")
+    render_tape(tm, window_size=25)
+    
+    if st.session_state.is_running and (tm.is_halted or tm.breakpoints.hit):
+        # Al detenerse la máquina (o llegar a un punto de interrupción) se recarga
+        # la página completa (grafo, tabla, historial)
+        st.session_state.is_running = False
+        st.rerun()
 
 
 def generate_example_file():
@@ -344,7 +593,7 @@ def main():
             
             # Botón para cargar máquina
             if st.button("🔄 Cargar Máquina", use_container_width=True, type="primary"):
-                tm, _ = get_example(selected)
+                tm, _ = get_example_cached(selected)
                 if tm:
                     tm.load_tape(custom_input)
                     st.session_state.tm = tm
@@ -379,11 +628,11 @@ def main():
             if uploaded_file is not None:
                 try:
                     # Leer contenido del archivo
-                    file_content = uploaded_file.read().decode('utf-8')
+                    file_content = uploaded_file.getvalue().decode('utf-8')
                     st.session_state.uploaded_file_content = file_content
                     
-                    # Validar archivo
-                    is_valid, errors = validate_turing_machine_file(file_content)
+                    # Validar archivo (cacheado por el hash del contenido)
+                    is_valid, errors = validate_cached(file_content)
                     
                     if not is_valid:
                         st.error("❌ El archivo tiene errores:")
@@ -399,7 +648,7 @@ def main():
                         # Botón para cargar la máquina
                         if st.button("🔄 Cargar Máquina desde Archivo", use_container_width=True, type="primary"):
                             try:
-                                tm, input_string = parse_turing_machine_file(file_content)
+                                tm, input_string = parse_cached(file_content)
                                 
                                 if tm:
                                     if input_string:
@@ -447,34 +696,119 @@ def main():
         st.markdown("---")
         st.subheader("🎮 Controles")
         
+        detect_loops = st.checkbox(
+            "Detectar bucles",
+            value=True,
+            key='detect_loops',
+            help="Detiene la ejecución al repetirse una configuración (también desplazada sobre cinta en blanco)"
+        )
+        
+        profile = st.checkbox(
+            "Perfilar ejecución",
+            value=False,
+            key='profile',
+            help="Cuenta los disparos de cada transición y las escrituras por celda (grafo y tabla de transiciones)"
+        )
+        if st.session_state.tm:
+            if profile:
+                st.session_state.tm.enable_profiling()
+            else:
+                st.session_state.tm.profile = None
+        
+        with st.expander("⏱️ Límites de recursos"):
+            time_limit = st.number_input(
+                "Tiempo máximo (s)",
+                min_value=0.0,
+                value=0.0,
+                step=1.0,
+                key='budget_time',
+                help="0 = sin límite. Solo cuenta el tiempo de ejecución (no las pausas de la reproducción)"
+            )
+            tape_cells = st.number_input(
+                "Celdas de cinta",
+                min_value=0,
+                value=0,
+                step=10_000,
+                key='budget_cells',
+                help="0 = sin límite. Se detiene con LÍMITE DE CINTA al superarlas"
+            )
+            history_mb = st.number_input(
+                "Memoria del historial (MB)",
+                min_value=0,
+                value=0,
+                step=16,
+                key='budget_history',
+                help="0 = sin límite. Se detiene con LÍMITE DE MEMORIA al superarla"
+            )
+        if st.session_state.tm:
+            budget = st.session_state.tm.budget
+            budget.time_limit = time_limit or None
+            budget.max_tape_cells = tape_cells or None
+            budget.max_history_bytes = history_mb * 1024 * 1024 or None
+
         col1, col2 = st.columns(2)
         
         with col1:
             if st.button("▶️ Ejecutar Todo", use_container_width=True, type="primary"):
                 if st.session_state.tm:
-                    result = st.session_state.tm.run(max_steps=1000)
+                    st.session_state.is_running = False
+                    result = st.session_state.tm.run(max_steps=1000, detect_loops=detect_loops)
                     st.rerun()
         
         with col2:
             if st.button("⏭️ Paso", use_container_width=True):
                 if st.session_state.tm and not st.session_state.tm.is_halted:
+                    st.session_state.is_running = False
+                    st.session_state.tm.breakpoints.hit = None
                     st.session_state.tm.step()
                     st.rerun()
         
+        if st.button("⏮️ Paso Atrás", use_container_width=True):
+            if st.session_state.tm and st.session_state.tm.step_count > 0:
+                st.session_state.is_running = False
+                st.session_state.tm.breakpoints.hit = None
+                st.session_state.tm.step_back()
+                st.rerun()
+        
+        # Reproducción automática (pausa y reanuda sin perder la configuración)
+        play_label = "⏸️ Pausar" if st.session_state.is_running else "▶️ Reproducir"
+        if st.button(play_label, use_container_width=True):
+            tm = st.session_state.tm
+            if st.session_state.is_running:
+                st.session_state.is_running = False
+            elif tm and not tm.is_halted:
+                tm.max_steps = max(tm.step_count + 1, st.session_state.autoplay_limit)
+                st.session_state.is_running = True
+                st.session_state.last_frame_time = None
+                st.session_state.step_credit = 0.0
+            st.rerun()
+        
         if st.button("🔄 Reiniciar", use_container_width=True):
             if st.session_state.tm:
                 st.session_state.tm.reset(keep_tape_content=True)
                 st.session_state.is_running = False
                 st.rerun()
         
+        if st.session_state.tm:
+            render_breakpoint_controls(st.session_state.tm)
+        
         # Velocidad de ejecución
         st.markdown("---")
-        speed = st.slider(
+        st.select_slider(
             "Velocidad (pasos/seg)",
-            min_value=1,
-            max_value=10,
+            options=SPEED_OPTIONS,
             value=2,
-            help="Velocidad de ejecución automática"
+            format_func=lambda x: f"{x:,}",
+            key='speed',
+            help=f"Velocidad de la reproducción automática (la vista se refresca hasta {FRAME_RATE} veces por segundo)"
+        )
+        st.number_input(
+            "Límite de pasos (reproducción)",
+            min_value=1,
+            value=1_000_000,
+            step=100_000,
+            key='autoplay_limit',
+            help="La reproducción se detiene con TIMEOUT al llegar a esta cantidad de pasos"
         )
         
         # Información adicional
@@ -529,12 +863,9 @@ def main():
     tab1, tab2, tab3, tab4 = st.tabs(["📊 Visualización", "🔗 Grafo de Estados", "📋 Transiciones", "📚 Historial"])
     
     with tab1:
-        st.subheader("Estado Actual de la Máquina")
-        render_status(tm)
-        
-        st.markdown("---")
-        st.subheader("Cinta de la Máquina")
-        render_tape(tm, window_size=25)
+        # Solo este fragmento se vuelve a ejecutar en cada cuadro de la reproducción
+        run_every = 1 / FRAME_RATE if st.session_state.is_running else None
+        st.fragment(render_live_view, run_every=run_every)()
         
         # Información adicional
         if tm.tape:
@@ -542,7 +873,7 @@ def main():
                 col1, col2 = st.columns(2)
                 with col1:
                     st.write("**Símbolo actual:**", tm.tape.read())
-                    st.write("**Longitud de la cinta:**", len(tm.tape.get_tape_content()))
+                    st.write("**Longitud de la cinta:**", len(tm.tape))
                 with col2:
                     st.write("**Estado:**", tm.current_state)
                     st.write("**Resultado:**", tm.get_result_string())
@@ -551,8 +882,19 @@ def main():
         st.subheader("Grafo de Estados de la Máquina de Turing")
         
         try:
-            graph = create_state_graph(tm)
-            st.graphviz_chart(graph)
+            render_state_graph(tm)
+            
+            # Puntos de interrupción en estados (se marcan con borde rojo en el grafo)
+            states = sorted(tm.transition_function.get_states())
+            selected = st.multiselect(
+                "🔴 Puntos de interrupción en estados",
+                options=states,
+                default=[state for state in states if state in tm.breakpoints.states],
+                help="La ejecución se detiene cada vez que la máquina queda en uno de estos estados"
+            )
+            if set(selected) != tm.breakpoints.states:
+                tm.breakpoints.states = set(selected)
+                st.rerun()
             
             # Leyenda
             with st.expander("📖 Leyenda del Grafo"):
@@ -562,6 +904,8 @@ def main():
                 - **Doble círculo rojo**: Estado de rechazo
                 - **Amarillo**: Estado actual (durante ejecución)
                 - **Flecha azul**: Auto-transición (loop)
+                - **Borde rojo**: Estado con punto de interrupción
+                - **Amarillo a rojo (más gruesa)**: Aristas más disparadas (con el perfil activo)
                 - **Etiquetas**: `símbolo_leído → símbolo_escrito, dirección`
                 """)
         except Exception as e:
@@ -585,13 +929,33 @@ def main():
                 st.metric("Total de Símbolos", len(symbols))
             with col3:
                 st.metric("Total de Transiciones", len(transitions))
+        
+        # Perfil de ejecución (transiciones más disparadas y exportación)
+        if tm.profile is not None and tm.profile.steps:
+            with st.expander("🔥 Perfil de Ejecución"):
+                hottest = [
+                    {'Estado': state, 'Lee': symbol, 'Disparos': count}
+                    for (state, symbol), count in tm.profile.hottest(10)
+                ]
+                st.dataframe(pd.DataFrame(hottest), use_container_width=True, hide_index=True)
+                st.download_button(
+                    label="📥 Descargar Perfil (JSON)",
+                    data=tm.profile.to_json(),
+                    file_name="perfil_turing.json",
+                    mime="application/json"
+                )
     
     with tab4:
         st.subheader("Historial de Ejecución")
         
+        # Viaje en el tiempo: ver y restaurar cualquier paso anterior
+        with st.expander("⏳ Viaje en el Tiempo", expanded=False):
+            render_time_travel(tm)
+        
         if tm.history:
             history_data = []
-            for i, snapshot in enumerate(tm.history):
+            # Solo se leen los deltas; la cinta de cada paso no se reconstruye
+            for snapshot in tm.history.iter_rows():
                 history_data.append({
                     'Paso': snapshot['step'],
                     'Estado': snapshot['state'],
@@ -0,0 +1 @@
+# Banco de pruebas de rendimiento del simulador (ver bench.py)
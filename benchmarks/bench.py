@@ -0,0 +1,324 @@
+# Banco de pruebas de rendimiento: python -m benchmarks.bench
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import time
+
+from src.parser import load_turing_machine
+
+from . import workloads
+
+# Límites de pasos por ejecución (completo, rápido). El motor paso a paso
+# guarda historial, así que se limita más para acotar la memoria.
+MAX_STEPS = {'compiled': (2000000, 200000), 'step': (50000, 20000)}
+
+# Tiempo mínimo medido por carga: las ejecuciones cortas se repiten
+MIN_TIME = 0.2
+
+# Transiciones de las máquinas sintéticas para medir el parser (completo, rápido)
+PARSE_SIZES = ([1000, 10000, 100000], [1000, 10000])
+
+# Métricas comparadas: nombre -> True si mayor es mejor
+METRICS = {
+    'steps_per_sec': True,
+    'transitions_per_sec': True,
+    'peak_rss_kb': False,
+    'history_bytes': False
+}
+
+
+def peak_rss_kb():
+    #Retorna el pico de memoria residente del proceso en KiB (None si no se puede medir)
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def run_workload(spec):
+    #Ejecuta una carga en el proceso actual; retorna su resultado
+    #
+    # Se llama en un proceso nuevo por carga para que peak_rss_kb sea solo suyo.
+    result = dict(spec)
+    try:
+        if spec['kind'] == 'parse':
+            result.update(_measure_parse(spec))
+        else:
+            result.update(_measure_run(spec))
+    except Exception as e:
+        result['error'] = f'{type(e).__name__}: {e}'
+    mismatch = check_result(result)
+    if mismatch:
+        result['mismatch'] = mismatch
+    result['peak_rss_kb'] = peak_rss_kb()
+    return result
+
+
+def check_result(result):
+    #Retorna por qué una carga no dio el resultado esperado, o None si lo dio
+    #
+    # Una máquina que se detiene de inmediato o con otro veredicto mediría
+    # pasos/s sobre casi nada; ver workloads.EXPECTED.
+    expect = result.get('expect')
+    if result['kind'] != 'run' or not expect or result.get('error'):
+        return None
+    if result['verdict'] == 'timeout' and result['steps'] >= result['max_steps']:
+        return None
+    if result['verdict'] not in expect:
+        return f"veredicto {result['verdict']}, se esperaba {' o '.join(expect)}"
+    if result['steps'] < result['min_steps']:
+        return f"{result['steps']} pasos, se esperaban al menos {result['min_steps']}"
+    return None
+
+
+def _measure_run(spec):
+    # Mide una máquina sobre una entrada con un motor ('step' o 'compiled')
+    tm, default_input = workloads.load(spec['machine'])
+    input_string = workloads.make_input(spec['family'], spec['size'], spec['alphabet'])
+    engine = spec['engine']
+
+    elapsed = 0.0
+    runs = 0
+    best_rate = 0.0
+    while runs == 0 or elapsed < MIN_TIME:
+        run = tm.new_run()
+        run.load_tape(input_string)
+        start = time.perf_counter()
+        if engine == 'compiled':
+            verdict = run.run_compiled(max_steps=spec['max_steps'])
+        else:
+            verdict = run.run(max_steps=spec['max_steps'])
+        seconds = time.perf_counter() - start
+
+        elapsed += seconds
+        runs += 1
+        if seconds > 0:
+            best_rate = max(best_rate, run.step_count / seconds)
+
+    return {
+        'verdict': verdict,
+        'steps': run.step_count,
+        'runs': runs,
+        'seconds': elapsed / runs,
+        'steps_per_sec': round(best_rate),
+        'history_bytes': run.history.nbytes() if engine == 'step' else 0
+    }
+
+
+def _measure_parse(spec):
+    # Mide el parser sobre un archivo de ejemplos o una máquina sintética
+    if spec['source'] == 'synthetic':
+        handle, path = tempfile.mkstemp(suffix='.txt')
+        with os.fdopen(handle, 'w', encoding='utf-8') as machine_file:
+            machine_file.write(workloads.synthetic_machine_text(spec['size']))
+    else:
+        path = os.path.join(workloads.ROOT, spec['source'])
+
+    try:
+        elapsed = 0.0
+        runs = 0
+        best = None
+        while runs == 0 or elapsed < MIN_TIME:
+            start = time.perf_counter()
+            tm, _ = load_turing_machine(path)
+            seconds = time.perf_counter() - start
+            elapsed += seconds
+            runs += 1
+            best = seconds if best is None else min(best, seconds)
+    finally:
+        if spec['source'] == 'synthetic':
+            os.remove(path)
+
+    transitions = len(tm.transition_function.get_all_transitions())
+    return {
+        'transitions': transitions,
+        'runs': runs,
+        'seconds': best,
+        'transitions_per_sec': round(transitions / best) if best else None
+    }
+
+
+def build_specs(quick=False, machines=None):
+    #Retorna la lista de cargas (una por máquina, tamaño y motor, más las de parseo)
+    level = 1 if quick else 0
+    specs = []
+    for machine_id in workloads.machine_ids():
+        if machines and not any(name in machine_id for name in machines):
+            continue
+        try:
+            tm, default_input = workloads.load(machine_id)
+        except ValueError as e:
+            specs.append({'id': f'run:{machine_id}', 'kind': 'run', 'machine': machine_id, 'error': str(e)})
+            continue
+
+        family, alphabet = workloads.family_of(machine_id, default_input)
+        engines = ['step', 'compiled'] if tm.supports_compile else ['step']
+        for size in workloads.SIZES[family][level]:
+            expect, min_steps = workloads.expected(machine_id, size)
+            for engine in engines:
+                specs.append({
+                    'id': f'run:{machine_id}:{family}:{size}:{engine}',
+                    'kind': 'run',
+                    'machine': machine_id,
+                    'family': family,
+                    'alphabet': alphabet,
+                    'size': size,
+                    'engine': engine,
+                    'max_steps': MAX_STEPS[engine][level],
+                    'expect': expect,
+                    'min_steps': min_steps
+                })
+
+        if not machine_id.startswith('example:'):
+            specs.append({'id': f'parse:{machine_id}', 'kind': 'parse', 'source': machine_id})
+
+    for size in PARSE_SIZES[level]:
+        specs.append({'id': f'parse:synthetic:{size}', 'kind': 'parse', 'source': 'synthetic', 'size': size})
+    return specs
+
+
+def run_suite(specs, isolate=True, progress=None):
+    #Ejecuta las cargas (cada una en un proceso nuevo si isolate) y retorna los resultados
+    results = []
+    if not isolate:
+        for spec in specs:
+            results.append(spec if 'error' in spec else run_workload(spec))
+            if progress:
+                progress(results[-1])
+        return results
+
+    context = multiprocessing.get_context('spawn')
+    with context.Pool(1, maxtasksperchild=1) as pool:
+        for spec in specs:
+            result = spec if 'error' in spec else pool.apply(run_workload, (spec,))
+            results.append(result)
+            if progress:
+                progress(result)
+    return results
+
+
+def compare(results, baseline, tolerance, report_missing=True):
+    #Compara resultados con una línea base; retorna (líneas del informe, cantidad de regresiones)
+    previous = {result['id']: result for result in baseline['results']}
+    lines = []
+    regressions = 0
+
+    for result in results:
+        old = previous.get(result['id'])
+        if old is None:
+            lines.append(f"  NUEVO      {result['id']}")
+            continue
+
+        if result.get('error') != old.get('error'):
+            regressions += 1
+            lines.append(f"  ERROR      {result['id']}: {old.get('error')} -> {result.get('error')}")
+            continue
+
+        # Mismo motor y entrada: el veredicto y los pasos deben coincidir
+        for field in ('verdict', 'steps'):
+            if result.get(field) != old.get(field):
+                regressions += 1
+                lines.append(f"  RESULTADO  {result['id']}: {field} {old.get(field)} -> {result.get(field)}")
+
+        for metric, higher_is_better in METRICS.items():
+            new_value, old_value = result.get(metric), old.get(metric)
+            if not new_value or not old_value:
+                continue
+            change = (new_value - old_value) / old_value
+            worse = -change if higher_is_better else change
+            if worse > tolerance:
+                regressions += 1
+                lines.append(f"  REGRESIÓN  {result['id']}: {metric} {old_value} -> {new_value} ({change:+.0%})")
+            elif -worse > tolerance:
+                lines.append(f"  MEJORA     {result['id']}: {metric} {old_value} -> {new_value} ({change:+.0%})")
+
+    missing = set(previous) - {result['id'] for result in results} if report_missing else ()
+    for workload_id in sorted(missing):
+        lines.append(f"  FALTA      {workload_id}")
+    return lines, regressions
+
+
+def _format_result(result):
+    # Línea de progreso legible de un resultado
+    if result.get('error'):
+        return f"{result['id']}: error {result['error']}"
+    if result['kind'] == 'parse':
+        return f"{result['id']}: {result['seconds'] * 1000:.2f} ms ({result['transitions_per_sec']} transiciones/s)"
+    line = (
+        f"{result['id']}: {result['verdict']} en {result['steps']} pasos, "
+        f"{result['steps_per_sec']} pasos/s, RSS {result['peak_rss_kb']} KiB, historial {result['history_bytes']} B"
+    )
+    if result.get('mismatch'):
+        line += f" (NO ESPERADO: {result['mismatch']})"
+    return line
+
+
+def main(argv=None):
+    #Punto de entrada de línea de comandos
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.bench',
+        description='Mide el rendimiento del simulador sobre los ejemplos y familias de entradas escaladas'
+    )
+    parser.add_argument('--output', '-o', help='Guarda los resultados en este JSON')
+    parser.add_argument('--compare', metavar='BASE', help='Compara con un JSON guardado; sale con 1 si hay regresiones')
+    parser.add_argument('--no-check', action='store_true', help='No salir con 1 si una carga da otro veredicto o muy pocos pasos')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Cambio relativo tolerado antes de informar (0.2 = 20%%)')
+    parser.add_argument('--quick', action='store_true', help='Solo los tamaños pequeños')
+    parser.add_argument('--machine', action='append', help='Solo las máquinas cuyo id contenga este texto (repetible)')
+    parser.add_argument('--no-isolate', action='store_true', help='Todo en este proceso (más rápido; RSS no es por carga)')
+    args = parser.parse_args(argv)
+
+    specs = build_specs(args.quick, args.machine)
+    results = run_suite(
+        specs,
+        isolate=not args.no_isolate,
+        progress=lambda result: print(_format_result(result), file=sys.stderr)
+    )
+
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'quick': args.quick,
+            'workloads': len(specs)
+        },
+        'results': results
+    }
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            json.dump(report, output_file, indent=2, ensure_ascii=False)
+    else:
+        json.dump(report, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+
+    # Cargas con otro veredicto o muy pocos pasos: su medición no es válida
+    mismatches = [result for result in results if result.get('mismatch')]
+    if mismatches:
+        print(f"{len(mismatches)} cargas con resultados no esperados:", file=sys.stderr)
+        for result in mismatches:
+            print(f"  NO ESPERADO {result['id']}: {result['mismatch']}", file=sys.stderr)
+    failed = bool(mismatches) and not args.no_check
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as baseline_file:
+            baseline = json.load(baseline_file)
+        lines, regressions = compare(results, baseline, args.tolerance, report_missing=not args.machine)
+        print(f"Comparación con {args.compare} (tolerancia {args.tolerance:.0%}):", file=sys.stderr)
+        for line in lines:
+            print(line, file=sys.stderr)
+        print(f"{regressions} regresiones", file=sys.stderr)
+        return 1 if regressions or failed else 0
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
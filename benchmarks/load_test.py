@@ -0,0 +1,147 @@
+# Prueba de carga del servicio HTTP: python -m benchmarks.load_test
+#
+# Registra una máquina y envía ejecuciones desde varias conexiones keep-alive
+# durante un tiempo fijo; informa solicitudes por segundo y la latencia
+# (p50, p90, p99, máxima). Sin --url inicia su propio servidor en un puerto libre.
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+DEFAULT_MACHINE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'ejemplos', 'lenguaje_anbn.txt')
+
+
+def percentile(sorted_values, fraction):
+    #Retorna el percentil `fraction` (0..1) de una lista ordenada
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def request(reader, writer, host, method, path, body=b'', content_type='application/json'):
+    #Envía una solicitud por una conexión keep-alive; retorna (estado, cuerpo)
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode('latin-1') + body
+    )
+    await writer.drain()
+
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    return status, await reader.readexactly(length)
+
+
+async def run_load(host, port, source, inputs, concurrency, duration, max_steps):
+    #Registra la máquina y mide las ejecuciones; retorna (latencias en s, errores, segundos)
+    reader, writer = await asyncio.open_connection(host, port)
+    status, body = await request(reader, writer, host, 'POST', '/machines', source.encode('utf-8'), 'text/plain')
+    writer.close()
+    if status not in (200, 201):
+        raise RuntimeError(f"No se pudo registrar la máquina ({status}): {body.decode('utf-8')}")
+    info = json.loads(body)
+    path = f"/machines/{info['handle']}/run"
+    payload = json.dumps({'inputs': inputs or [info['input'] or ''], 'max_steps': max_steps}).encode('utf-8')
+
+    latencies = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def client():
+        nonlocal errors
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                status, _ = await request(reader, writer, host, 'POST', path, payload)
+                latencies.append(time.perf_counter() - start)
+                if status != 200:
+                    errors += 1
+        finally:
+            writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - start
+
+
+def start_server(workers):
+    #Inicia python -m src.server en un puerto libre; retorna (proceso, puerto)
+    command = [sys.executable, '-m', 'src.server', '--port', '0']
+    if workers:
+        command += ['--workers', str(workers)]
+    process = subprocess.Popen(
+        command, stderr=subprocess.PIPE, text=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+    # El servidor anuncia "Escuchando en http://host:puerto (...)" al estar listo
+    line = process.stderr.readline()
+    if 'http://' not in line:
+        process.kill()
+        raise RuntimeError(f"El servidor no arrancó: {line.strip()}")
+    return process, int(line.split('http://', 1)[1].split()[0].rsplit(':', 1)[1])
+
+
+def main(argv=None):
+    #Punto de entrada de línea de comandos
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.load_test',
+        description='Mide solicitudes por segundo y latencia del servicio HTTP de simulación'
+    )
+    parser.add_argument('--url', help='Servidor ya iniciado (http://host:puerto); sin él se inicia uno local')
+    parser.add_argument('--machine', default=DEFAULT_MACHINE, help='Archivo .txt de la máquina')
+    parser.add_argument('--input', action='append', help='Entrada de cada solicitud (repetible; por defecto, la de la máquina)')
+    parser.add_argument('--concurrency', type=int, default=16, help='Conexiones simultáneas')
+    parser.add_argument('--duration', type=float, default=5.0, help='Segundos de carga')
+    parser.add_argument('--max-steps', type=int, default=10000, help='Límite de pasos por entrada')
+    parser.add_argument('--workers', type=int, help='Procesos trabajadores del servidor local')
+    args = parser.parse_args(argv)
+
+    with open(args.machine, encoding='utf-8') as machine_file:
+        source = machine_file.read()
+
+    process = None
+    if args.url:
+        host, _, port = args.url.split('://', 1)[-1].rstrip('/').rpartition(':')
+        port = int(port)
+    else:
+        process, port = start_server(args.workers)
+        host = '127.0.0.1'
+
+    try:
+        latencies, errors, seconds = asyncio.run(run_load(
+            host, port, source, args.input, args.concurrency, args.duration, args.max_steps
+        ))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    latencies.sort()
+    print(json.dumps({
+        'requests': len(latencies),
+        'errors': errors,
+        'concurrency': args.concurrency,
+        'seconds': round(seconds, 3),
+        'requests_per_sec': round(len(latencies) / seconds, 1) if seconds else 0.0,
+        'latency_ms': {
+            name: round(percentile(latencies, fraction) * 1000, 3)
+            for name, fraction in (('p50', 0.5), ('p90', 0.9), ('p99', 0.99), ('max', 1.0))
+        }
+    }, indent=2))
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,160 @@
+# Cargas de trabajo reproducibles del banco de pruebas
+
+import glob
+import os
+import random
+
+from src.examples import EXAMPLES, get_example
+from src.parser import load_turing_machine
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EXAMPLES_DIR = os.path.join(ROOT, 'ejemplos')
+
+# Semilla fija: las mismas entradas en cada ejecución y en cada máquina
+SEED = 1936
+
+
+def binary_number(size, rng, alphabet=None):
+    # Número binario de `size` bits (sin ceros a la izquierda)
+    return '1' + ''.join(rng.choice('01') for _ in range(size - 1))
+
+
+def binary_product(size, rng, alphabet=None):
+    # Dos números binarios de `size` bits separados por '*'
+    return binary_number(size, rng) + '*' + binary_number(size, rng)
+
+
+def palindrome(size, rng, alphabet='ab'):
+    # Palíndromo de longitud `size`
+    half = ''.join(rng.choice(alphabet) for _ in range(size // 2))
+    middle = rng.choice(alphabet) if size % 2 else ''
+    return half + middle + half[::-1]
+
+
+def unary(size, rng, alphabet=None):
+    # Número `size` en notación unaria
+    return '1' * size
+
+
+def unary_sum(size, rng, alphabet=None):
+    # Suma unaria de dos sumandos que suman `size`
+    left = size // 2
+    return '1' * left + '+' + '1' * (size - left)
+
+
+def a_n_b_n(size, rng, alphabet=None):
+    # Cadena a^n b^n de longitud `size`
+    return 'a' * (size // 2) + 'b' * (size // 2)
+
+
+def word(size, rng, alphabet='ab'):
+    # Cadena aleatoria de longitud `size` sobre el alfabeto
+    return ''.join(rng.choice(alphabet) for _ in range(size))
+
+
+FAMILIES = {
+    'binary': binary_number,
+    'binary_product': binary_product,
+    'palindrome': palindrome,
+    'unary': unary,
+    'unary_sum': unary_sum,
+    'anbn': a_n_b_n,
+    'word': word
+}
+
+# Tamaños de cada familia (completo y rápido)
+SIZES = {
+    'binary': ([8, 64, 512, 4096], [8, 64]),
+    'binary_product': ([2, 4, 8, 16], [2, 4]),
+    'palindrome': ([100, 1000, 10000, 100000], [100, 1000]),
+    'unary': ([7, 31, 127, 509], [7, 31]),
+    'unary_sum': ([10, 100, 1000, 10000], [10, 100]),
+    'anbn': ([100, 1000, 10000, 100000], [100, 1000]),
+    'word': ([100, 1000, 10000, 100000], [100, 1000])
+}
+
+# Familia de entradas de cada máquina; las que no figuran usan 'word' sobre
+# los símbolos de su entrada por defecto
+MACHINE_FAMILIES = {
+    'example:binary_increment': 'binary',
+    'example:palindrome': 'palindrome',
+    'example:unary_addition': 'unary_sum',
+    'example:binary_multiplication': 'binary_product',
+    'ejemplos/incremento_binario.txt': 'binary',
+    'ejemplos/lenguaje_anbn.txt': 'anbn',
+    'ejemplos/multiplicacion_binaria.txt': 'binary_product',
+    'ejemplos/numero_par.txt': 'binary',
+    'ejemplos/palindromo_dos_cintas.txt': 'palindrome',
+    'ejemplos/verificador_primo.txt': 'unary'
+}
+
+# Veredictos esperados de cada máquina sobre su familia de entradas y pasos
+# mínimos por unidad de tamaño: detectan cargas que terminan de inmediato o
+# con otro resultado. Una ejecución que agota max_steps ('timeout') siempre
+# es válida; las máquinas que no figuran no se comprueban.
+EXPECTED = {
+    'example:binary_increment': (('accepted',), 1),
+    'example:palindrome': (('accepted',), 1),
+    'example:unary_addition': (('accepted',), 1),
+    'example:binary_multiplication': (('accepted',), 1),
+    'example:copy_string': (('timeout',), 1),
+    'ejemplos/incremento_binario.txt': (('accepted',), 1),
+    'ejemplos/inversor_cadena.txt': (('halted',), 1),
+    'ejemplos/lenguaje_anbn.txt': (('accepted',), 1),
+    'ejemplos/multiplicacion_binaria.txt': (('accepted',), 1),
+    'ejemplos/numero_par.txt': (('accepted', 'rejected'), 1),  # Según el último bit
+    'ejemplos/palindromo_dos_cintas.txt': (('accepted',), 1),
+    'ejemplos/subcadena_no_determinista.txt': (('accepted',), 0),  # Se detiene en el primer 'aba'
+    'ejemplos/verificador_primo.txt': (('accepted',), 1)
+}
+
+
+def machine_ids():
+    #Retorna el identificador de cada máquina: todos los EXAMPLES y ejemplos/*.txt
+    ids = [f'example:{key}' for key in EXAMPLES]
+    for path in sorted(glob.glob(os.path.join(EXAMPLES_DIR, '*.txt'))):
+        ids.append('ejemplos/' + os.path.basename(path))
+    return ids
+
+
+def load(machine_id):
+    #Carga una máquina por su identificador; retorna (máquina, entrada por defecto)
+    if machine_id.startswith('example:'):
+        return get_example(machine_id[len('example:'):])
+    return load_turing_machine(os.path.join(ROOT, machine_id))
+
+
+def family_of(machine_id, default_input):
+    #Retorna (familia, alfabeto) de las entradas de una máquina
+    family = MACHINE_FAMILIES.get(machine_id, 'word')
+    alphabet = ''.join(sorted(set(default_input or 'ab')))
+    if family == 'palindrome':
+        alphabet = 'ab'
+    return family, alphabet
+
+
+def expected(machine_id, size):
+    #Retorna (veredictos esperados, pasos mínimos) de una carga, o (None, 0) si la máquina no figura en EXPECTED
+    if machine_id not in EXPECTED:
+        return None, 0
+    verdicts, steps_per_unit = EXPECTED[machine_id]
+    return list(verdicts), max(1, steps_per_unit * size)
+
+
+def make_input(family, size, alphabet):
+    #Genera la entrada de una familia y tamaño (siempre la misma para la misma semilla)
+    rng = random.Random(f'{SEED}:{family}:{size}:{alphabet}')
+    return FAMILIES[family](size, rng, alphabet)
+
+
+def synthetic_machine_text(transitions):
+    #Genera el texto de una máquina con `transitions` transiciones (para medir el parser)
+    #
+    # Es un barrido a la derecha por una cadena de estados, con 16 símbolos.
+    symbols = [format(code, 'x') for code in range(16)]
+    states = max(1, transitions // len(symbols))
+    lines = ['[CONFIG]', 'initial_state: q0', f'accept_states: q{states}', 'blank_symbol: _', '', '[TRANSITIONS]']
+    for state in range(states):
+        for symbol in symbols:
+            lines.append(f'q{state}, {symbol} -> {symbol}, R, q{state + 1}')
+    return '\n'.join(lines) + '\n'
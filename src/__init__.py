@@ -3,24 +3,99 @@ Simulador de Máquina de Turing
 Paquete principal con todos los componentes
 """
 
-from .turing_machine import TuringMachine
-from .tape import Tape
-from .transition import Transition, TransitionFunction
-from .examples import get_example, get_all_examples, EXAMPLES
-from .parser import parse_turing_machine_file, validate_turing_machine_file, TuringMachineParser
+from importlib import import_module
+
+# Los componentes se importan bajo demanda (ver __getattr__): `import src` y
+# `python -m src` no cargan más módulos de los que usan.
+_EXPORTS = {
+    'TuringMachine': 'turing_machine',
+    'StepEvent': 'turing_machine',
+    'Tape': 'tape',
+    'SparseTape': 'tape',
+    'MappedTape': 'tape',
+    'Transition': 'transition',
+    'TransitionFunction': 'transition',
+    'ExecutionHistory': 'history',
+    'MachineDefinition': 'definition',
+    'Execution': 'definition',
+    'CompiledMachine': 'compiled',
+    'compile_machine': 'compiled',
+    'MultiTapeTuringMachine': 'multitape',
+    'MultiTapeTransition': 'multitape',
+    'MultiTapeTransitionFunction': 'multitape',
+    'NondeterministicTuringMachine': 'nondeterministic',
+    'NondeterministicTransitionFunction': 'nondeterministic',
+    'SearchResult': 'nondeterministic',
+    'ExecutionProfile': 'profiler',
+    'Breakpoints': 'breakpoints',
+    'RunBudget': 'budget',
+    'run_batch': 'batch',
+    'run_lockstep': 'vectorized',
+    'trace': 'trace',
+    'JSONLSink': 'trace',
+    'CSVSink': 'trace',
+    'RingBufferSink': 'trace',
+    'get_example': 'examples',
+    'get_all_examples': 'examples',
+    'EXAMPLES': 'examples',
+    'parse_turing_machine_file': 'parser',
+    'validate_turing_machine_file': 'parser',
+    'TuringMachineParser': 'parser',
+    'DefinitionCache': 'cache',
+    'parse_cached': 'cache',
+    'validate_cached': 'cache',
+    'get_example_cached': 'cache'
+}
 
 __version__ = "1.0.0"
 __author__ = "Tu Nombre"
 
 __all__ = [
     'TuringMachine',
+    'StepEvent',
     'Tape',
+    'SparseTape',
+    'MappedTape',
     'Transition',
     'TransitionFunction',
+    'ExecutionHistory',
+    'MachineDefinition',
+    'Execution',
+    'CompiledMachine',
+    'compile_machine',
+    'MultiTapeTuringMachine',
+    'MultiTapeTransition',
+    'MultiTapeTransitionFunction',
+    'NondeterministicTuringMachine',
+    'NondeterministicTransitionFunction',
+    'SearchResult',
+    'ExecutionProfile',
+    'Breakpoints',
+    'RunBudget',
+    'run_batch',
+    'run_lockstep',
+    'trace',
+    'JSONLSink',
+    'CSVSink',
+    'RingBufferSink',
     'get_example',
     'get_all_examples',
     'EXAMPLES',
     'parse_turing_machine_file',
     'validate_turing_machine_file',
-    'TuringMachineParser'
-]
\ No newline at end of file
+    'TuringMachineParser',
+    'DefinitionCache',
+    'parse_cached',
+    'validate_cached',
+    'get_example_cached'
+]
+
+
+def __getattr__(name):
+    # Importa el módulo que define `name` la primera vez que se pide
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,7 @@
+# Punto de entrada de `python -m src` (ver src/cli.py)
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,213 @@
+# Ejecución por lotes: una misma máquina sobre muchas entradas en paralelo
+
+import argparse
+import json
+import os
+import sys
+from collections import deque
+from itertools import islice
+
+from .budget import RunBudget
+from .compiled import CompiledMachine
+from .multitape import CompiledMultiTape
+
+# Máquina compilada de cada proceso trabajador (se envía una sola vez)
+_worker_machine = None
+_worker_options = None
+_worker_vectorized = False
+
+
+def _init_worker(machine, options, vectorized=False):
+    # Inicializa el proceso trabajador con la definición de la máquina
+    global _worker_machine, _worker_options, _worker_vectorized
+    _worker_machine = machine
+    _worker_options = options
+    _worker_vectorized = vectorized
+
+
+def _run_chunk(chunk):
+    # Ejecuta un bloque de (índice, entrada) en el proceso trabajador
+    return _run_many(_worker_machine, chunk, _worker_options, _worker_vectorized)
+
+
+def _run_many(machine, chunk, options, vectorized):
+    # Ejecuta un bloque de (índice, entrada): todo el bloque en lockstep o entrada por entrada
+    if vectorized:
+        from .vectorized import run_lockstep
+
+        results = run_lockstep(machine, [input_string for _, input_string in chunk], options['max_steps'])
+        return [
+            _summary(machine, index, input_string, result)
+            for (index, input_string), result in zip(chunk, results)
+        ]
+    return [_run_one(machine, index, input_string, options) for index, input_string in chunk]
+
+
+def _run_one(machine, index, input_string, options):
+    # Ejecuta una entrada y arma su resultado
+    if isinstance(machine, (CompiledMachine, CompiledMultiTape)):
+        return _summary(machine, index, input_string, machine.run_input(input_string, **options))
+
+    # Sin motor compilado (no determinista): búsqueda y ejecución con run()
+    tm = machine.new_run()
+    if options.get('budget'):
+        tm.budget = options['budget'].copy()
+    tm.load_tape(input_string)
+    verdict = tm.run(options['max_steps'], detect_loops=options['detect_loops'])
+    return {
+        'index': index,
+        'input': input_string,
+        'verdict': verdict,
+        'steps': tm.step_count,
+        'tape': ''.join(tm.tape.get_tape_content()).strip(tm.blank_symbol)
+    }
+
+
+def _summary(machine, index, input_string, result):
+    # Arma el resultado de una entrada a partir del de run_input
+    blank = machine.symbols[0]
+    return {
+        'index': index,
+        'input': input_string,
+        'verdict': result['verdict'],
+        'steps': result['step_count'],
+        'tape': ''.join(result['tape']).strip(blank)
+    }
+
+
+def _as_compiled(machine):
+    # Acepta una TuringMachine, una MachineDefinition o una tabla compilada (de una o varias cintas)
+    #
+    # Las máquinas sin motor compilado (no deterministas) se retornan tal cual
+    # y cada entrada se ejecuta con run().
+    if isinstance(machine, (CompiledMachine, CompiledMultiTape)):
+        return machine
+    if not getattr(machine, 'supports_compile', True):
+        return machine
+    return machine.compile()
+
+
+def run_batch(machine, inputs, max_steps=10000, workers=None, chunk_size=256, ordered=True, detect_loops=False,
+              budget=None, vectorized=False):
+    #Ejecuta la máquina sobre cada entrada y genera un resultado por entrada
+    #
+    # Las entradas se consumen de forma perezosa en bloques de `chunk_size`, con
+    # a lo sumo dos bloques en vuelo por trabajador. Con ordered=False los
+    # resultados se entregan en el orden en que terminan (cada uno lleva su
+    # 'index'). Con workers=1 se ejecuta en el proceso actual. Con
+    # detect_loops=True las entradas que entran en bucle terminan con 'loop'.
+    # Con budget (un RunBudget) cada entrada tiene además sus límites de tiempo
+    # y de celdas de cinta ('time_limit', 'tape_limit'). Con vectorized=True
+    # cada bloque se ejecuta en lockstep con NumPy (ver vectorized.py; conviene
+    # un chunk_size de miles de entradas); solo aplica a máquinas deterministas
+    # de una cinta sin detect_loops ni budget, y en los demás casos se ignora.
+    # Las máquinas no deterministas (sin motor compilado) se ejecutan con run().
+    compiled = _as_compiled(machine)
+    options = {'max_steps': max_steps, 'detect_loops': detect_loops}
+    if budget:
+        options['budget'] = budget
+    vectorized = vectorized and isinstance(compiled, CompiledMachine) and not detect_loops and not budget
+    workers = workers or os.cpu_count() or 1
+    chunks = _chunked(enumerate(inputs), chunk_size)
+
+    if workers <= 1:
+        for chunk in chunks:
+            yield from _run_many(compiled, chunk, options, vectorized)
+        return
+
+    # Importación diferida: con workers=1 (o solo load_machine) no se carga multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(compiled, options, vectorized)) as pool:
+        pending = deque()
+        max_pending = workers * 2
+
+        for chunk in chunks:
+            pending.append(pool.submit(_run_chunk, chunk))
+            while len(pending) >= max_pending:
+                yield from _collect(pending, ordered)
+
+        while pending:
+            yield from _collect(pending, ordered)
+
+
+def _chunked(items, chunk_size):
+    # Divide un iterable en listas de a lo sumo chunk_size elementos
+    items = iter(items)
+    while True:
+        chunk = list(islice(items, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _collect(pending, ordered):
+    # Entrega los resultados del siguiente bloque (en orden o el primero que termine)
+    from concurrent.futures import FIRST_COMPLETED, wait
+
+    if ordered:
+        yield from pending.popleft().result()
+        return
+
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    for future in done:
+        pending.remove(future)
+        yield from future.result()
+
+
+def load_machine(spec):
+    #Carga una máquina desde un archivo .txt, un binario compilado o por su clave en EXAMPLES
+    from .binary_format import MAGIC, load_compiled
+    from .examples import get_example
+    from .parser import load_turing_machine
+
+    if os.path.isfile(spec):
+        with open(spec, 'rb') as machine_file:
+            is_binary = machine_file.read(len(MAGIC)) == MAGIC
+        if is_binary:
+            compiled, metadata = load_compiled(spec)
+            return compiled, metadata.get('input', '')
+        return load_turing_machine(spec)
+
+    tm, default_input = get_example(spec)
+    if tm is None:
+        raise ValueError(f"No existe el archivo ni el ejemplo '{spec}'")
+    return tm, default_input
+
+
+def main(argv=None):
+    #Punto de entrada de línea de comandos: python -m src.batch
+    parser = argparse.ArgumentParser(
+        prog='python -m src.batch',
+        description='Ejecuta una Máquina de Turing sobre un conjunto de entradas en paralelo'
+    )
+    parser.add_argument('machine', help='Archivo .txt o binario compilado de la máquina, o clave de EXAMPLES')
+    parser.add_argument('inputs', nargs='?', default='-', help='Archivo con una entrada por línea (- para stdin)')
+    parser.add_argument('--max-steps', type=int, default=10000, help='Límite de pasos por entrada')
+    parser.add_argument('--workers', type=int, default=None, help='Procesos trabajadores (por defecto, uno por CPU)')
+    parser.add_argument('--chunk-size', type=int, default=256, help='Entradas por bloque enviado a cada trabajador')
+    parser.add_argument('--unordered', action='store_true', help='Emitir resultados en el orden en que terminan')
+    parser.add_argument('--detect-loops', action='store_true', help="Terminar con 'loop' al repetirse una configuración")
+    parser.add_argument('--time-limit', type=float, help="Segundos por entrada (al agotarse: 'time_limit')")
+    parser.add_argument('--max-tape-cells', type=int, help="Celdas de cinta por entrada (al superarse: 'tape_limit')")
+    parser.add_argument('--vectorized', action='store_true', help='Ejecutar cada bloque en lockstep con NumPy')
+    args = parser.parse_args(argv)
+
+    budget = RunBudget(args.time_limit, args.max_tape_cells)
+    tm, _ = load_machine(args.machine)
+    source = sys.stdin if args.inputs == '-' else open(args.inputs, encoding='utf-8')
+    try:
+        inputs = (line.rstrip('\r\n') for line in source)
+        for result in run_batch(
+            tm, inputs, args.max_steps, args.workers, args.chunk_size, not args.unordered, args.detect_loops, budget,
+            args.vectorized
+        ):
+            sys.stdout.write(json.dumps(result, ensure_ascii=False) + '\n')
+    finally:
+        if source is not sys.stdin:
+            source.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
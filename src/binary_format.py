@@ -0,0 +1,214 @@
+# Formato binario para máquinas compiladas (carga con mmap, sin parsear)
+
+import argparse
+import json
+import mmap
+import struct
+import sys
+from array import array
+
+from .compiled import CompiledMachine, HALT_ACCEPT, HALT_REJECT
+from .definition import MachineDefinition
+from .parser import load_turing_machine
+
+# Disposición del archivo (little-endian):
+#   cabecera   HEADER (ver abajo)
+#   metadata   JSON UTF-8 (name, description, input)
+#   nombres    estados y luego símbolos, en UTF-8 separados por '\0'
+#   halting    num_states bytes (HALT_NONE/ACCEPT/REJECT)
+#   next_state int32 * tamaño, alineado a 4 bytes
+#   write      int32 * tamaño
+#   move       int8  * tamaño
+# donde tamaño = (num_symbols + 1) * num_states, como en CompiledMachine (la
+# columna extra es la de celdas no visitadas). El estado inicial es el código 0
+# y el blanco es el símbolo 0.
+MAGIC = b'TMCB'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<4sHHIIII')  # magic, versión, tamaño de cabecera, estados, símbolos, metadata, nombres
+
+MOVE_NAMES = {-1: 'L', 0: 'S', 1: 'R'}
+LITTLE_ENDIAN = sys.byteorder == 'little'
+
+
+def save_compiled(compiled, path, name='', description='', input_string=''):
+    #Escribe una CompiledMachine en el formato binario
+    #
+    # El formato solo describe tablas de una cinta: otra tabla (p. ej.
+    # CompiledMultiTape) lanza ValueError.
+    if not isinstance(compiled, CompiledMachine):
+        raise ValueError(
+            f"El formato binario solo admite máquinas deterministas de una cinta (no {type(compiled).__name__})"
+        )
+    metadata = json.dumps(
+        {'name': name, 'description': description, 'input': input_string}, ensure_ascii=False
+    ).encode('utf-8')
+    names = '\0'.join(list(compiled.states) + list(compiled.symbols)).encode('utf-8')
+
+    with open(path, 'wb') as binary_file:
+        binary_file.write(HEADER.pack(
+            MAGIC, FORMAT_VERSION, HEADER.size, compiled.num_states, len(compiled.symbols), len(metadata), len(names)
+        ))
+        binary_file.write(metadata)
+        binary_file.write(names)
+        binary_file.write(bytes(compiled.halting))
+        _pad(binary_file, 4)
+        binary_file.write(_int32_bytes(compiled.next_state))
+        binary_file.write(_int32_bytes(compiled.write_symbol))
+        binary_file.write(array('b', compiled.move).tobytes())
+
+
+def load_compiled(path):
+    #Carga una CompiledMachine desde el formato binario; retorna (máquina, metadata)
+    #
+    # Los arreglos δ son vistas memoryview sobre el archivo mapeado en memoria,
+    # sin copiarlos: la carga no depende del tamaño de la tabla. El mapeo queda
+    # abierto mientras la máquina exista.
+    with open(path, 'rb') as binary_file:
+        buffer = mmap.mmap(binary_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    view = memoryview(buffer)
+    if len(view) < HEADER.size:
+        raise ValueError(f"'{path}' no es una máquina compilada (archivo demasiado corto)")
+    magic, version, header_size, num_states, num_symbols, metadata_size, names_size = HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError(f"'{path}' no es una máquina compilada (firma inválida)")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Versión de formato no soportada: {version} (se esperaba {FORMAT_VERSION})")
+
+    offset = header_size
+    metadata = json.loads(bytes(view[offset:offset + metadata_size]).decode('utf-8'))
+    offset += metadata_size
+    names = bytes(view[offset:offset + names_size]).decode('utf-8').split('\0')
+    offset += names_size
+    states, symbols = names[:num_states], names[num_states:]
+    if len(symbols) != num_symbols:
+        raise ValueError(f"'{path}' está dañado (tabla de nombres inválida)")
+
+    halting = view[offset:offset + num_states]
+    offset += num_states
+    offset += -offset % 4
+
+    size = (num_symbols + 1) * num_states
+    if len(view) < offset + 9 * size:
+        raise ValueError(f"'{path}' está dañado (arreglos δ incompletos)")
+    next_state = _int32_view(view[offset:offset + 4 * size])
+    offset += 4 * size
+    write_symbol = _int32_view(view[offset:offset + 4 * size])
+    offset += 4 * size
+    move = view[offset:offset + size].cast('b')
+
+    compiled = CompiledMachine(states, symbols, states[0], halting, next_state, write_symbol, move)
+    compiled._buffer = buffer
+    return compiled, metadata
+
+
+def compiled_to_text(compiled, name='', description='', input_string=''):
+    #Convierte una CompiledMachine al formato de texto [CONFIG]/[TRANSITIONS]
+    accept = [state for code, state in enumerate(compiled.states) if compiled.halting[code] == HALT_ACCEPT]
+    reject = [state for code, state in enumerate(compiled.states) if compiled.halting[code] == HALT_REJECT]
+
+    lines = ['[METADATA]']
+    if name:
+        lines.append(f'name: {name}')
+    if description:
+        lines.append(f'description: {description}')
+    lines += [
+        '',
+        '[CONFIG]',
+        f'initial_state: {compiled.initial_state}',
+        f"accept_states: {', '.join(accept)}",
+        f"reject_states: {', '.join(reject)}",
+        f'blank_symbol: {compiled.symbols[0]}',
+        '',
+        '[TRANSITIONS]'
+    ]
+    lines += _transition_lines(compiled)
+    if input_string:
+        lines += ['', '[INPUT]', input_string]
+    return '\n'.join(lines) + '\n'
+
+
+def definition_from_compiled(compiled, name='', description=''):
+    #Crea la MachineDefinition equivalente (reutiliza la tabla ya compilada)
+    return MachineDefinition.from_compiled(compiled, name or 'Máquina Compilada', description)
+
+
+def text_to_binary(text_path, binary_path):
+    #Compila un archivo de texto y lo guarda en el formato binario
+    tm, input_string = load_turing_machine(text_path)
+    if not tm.supports_compile:
+        raise ValueError("El formato binario solo admite máquinas deterministas (la máquina no tiene motor compilado)")
+    save_compiled(tm.compile(), binary_path, tm.name, tm.description, input_string)
+
+
+def binary_to_text(binary_path, text_path):
+    #Convierte un archivo binario de vuelta al formato de texto
+    compiled, metadata = load_compiled(binary_path)
+    with open(text_path, 'w', encoding='utf-8') as text_file:
+        text_file.write(compiled_to_text(
+            compiled, metadata.get('name', ''), metadata.get('description', ''), metadata.get('input', '')
+        ))
+
+
+def _transition_lines(compiled):
+    # Genera una línea por transición definida (la columna de no visitadas se omite)
+    num_states = compiled.num_states
+    states, symbols = compiled.states, compiled.symbols
+    next_state, write_symbol, move = compiled.next_state, compiled.write_symbol, compiled.move
+    for state in range(num_states):
+        for symbol in range(len(symbols)):
+            index = symbol * num_states + state
+            target = next_state[index]
+            if target >= 0:
+                yield (
+                    f'{states[state]}, {symbols[symbol]} -> '
+                    f'{symbols[write_symbol[index]]}, {MOVE_NAMES[move[index]]}, {states[target]}'
+                )
+
+
+def _int32_bytes(values):
+    # Serializa enteros como int32 little-endian
+    packed = array('i', values)
+    if not LITTLE_ENDIAN:
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _int32_view(view):
+    # Vista int32 sin copia (o una copia reordenada en plataformas big-endian)
+    if LITTLE_ENDIAN:
+        return view.cast('i')
+    values = array('i', bytes(view))
+    values.byteswap()
+    return values
+
+
+def _pad(binary_file, alignment):
+    # Rellena con ceros hasta la siguiente posición alineada
+    binary_file.write(b'\0' * (-binary_file.tell() % alignment))
+
+
+def main(argv=None):
+    #Punto de entrada de línea de comandos: python -m src.binary_format
+    parser = argparse.ArgumentParser(
+        prog='python -m src.binary_format',
+        description='Convierte Máquinas de Turing entre el formato de texto y el binario compilado'
+    )
+    parser.add_argument('command', choices=['compile', 'decompile'], help='compile: .txt -> binario; decompile: binario -> .txt')
+    parser.add_argument('source', help='Archivo de origen')
+    parser.add_argument('target', help='Archivo de destino')
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == 'compile':
+            text_to_binary(args.source, args.target)
+        else:
+            binary_to_text(args.source, args.target)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,112 @@
+# Puntos de interrupción de la Máquina de Turing
+
+
+class Breakpoints:
+    # Puntos de interrupción y de observación de una ejecución
+    #
+    # - states: estados en los que detenerse
+    # - transitions: pares (estado, símbolo leído) en los que detenerse antes
+    #   de disparar esa transición
+    # - head_ranges: rangos (desde, hasta), inclusivos, de posiciones del cabezal
+    # - watches: {posición: símbolo}; se detiene cuando un paso escribe ese
+    #   símbolo sobre otro distinto en la celda (None: cualquier cambio)
+    # Todos se comprueban después de cada paso, así que continuar desde un
+    # punto de interrupción siempre avanza al menos un paso. Sin ninguno
+    # definido el objeto es falso y los motores usan su bucle normal.
+
+    def __init__(self):
+        #Inicializa sin puntos de interrupción
+        self.states = set()
+        self.transitions = set()
+        self.head_ranges = []
+        self.watches = {}
+        self.hit = None  # Último punto alcanzado: (tipo, detalle) o None
+
+    def toggle_state(self, state):
+        #Activa o desactiva el punto de interrupción de un estado; retorna si quedó activo
+        if state in self.states:
+            self.states.discard(state)
+            return False
+        self.states.add(state)
+        return True
+
+    def toggle_transition(self, state, symbol):
+        #Activa o desactiva el punto de interrupción de (estado, símbolo); retorna si quedó activo
+        key = (state, symbol)
+        if key in self.transitions:
+            self.transitions.discard(key)
+            return False
+        self.transitions.add(key)
+        return True
+
+    def add_head_range(self, low, high=None):
+        #Se detiene cuando el cabezal queda en [low, high] (una sola celda si high es None)
+        high = low if high is None else high
+        if high < low:
+            raise ValueError(f"Rango de cabezal vacío: {low}..{high}")
+        self.head_ranges.append((low, high))
+
+    def watch(self, position, symbol=None):
+        #Se detiene cuando la celda `position` pasa a valer `symbol` (None: cuando cambia)
+        self.watches[position] = symbol
+
+    def unwatch(self, position):
+        #Quita la observación de una celda
+        self.watches.pop(position, None)
+
+    def clear(self):
+        #Quita todos los puntos de interrupción
+        self.states.clear()
+        self.transitions.clear()
+        self.head_ranges.clear()
+        self.watches.clear()
+        self.hit = None
+
+    def check(self, state, symbol, head, written_at, old_symbol, new_symbol):
+        #Comprueba la configuración después de un paso; registra y retorna el punto alcanzado (o None)
+        #
+        # state, symbol y head describen la configuración nueva; written_at,
+        # old_symbol y new_symbol la celda escrita por el paso.
+        hit = None
+        if written_at in self.watches and new_symbol != old_symbol:
+            expected = self.watches[written_at]
+            if expected is None or expected == new_symbol:
+                hit = ('watch', (written_at, new_symbol))
+        if hit is None:
+            hit = self.match(state, symbol, head)
+        if hit is not None:
+            self.hit = hit
+        return hit
+
+    def match(self, state, symbol, head):
+        #Retorna el punto de interrupción de estado, transición o cabezal que cumple la configuración (o None)
+        if state in self.states:
+            return ('state', state)
+        if (state, symbol) in self.transitions:
+            return ('transition', (state, symbol))
+        for low, high in self.head_ranges:
+            if low <= head <= high:
+                return ('head', head)
+        return None
+
+    def describe(self):
+        #Retorna una descripción legible del último punto alcanzado
+        if self.hit is None:
+            return ''
+        kind, detail = self.hit
+        if kind == 'state':
+            return f"Estado {detail}"
+        if kind == 'transition':
+            return f"Transición ({detail[0]}, {detail[1]})"
+        if kind == 'head':
+            return f"Cabezal en la posición {detail}"
+        return f"Celda {detail[0]} = {detail[1]}"
+
+    def __bool__(self):
+        return bool(self.states or self.transitions or self.head_ranges or self.watches)
+
+    def __repr__(self):
+        return (
+            f"Breakpoints(states={len(self.states)}, transitions={len(self.transitions)}, "
+            f"head_ranges={len(self.head_ranges)}, watches={len(self.watches)})"
+        )
@@ -0,0 +1,120 @@
+# Presupuestos de recursos de una ejecución (además de max_steps)
+
+import time
+
+# Veredictos de los presupuestos, en el orden en que se comprueban
+BUDGET_VERDICTS = ('time_limit', 'tape_limit', 'memory_limit')
+
+# Pasos máximos de una porción del motor compilado con presupuesto
+MAX_SLICE = 1 << 22
+
+
+class RunBudget:
+    # Límites de tiempo, cinta y memoria de una ejecución
+    #
+    # - time_limit: segundos de ejecución (se acumulan entre llamadas a run()
+    #   o advance() hasta reset(); las pausas de la interfaz no cuentan)
+    # - max_tape_cells: celdas de cinta (la suma de todas las cintas)
+    # - max_history_bytes: memoria del historial según ExecutionHistory.nbytes()
+    # El motor paso a paso los comprueba cada check_interval pasos y el
+    # compilado entre porciones de al menos check_interval pasos, así que
+    # pueden excederse por poco. Al agotarse uno la ejecución se detiene con
+    # su veredicto ('time_limit', 'tape_limit' o 'memory_limit'). Sin límites
+    # el objeto es falso y los motores usan su bucle normal.
+    #
+    # También es un context manager que mide el tiempo de ejecución:
+    #   with tm.budget: ...
+
+    def __init__(self, time_limit=None, max_tape_cells=None, max_history_bytes=None, check_interval=1024):
+        #Inicializa el presupuesto (None: sin ese límite)
+        self.time_limit = time_limit
+        self.max_tape_cells = max_tape_cells
+        self.max_history_bytes = max_history_bytes
+        self.check_interval = check_interval
+        self.elapsed = 0.0  # Segundos de ejecución ya acumulados
+        self._started = None
+        self._depth = 0
+
+    @property
+    def seconds(self):
+        #Segundos de ejecución acumulados (incluye la medición en curso)
+        if self._started is None:
+            return self.elapsed
+        return self.elapsed + time.perf_counter() - self._started
+
+    def reset(self):
+        #Pone en cero el tiempo acumulado (los límites se conservan)
+        self.elapsed = 0.0
+        self._started = time.perf_counter() if self._depth else None
+
+    def copy(self):
+        #Retorna un presupuesto nuevo con los mismos límites
+        return RunBudget(self.time_limit, self.max_tape_cells, self.max_history_bytes, self.check_interval)
+
+    def check(self, tape_cells, history_bytes=0):
+        #Retorna el veredicto del primer límite superado (o None)
+        if self.time_limit is not None and self.seconds >= self.time_limit:
+            return 'time_limit'
+        if self.max_tape_cells is not None and tape_cells > self.max_tape_cells:
+            return 'tape_limit'
+        if self.max_history_bytes is not None and history_bytes > self.max_history_bytes:
+            return 'memory_limit'
+        return None
+
+    def run_sliced(self, run_slice, step_count, limit, count_cells, interrupted=None):
+        #Ejecuta un motor compilado en porciones hasta el paso `limit`, comprobando el presupuesto entre ellas
+        #
+        # run_slice(pause_at) continúa desde el final de la porción anterior y
+        # retorna el resultado de execute(); count_cells(result) cuenta sus
+        # celdas de cinta e interrupted() indica si hay que detenerse (un punto
+        # de interrupción). Si se agota el presupuesto, el resultado queda
+        # detenido con el veredicto del límite.
+        size = self.check_interval
+        while True:
+            started = time.perf_counter()
+            result = run_slice(min(limit, step_count + size))
+            steps = result['step_count'] - step_count
+            step_count = result['step_count']
+            if result['is_halted'] or step_count >= limit or (interrupted is not None and interrupted()):
+                return result
+
+            cells = count_cells(result)
+            verdict = self.check(cells)
+            if verdict:
+                result['verdict'] = verdict
+                result['is_halted'] = True
+                return result
+            size = self._next_slice(size, steps, time.perf_counter() - started, cells)
+
+    def _next_slice(self, size, steps, seconds, tape_cells):
+        # La porción crece al doble sin pasar de lo que cabe en los límites de tiempo y cinta
+        size = min(size * 2, MAX_SLICE)
+        if self.max_tape_cells is not None:
+            # Cada paso agrega a lo sumo una celda por cinta
+            size = min(size, self.max_tape_cells - tape_cells + 1)
+        if self.time_limit is not None and steps:
+            rate = steps / max(seconds, 1e-9)
+            size = min(size, int(rate * (self.time_limit - self.seconds)) + 1)
+        return max(size, self.check_interval)
+
+    def __enter__(self):
+        if not self._depth:
+            self._started = time.perf_counter()
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc_info):
+        self._depth -= 1
+        if not self._depth:
+            self.elapsed += time.perf_counter() - self._started
+            self._started = None
+        return False
+
+    def __bool__(self):
+        return not (self.time_limit is None and self.max_tape_cells is None and self.max_history_bytes is None)
+
+    def __repr__(self):
+        return (
+            f"RunBudget(time_limit={self.time_limit}, max_tape_cells={self.max_tape_cells}, "
+            f"max_history_bytes={self.max_history_bytes})"
+        )
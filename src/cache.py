@@ -0,0 +1,132 @@
+# Caché de definiciones de Máquinas de Turing ya parseadas
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+from .examples import EXAMPLES, get_example
+from .parser import parse_turing_machine_file, validate_turing_machine_file
+from .turing_machine import TuringMachine
+
+
+def source_hash(file_content):
+    #Retorna el SHA-256 (hex) del texto fuente de una máquina
+    return hashlib.sha256(file_content.encode('utf-8')).hexdigest()
+
+
+class DefinitionCache:
+    # Caché LRU con tamaño máximo (se descarta la entrada usada hace más tiempo)
+    #
+    # Es segura entre hilos: Streamlit atiende cada sesión en su propio hilo y
+    # todas comparten la caché del módulo. Las máquinas se guardan como
+    # MachineDefinition (inmutables), de modo que compartirlas es seguro.
+
+    def __init__(self, maxsize=64):
+        #Inicializa la caché vacía
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        #Retorna el valor guardado para `key` (y lo marca como usado recientemente)
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key, value):
+        #Guarda un valor, descartando la entrada menos reciente si se supera maxsize
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_create(self, key, factory):
+        #Retorna el valor de `key`, creándolo con factory() si no está en la caché
+        #
+        # factory() se ejecuta fuera del candado; si dos hilos crean la misma
+        # entrada a la vez, ambos resultados son equivalentes y se conserva uno.
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = factory()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        #Vacía la caché y reinicia las estadísticas
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"DefinitionCache(size={len(self)}, maxsize={self.maxsize}, hits={self.hits}, misses={self.misses})"
+
+
+# Caché compartida por todo el proceso
+definitions = DefinitionCache()
+
+
+def validate_cached(file_content):
+    #Igual que validate_turing_machine_file, pero cacheado por el hash del texto
+    return definitions.get_or_create(
+        ('validate', source_hash(file_content)),
+        lambda: validate_turing_machine_file(file_content)
+    )
+
+
+def parse_cached(file_content):
+    #Igual que parse_turing_machine_file, pero parsea cada texto una sola vez
+    #
+    # Retorna una máquina nueva (sin cinta) sobre la definición cacheada; los
+    # errores de parseo no se guardan en la caché.
+    definition, input_string = definitions.get_or_create(
+        ('parse', source_hash(file_content)),
+        lambda: _freeze(parse_turing_machine_file(file_content))
+    )
+    return _thaw(definition), input_string
+
+
+def get_example_cached(example_name):
+    #Igual que get_example, pero cada ejemplo se construye una sola vez
+    if example_name not in EXAMPLES:
+        return None, None
+
+    definition, default_input = definitions.get_or_create(
+        ('example', example_name),
+        lambda: _freeze(get_example(example_name))
+    )
+    return _thaw(definition), default_input
+
+
+def _freeze(parsed):
+    # Convierte (TuringMachine, entrada) en (MachineDefinition compilada, entrada)
+    tm, input_string = parsed
+    if not tm.supports_definition:
+        # Sin MachineDefinition (varias cintas, no determinista): se guarda la máquina como plantilla
+        if tm.supports_compile:
+            tm.compile()
+        return tm, input_string
+    definition = tm.definition()
+    definition.compile()
+    return definition, input_string
+
+
+def _thaw(frozen):
+    # Crea una máquina nueva (sin cinta) a partir de lo guardado por _freeze
+    if isinstance(frozen, TuringMachine):
+        return frozen.new_run()
+    return TuringMachine.from_definition(frozen)
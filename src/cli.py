@@ -0,0 +1,220 @@
+# Ejecución desde la línea de comandos, sin Streamlit: python -m src
+#
+# Pensado para CI y corrección automática con muchas invocaciones cortas:
+# solo se importan los módulos del núcleo que hacen falta (nada de
+# streamlit, pandas ni graphviz).
+
+import sys
+import time
+
+VERDICTS = ('accepted', 'rejected', 'halted', 'timeout', 'loop', 'frontier_limit', 'time_limit', 'tape_limit')
+
+
+def build_parser():
+    #Construye el parser de argumentos
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog='python -m src',
+        description='Ejecuta una Máquina de Turing sobre una o más entradas e informa el veredicto'
+    )
+    parser.add_argument('machine', nargs='?', help='Archivo .txt o binario compilado de la máquina, o clave de EXAMPLES')
+    parser.add_argument('inputs', nargs='*', help='Entradas (- lee una por línea de stdin); sin entradas se usa la de la máquina')
+    parser.add_argument('-f', '--file', help='Archivo con una entrada por línea')
+    parser.add_argument('--max-steps', type=int, default=10000, help='Límite de pasos por entrada')
+    parser.add_argument('--detect-loops', action='store_true', help="Terminar con 'loop' al repetirse una configuración")
+    parser.add_argument('--time-limit', type=float, help="Segundos por entrada (al agotarse: 'time_limit')")
+    parser.add_argument('--max-tape-cells', type=int, help="Celdas de cinta por entrada (al superarse: 'tape_limit')")
+    parser.add_argument('--tape-file', help='Archivo con la cinta inicial (un byte por celda), para entradas muy largas')
+    parser.add_argument('--tape-out', help='Con --tape-file: archivo donde queda la cinta final')
+    parser.add_argument('--format', choices=('text', 'json'), default='text', help='Formato de salida (json: una línea por entrada)')
+    parser.add_argument('--summary', action='store_true', help='Agregar un resumen con la cantidad por veredicto, pasos y tiempo')
+    parser.add_argument('--expect', choices=VERDICTS, help='Salir con 1 si alguna entrada termina con otro veredicto')
+    parser.add_argument('--list', action='store_true', help='Listar las claves de EXAMPLES y salir')
+    return parser
+
+
+def make_runner(machine, max_steps, detect_loops=False, budget=None):
+    #Retorna una función entrada -> (veredicto, pasos, cinta) sobre el motor más rápido disponible
+    #
+    # Con budget (un RunBudget) cada entrada tiene además sus límites de tiempo y de cinta.
+    from .compiled import CompiledMachine
+    from .multitape import CompiledMultiTape
+
+    if not isinstance(machine, (CompiledMachine, CompiledMultiTape)) and not machine.supports_compile:
+        # Sin motor compilado (no determinista): búsqueda y ejecución con run()
+        def run(input_string):
+            tm = machine.new_run()
+            if budget:
+                tm.budget = budget.copy()
+            tm.load_tape(input_string)
+            verdict = tm.run(max_steps, detect_loops=detect_loops)
+            return verdict, tm.step_count, ''.join(tm.tape.get_tape_content()).strip(tm.blank_symbol)
+        return run
+
+    compiled = machine if isinstance(machine, (CompiledMachine, CompiledMultiTape)) else machine.compile()
+    blank = compiled.symbols[0]
+
+    def run(input_string):
+        result = compiled.run_input(
+            input_string, max_steps, macro=not detect_loops, detect_loops=detect_loops, budget=budget
+        )
+        return result['verdict'], result['step_count'], ''.join(result['tape']).strip(blank)
+    return run
+
+
+def read_inputs(args, default_input):
+    #Genera las entradas: argumentos (- es stdin), luego --file; si no hay ninguna, la de la máquina
+    found = False
+    for value in args.inputs:
+        found = True
+        if value == '-':
+            for line in sys.stdin:
+                yield line.rstrip('\r\n')
+        else:
+            yield value
+
+    if args.file:
+        found = True
+        with open(args.file, encoding='utf-8') as input_file:
+            for line in input_file:
+                yield line.rstrip('\r\n')
+
+    if not found:
+        yield default_input or ''
+
+
+def main(argv=None):
+    #Punto de entrada de línea de comandos
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.list:
+        from .examples import EXAMPLES
+        for key, info in EXAMPLES.items():
+            print(f"{key:<24} {info['name']} (entrada por defecto: {info['default_input']})")
+        return 0
+    if not args.machine:
+        parser.error('falta la máquina (archivo o clave de EXAMPLES)')
+
+    from .batch import load_machine
+    try:
+        machine, default_input = load_machine(args.machine)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+    if args.tape_file:
+        return run_tape_file(machine, args)
+
+    from .budget import RunBudget
+    run = make_runner(machine, args.max_steps, args.detect_loops, RunBudget(args.time_limit, args.max_tape_cells))
+    emit = _emit_json if args.format == 'json' else _emit_text
+    counts = {}
+    total_steps = 0
+    total_seconds = 0.0
+    unexpected = 0
+
+    for index, input_string in enumerate(read_inputs(args, default_input)):
+        start = time.perf_counter()
+        verdict, steps, tape = run(input_string)
+        seconds = time.perf_counter() - start
+
+        emit(index, input_string, verdict, steps, tape, seconds)
+        counts[verdict] = counts.get(verdict, 0) + 1
+        total_steps += steps
+        total_seconds += seconds
+        if args.expect and verdict != args.expect:
+            unexpected += 1
+
+    if args.summary:
+        _emit_summary(args.format, counts, total_steps, total_seconds)
+    return 1 if unexpected else 0
+
+
+def run_tape_file(machine, args):
+    #Ejecuta la máquina sobre la cinta de --tape-file (MappedTape, sin historial); retorna el código de salida
+    #
+    # La entrada no se convierte en cadena y la cinta final queda en --tape-out;
+    # la línea de salida muestra ambos archivos en lugar de las cadenas. Se
+    # ejecuta paso a paso (el motor compilado copiaría la cinta a memoria),
+    # comprobando --time-limit y --max-tape-cells cada check_interval pasos.
+    from .budget import RunBudget
+    from .turing_machine import TuringMachine
+
+    if type(machine) is not TuringMachine:
+        print("error: --tape-file requiere una máquina determinista de una cinta (.txt o clave de EXAMPLES)", file=sys.stderr)
+        return 2
+    if args.detect_loops:
+        print("error: --detect-loops no se admite con --tape-file", file=sys.stderr)
+        return 2
+
+    tm = machine.new_run()
+    tm.budget = budget = RunBudget(args.time_limit, args.max_tape_cells)
+    start = time.perf_counter()
+    try:
+        tape = tm.load_tape_file(args.tape_file, args.tape_out)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    verdict = None
+    try:
+        with budget:
+            for _ in tm.iter_steps(args.max_steps):
+                if budget and not tm.step_count % budget.check_interval:
+                    verdict = budget.check(len(tape))
+                    if verdict:
+                        break
+    finally:
+        tape.close()
+    seconds = time.perf_counter() - start
+
+    verdict = verdict or tm.get_verdict()
+    emit = _emit_json if args.format == 'json' else _emit_text
+    emit(0, args.tape_file, verdict, tm.step_count, args.tape_out or '', seconds)
+    if args.summary:
+        _emit_summary(args.format, {verdict: 1}, tm.step_count, seconds)
+    return 1 if args.expect and verdict != args.expect else 0
+
+
+def _emit_text(index, input_string, verdict, steps, tape, seconds):
+    # Una línea legible por entrada
+    sys.stdout.write(
+        f"{verdict:<9} {steps:>10} pasos {seconds * 1000:>9.3f} ms  {input_string or 'ε'} -> {tape or 'ε'}\n"
+    )
+
+
+def _emit_json(index, input_string, verdict, steps, tape, seconds):
+    # Una línea JSON por entrada (los mismos campos que python -m src.batch, más el tiempo)
+    import json
+
+    sys.stdout.write(json.dumps({
+        'index': index,
+        'input': input_string,
+        'verdict': verdict,
+        'steps': steps,
+        'tape': tape,
+        'seconds': round(seconds, 6)
+    }, ensure_ascii=False) + '\n')
+
+
+def _emit_summary(output_format, counts, total_steps, total_seconds):
+    # Resumen de todas las entradas
+    inputs = sum(counts.values())
+    if output_format == 'json':
+        import json
+
+        sys.stdout.write(json.dumps({'summary': {
+            'inputs': inputs,
+            'verdicts': counts,
+            'steps': total_steps,
+            'seconds': round(total_seconds, 6)
+        }}, ensure_ascii=False) + '\n')
+        return
+
+    verdicts = ', '.join(f"{count} {verdict}" for verdict, count in sorted(counts.items()))
+    sys.stdout.write(f"{inputs} entradas: {verdicts}; {total_steps} pasos en {total_seconds * 1000:.1f} ms\n")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
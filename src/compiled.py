@@ -0,0 +1,665 @@
+# Motor compilado de la Máquina de Turing (tabla δ codificada con enteros)
+
+from .tape import Tape
+from .loop_detection import LoopDetector
+
+# Códigos de detención por estado
+HALT_NONE = 0
+HALT_ACCEPT = 1
+HALT_REJECT = 2
+
+# Desplazamiento del cabezal para cada dirección
+MOVE_DELTAS = {'L': -1, 'R': 1, 'S': 0}
+
+
+class CompiledMachine:
+    # Función de transición compilada a arreglos planos
+    #
+    # Los estados y símbolos se internan como enteros pequeños. Para el estado q
+    # y el símbolo s, la entrada de la tabla está en el índice s * num_states + q
+    # de los arreglos `next_state` (-1 si no hay transición), `write_symbol` y
+    # `move` (-1, 0, +1). El blanco siempre tiene el código 0.
+    #
+    # Después de los símbolos reales hay un código extra, `fresh_code`, que
+    # marca las celdas en blanco que el cabezal aún no visitó. Se comporta igual
+    # que el blanco, pero permite recortar la cinta final a exactamente las
+    # celdas que habría creado `Tape`.
+
+    def __init__(self, states, symbols, initial_state, halting, next_state, write_symbol, move):
+        #Inicializa la máquina compilada a partir de las tablas ya construidas
+        self.states = states
+        self.symbols = symbols
+        self.state_codes = {state: code for code, state in enumerate(states)}
+        self.symbol_codes = {symbol: code for code, symbol in enumerate(symbols)}
+        self.initial_state = initial_state
+        self.halting = halting
+        self.next_state = next_state
+        self.write_symbol = write_symbol
+        self.move = move
+        self.num_states = len(states)
+        self.fresh_code = len(symbols)
+        self._rows = {}
+
+    @classmethod
+    def from_machine(cls, tm):
+        #Compila la función de transición y la configuración de una TuringMachine
+        return cls.from_transitions(
+            tm.transition_function.get_all_transitions(),
+            tm.initial_state,
+            tm.accept_states,
+            tm.reject_states,
+            tm.blank_symbol
+        )
+
+    @classmethod
+    def from_transitions(cls, transitions, initial_state, accept_states, reject_states, blank_symbol):
+        #Compila una lista de Transition con su configuración de estados
+        # Internar estados (el inicial primero) y símbolos (el blanco primero)
+        states = [initial_state]
+        symbols = [blank_symbol]
+        state_codes = {initial_state: 0}
+        symbol_codes = {blank_symbol: 0}
+        candidates_states = sorted(accept_states) + sorted(reject_states)
+        for trans in transitions:
+            candidates_states += [trans.current_state, trans.next_state]
+            for symbol in (trans.read_symbol, trans.write_symbol):
+                if symbol not in symbol_codes:
+                    symbol_codes[symbol] = len(symbols)
+                    symbols.append(symbol)
+        for state in candidates_states:
+            if state not in state_codes:
+                state_codes[state] = len(states)
+                states.append(state)
+
+        num_states = len(states)
+        size = (len(symbols) + 1) * num_states
+        next_state = [-1] * size
+        write_symbol = [0] * size
+        move = [0] * size
+
+        for trans in transitions:
+            index = symbol_codes[trans.read_symbol] * num_states + state_codes[trans.current_state]
+            next_state[index] = state_codes[trans.next_state]
+            write_symbol[index] = symbol_codes[trans.write_symbol]
+            move[index] = MOVE_DELTAS[trans.move_direction]
+
+        # La columna de celdas no visitadas replica la del blanco
+        fresh = len(symbols) * num_states
+        next_state[fresh:] = next_state[:num_states]
+        write_symbol[fresh:] = write_symbol[:num_states]
+        move[fresh:] = move[:num_states]
+
+        # La aceptación tiene prioridad sobre el rechazo, como en TuringMachine.step
+        halting = [HALT_NONE] * num_states
+        for state in reject_states:
+            halting[state_codes[state]] = HALT_REJECT
+        for state in accept_states:
+            halting[state_codes[state]] = HALT_ACCEPT
+
+        return cls(states, symbols, initial_state, halting, next_state, write_symbol, move)
+
+    def encode_tape(self, content):
+        #Codifica una lista de símbolos; los desconocidos reciben códigos fuera de la tabla
+        codes = self.symbol_codes
+        extra = {}
+        encoded = []
+        for symbol in content:
+            code = codes.get(symbol)
+            if code is None:
+                code = extra.get(symbol)
+                if code is None:
+                    code = extra[symbol] = self.fresh_code + 1 + len(extra)
+            encoded.append(code)
+
+        names = self.symbols + [self.symbols[0]] + list(extra)
+        if len(names) <= 256:
+            return bytearray(encoded), names
+        return encoded, names
+
+    def decode_tape(self, cells, names, keep_start, keep_end):
+        #Decodifica la cinta recortando las celdas no visitadas fuera de [keep_start, keep_end)
+        fresh = self.fresh_code
+        start = 0
+        while start < keep_start and cells[start] == fresh:
+            start += 1
+        end = len(cells)
+        while end > keep_end and cells[end - 1] == fresh:
+            end -= 1
+        return [names[code] for code in cells[start:end]], start
+
+    def execute(self, content, tape_start, head_position, state, step_count, max_steps, macro=False, detect_loops=False,
+                pause_at=None, profile=None, breakpoints=None):
+        #Ejecuta desde una configuración dada hasta detenerse o llegar a max_steps
+        #
+        # Con pause_at se interrumpe la ejecución al llegar a ese número de pasos
+        # sin darla por terminada ('is_halted' False y veredicto 'running'), para
+        # poder continuarla después desde la configuración retornada.
+        #
+        # Con macro=True los barridos (bucles q, s -> s, L/R, q) se resuelven en
+        # una sola operación; el conteo de pasos y la configuración final son
+        # los mismos que paso a paso. Requiere una cinta bytearray (<= 256 símbolos).
+        #
+        # Con detect_loops=True se usa un bucle con LoopDetector que termina con
+        # el veredicto 'loop' (y 'cycle_length') al repetirse una configuración;
+        # en ese caso no se aplican macro-pasos.
+        #
+        # Con profile (un ExecutionProfile) se cuentan los disparos de cada
+        # entrada de la tabla y las escrituras de cada celda; tampoco se aplican
+        # macro-pasos, porque cada paso debe contarse.
+        #
+        # Con breakpoints (un Breakpoints no vacío) la ejecución se interrumpe
+        # como con pause_at después del primer paso que cumple alguno, y se
+        # registra en breakpoints.hit.
+        cells, names = self.encode_tape(content)
+        head = head_position - tape_start
+        state_code = self.state_codes.get(state)
+        if state_code is None:
+            # Estado sin transiciones salientes: la máquina se detiene de inmediato
+            return self._result(
+                content, tape_start, head_position, state, step_count, max_steps, HALT_NONE, True
+            )
+
+        limit = max_steps if pause_at is None else min(max_steps, pause_at)
+        original_length = len(cells)
+        counters = None
+        if profile is not None:
+            # Disparos por índice de la tabla y escrituras por celda (paralelo a cells)
+            counters = ([0] * ((self.fresh_code + 1) * self.num_states), [0] * len(cells))
+
+        checks = self._breakpoint_checks(breakpoints, names, tape_start) if breakpoints else None
+        hit = []
+
+        if detect_loops or checks is not None:
+            detector = None
+            if detect_loops:
+                detector = LoopDetector()
+                fresh = self.fresh_code
+                detector.start(state_code, head_position, [code if code != fresh else 0 for code in cells], tape_start)
+            cells, head, origin, state_code, step_count, halted, cycle_length = self._run_checked(
+                cells, head, state_code, step_count, limit, len(names), detector, counters, checks, hit
+            )
+        elif counters is not None:
+            cells, head, origin, state_code, step_count, halted, cycle_length = self._run_profiled(
+                cells, head, state_code, step_count, limit, len(names), counters
+            )
+        elif macro and isinstance(cells, bytearray):
+            cells, head, origin, state_code, step_count, halted, cycle_length = self._run_macro(
+                cells, head, state_code, step_count, limit, len(names)
+            )
+        else:
+            cells, head, origin, state_code, step_count, halted, cycle_length = self._run(
+                cells, head, state_code, step_count, limit, len(names)
+            )
+
+        if hit:
+            # Pausa en un punto de interrupción: sigue en ejecución aunque no haya
+            # transición para la celda actual (run() lo descubre en el paso siguiente)
+            halted = False
+        elif halted and step_count < max_steps and not cycle_length and self.halting[state_code] == HALT_NONE:
+            # Se alcanzó pause_at: sigue en ejecución si hay transición para la celda actual
+            code = cells[head]
+            halted = code > self.fresh_code or self.next_state[code * self.num_states + state_code] < 0
+
+        if hit:
+            if hit[0][0] == 'watch':
+                breakpoints.hit = ('watch', (tape_start + hit[0][1], names[hit[0][2]]))
+            else:
+                breakpoints.hit = breakpoints.match(
+                    self.states[state_code], names[cells[head]], tape_start - origin + head
+                )
+
+        if counters is not None:
+            profile.add_compiled_counts(self, counters[0], counters[1], tape_start - origin)
+
+        # Recortar al rango inicial más las celdas visitadas
+        keep_start = min(origin, head)
+        keep_end = max(origin + original_length, head + 1)
+        decoded, trimmed = self.decode_tape(cells, names, keep_start, keep_end)
+
+        return self._result(
+            decoded,
+            tape_start - origin + trimmed,
+            tape_start - origin + head,
+            self.states[state_code],
+            step_count,
+            max_steps,
+            self.halting[state_code],
+            halted,
+            cycle_length
+        )
+
+    def execute_budgeted(self, budget, content, tape_start, head_position, state, step_count, max_steps,
+                         pause_at=None, **options):
+        #Como execute(), en porciones que comprueban un RunBudget entre ellas
+        #
+        # El tiempo se mide mientras el presupuesto esté activo (with budget).
+        # Con detect_loops el detector empieza de nuevo en cada porción, así que
+        # solo encuentra ciclos más cortos que la porción (que crece al doble).
+        config = [content, tape_start, head_position, state, step_count]
+        breakpoints = options.get('breakpoints')
+
+        def run_slice(pause):
+            result = self.execute(*config, max_steps, pause_at=pause, **options)
+            config[:] = result['tape'], result['tape_start'], result['head_position'], result['state'], result['step_count']
+            return result
+
+        return budget.run_sliced(
+            run_slice,
+            step_count,
+            max_steps if pause_at is None else min(max_steps, pause_at),
+            lambda result: len(result['tape']),
+            (lambda: breakpoints.hit is not None) if breakpoints else None
+        )
+
+    def run_input(self, input_string, max_steps, macro=False, detect_loops=False, budget=None):
+        #Ejecuta la máquina desde el estado inicial sobre una cadena de entrada
+        #
+        # Con budget (un RunBudget no vacío) se aplican también sus límites,
+        # medidos desde cero para esta entrada.
+        tape = Tape(list(input_string) if input_string else None, self.symbols[0])
+        config = (tape.get_tape_content(), tape.get_tape_start(), tape.get_head_position(), self.initial_state, 0)
+        if not budget:
+            return self.execute(*config, max_steps, macro, detect_loops)
+
+        budget.reset()
+        with budget:
+            return self.execute_budgeted(budget, *config, max_steps, macro=macro, detect_loops=detect_loops)
+
+    def get_rows(self, width, macro=False):
+        #Retorna la tabla como filas por estado: rows[q][s] = (q', s', delta, fila de q', se detiene)
+        #
+        # Es la forma que usa el bucle principal: una sola indexación por paso y
+        # sin comprobar rangos, porque cada fila tiene `width` columnas (una por
+        # cada código que puede aparecer en la cinta). Con macro=True cada entrada lleva además la
+        # información de barrido (ver _sweep_info) o None. Las filas se
+        # construyen una vez por combinación de parámetros.
+        rows = self._rows.get((width, macro))
+        if rows is not None:
+            return rows
+
+        num_states = self.num_states
+        rows = [[None] * width for _ in range(num_states)]
+        for symbol in range(min(width, self.fresh_code + 1)):
+            base = symbol * num_states
+            for state in range(num_states):
+                target = self.next_state[base + state]
+                if target >= 0:
+                    entry = [target, self.write_symbol[base + state], self.move[base + state], None, self.halting[target] != HALT_NONE]
+                    if macro:
+                        entry.append(self._sweep_info(state, symbol))
+                    rows[state][symbol] = entry
+
+        # Enlazar cada entrada con la fila de su estado destino
+        for row in rows:
+            for symbol, entry in enumerate(row):
+                if entry is not None:
+                    entry[3] = rows[entry[0]]
+                    row[symbol] = tuple(entry)
+
+        self._rows[(width, macro)] = rows
+        return rows
+
+    def _is_sweep(self, state, symbol):
+        # Un barrido es un bucle sobre el mismo estado que reescribe el símbolo leído y se mueve
+        index = symbol * self.num_states + state
+        return (
+            self.next_state[index] == state
+            and self.move[index] != 0
+            and self.halting[state] == HALT_NONE
+            and (self.write_symbol[index] == symbol or symbol == self.fresh_code)
+        )
+
+    def _sweep_info(self, state, symbol):
+        # (dirección, símbolos que recorre el barrido, incluye blancos) o None
+        #
+        # Por ejemplo, con q0, 0 -> 0, R, q0 y q0, 1 -> 1, R, q0 el cabezal salta
+        # de una vez toda la corrida de 0s y 1s a su derecha.
+        if not self._is_sweep(state, symbol):
+            return None
+
+        delta = self.move[symbol * self.num_states + state]
+        codes = [
+            code for code in range(self.fresh_code + 1)
+            if self._is_sweep(state, code) and self.move[code * self.num_states + state] == delta
+        ]
+        # La columna de celdas no visitadas es la del blanco, que sí escribe el blanco
+        if self.fresh_code in codes and 0 not in codes:
+            return None
+        return delta, bytes(codes), self.fresh_code in codes
+
+    def _run(self, cells, head, state, steps, limit, width):
+        # Bucle principal sobre la tabla compilada
+        is_bytes = isinstance(cells, bytearray)
+        row = self.get_rows(width)[state]
+        fresh = self.fresh_code
+        length = len(cells)
+        origin = 0
+        remaining = limit - steps
+
+        while True:
+            entry = row[cells[head]]
+            if entry is None:
+                # No hay transición definida - la máquina se detiene
+                return cells, head, origin, state, limit - remaining, True, None
+
+            state, cells[head], delta, row, stop = entry
+            head += delta
+            remaining -= 1
+
+            # Extender la cinta duplicando su tamaño (O(1) amortizado)
+            if not 0 <= head < length:
+                if head < 0:
+                    cells[0:0] = bytes([fresh]) * length if is_bytes else [fresh] * length
+                    head += length
+                    origin += length
+                else:
+                    cells.extend(bytes([fresh]) * length if is_bytes else [fresh] * length)
+                length += length
+
+            if stop or remaining <= 0:
+                return cells, head, origin, state, limit - remaining, True, None
+
+    def _run_checked(self, cells, head, state, steps, limit, width, detector, counters=None, checks=None, hit=None):
+        # Bucle con verificaciones por paso (bucles, perfil, puntos de interrupción); más lento que _run
+        #
+        # detector es un LoopDetector o None, counters es (disparos, escrituras)
+        # como en _run_profiled, o None, y checks es lo que retorna
+        # _breakpoint_checks, o None. Al cumplirse un punto de interrupción se
+        # agrega a `hit` ('watch', posición relativa, código escrito) o
+        # ('config',) y se retorna como una pausa.
+        row = self.get_rows(width)[state]
+        num_states = self.num_states
+        fresh = self.fresh_code
+        grow_cell = bytes([fresh]) if isinstance(cells, bytearray) else [fresh]
+        window = detector.window if detector is not None else 0
+        flags, ranges, watches = checks if checks is not None else (None, None, None)
+        length = len(cells)
+        origin = 0
+        remaining = limit - steps
+
+        while True:
+            old = cells[head]
+            entry = row[old]
+            if entry is None:
+                # No hay transición definida - la máquina se detiene
+                return cells, head, origin, state, limit - remaining, True, None
+
+            if counters is not None:
+                counters[0][old * num_states + state] += 1
+                counters[1][head] += 1
+
+            state, new, delta, row, stop = entry
+            cells[head] = new
+            watched = None
+            if watches and head - origin in watches:
+                expected = watches[head - origin]
+                if new != (old if old != fresh else 0) and (expected < 0 or expected == new):
+                    watched = ('watch', head - origin, new)
+            head += delta
+            remaining -= 1
+
+            # Extender la cinta duplicando su tamaño (O(1) amortizado)
+            if not 0 <= head < length:
+                if head < 0:
+                    cells[0:0] = grow_cell * length
+                    if counters is not None:
+                        counters[1][0:0] = [0] * length
+                    head += length
+                    origin += length
+                else:
+                    cells.extend(grow_cell * length)
+                    if counters is not None:
+                        counters[1].extend([0] * length)
+                length += length
+
+            if stop or remaining <= 0:
+                return cells, head, origin, state, limit - remaining, True, None
+
+            if detector is not None:
+                # Celdas que entran y salen de la ventana del detector (fuera de la cinta: blanco)
+                entering = leaving = 0
+                if delta:
+                    position = head + delta * window
+                    if 0 <= position < length and cells[position] != fresh:
+                        entering = cells[position]
+                    position = head - delta * (window + 1)
+                    if 0 <= position < length and cells[position] != fresh:
+                        leaving = cells[position]
+
+                cycle_length = detector.update(state, old if old != fresh else 0, new, delta, entering, leaving)
+                if cycle_length:
+                    return cells, head, origin, state, limit - remaining, True, cycle_length
+
+            if checks is not None:
+                if watched is None and flags[cells[head] * num_states + state]:
+                    watched = ('config',)
+                if watched is None:
+                    for low, high in ranges:
+                        if low <= head - origin <= high:
+                            watched = ('config',)
+                            break
+                if watched is not None:
+                    hit.append(watched)
+                    return cells, head, origin, state, limit - remaining, True, None
+
+    def _breakpoint_checks(self, breakpoints, names, tape_start):
+        # Traduce los puntos de interrupción a la forma que usa _run_checked
+        #
+        # flags[código * num_states + estado] marca las configuraciones que
+        # detienen la ejecución (por estado o por transición); los rangos y las
+        # celdas observadas se expresan relativos a la primera celda de la cinta.
+        num_states = self.num_states
+        flags = bytearray(len(names) * num_states)
+        for code, symbol in enumerate(names):
+            base = code * num_states
+            for state_code, state in enumerate(self.states):
+                if state in breakpoints.states or (state, symbol) in breakpoints.transitions:
+                    flags[base + state_code] = 1
+
+        ranges = [(low - tape_start, high - tape_start) for low, high in breakpoints.head_ranges]
+        watches = {}
+        for position, symbol in breakpoints.watches.items():
+            if symbol is None:
+                watches[position - tape_start] = -1
+            elif symbol in self.symbol_codes:
+                # Un símbolo que la tabla no escribe nunca puede aparecer
+                watches[position - tape_start] = self.symbol_codes[symbol]
+        return flags, ranges, watches
+
+    def _run_profiled(self, cells, head, state, steps, limit, width, counters):
+        # Como _run, pero contando los disparos por índice de la tabla y las escrituras por celda
+        is_bytes = isinstance(cells, bytearray)
+        row = self.get_rows(width)[state]
+        counts, writes = counters
+        num_states = self.num_states
+        fresh = self.fresh_code
+        length = len(cells)
+        origin = 0
+        remaining = limit - steps
+
+        while True:
+            code = cells[head]
+            entry = row[code]
+            if entry is None:
+                # No hay transición definida - la máquina se detiene
+                return cells, head, origin, state, limit - remaining, True, None
+
+            counts[code * num_states + state] += 1
+            writes[head] += 1
+            state, cells[head], delta, row, stop = entry
+            head += delta
+            remaining -= 1
+
+            # Extender la cinta (y los contadores de escritura) duplicando su tamaño
+            if not 0 <= head < length:
+                if head < 0:
+                    cells[0:0] = bytes([fresh]) * length if is_bytes else [fresh] * length
+                    writes[0:0] = [0] * length
+                    head += length
+                    origin += length
+                else:
+                    cells.extend(bytes([fresh]) * length if is_bytes else [fresh] * length)
+                    writes.extend([0] * length)
+                length += length
+
+            if stop or remaining <= 0:
+                return cells, head, origin, state, limit - remaining, True, None
+
+    def _run_macro(self, cells, head, state, steps, limit, width):
+        # Bucle con macro-pasos: los barridos sobre corridas de símbolos se saltan de una vez
+        row = self.get_rows(width, macro=True)[state]
+        fresh = self.fresh_code
+        fresh_byte = bytes([fresh])
+        length = len(cells)
+        origin = 0
+        remaining = limit - steps
+
+        while True:
+            entry = row[cells[head]]
+            if entry is None:
+                # No hay transición definida - la máquina se detiene
+                return cells, head, origin, state, limit - remaining, True, None
+
+            sweep = entry[5]
+            if sweep is None:
+                state, cells[head], delta, row, stop, _ = entry
+                head += delta
+                remaining -= 1
+            else:
+                # Avanzar sobre toda la corrida; el estado y los símbolos no cambian
+                delta, codes, covers_blank = sweep
+
+                # Las corridas cortas se cuentan aquí; las largas, con búsquedas en bloque
+                count = 1
+                position = head + delta
+                while 0 <= position < length and cells[position] in codes:
+                    count += 1
+                    position += delta
+                    if count == 16:
+                        count = _sweep_length(cells, head, delta, codes)
+                        break
+                else:
+                    if not 0 <= position < length:
+                        count = None
+                    elif count < remaining and not covers_blank:
+                        # Caso común: corrida corta que termina dentro de la cinta
+                        head = position
+                        remaining -= count
+                        continue
+
+                if count is None:
+                    # Más allá del borde solo hay celdas no visitadas (blancos)
+                    if covers_blank:
+                        count = remaining
+                    else:
+                        count = length - head if delta > 0 else head + 1
+                count = min(count, remaining)
+                target = head + delta * count
+
+                # Extender la cinta hasta cubrir la posición final del cabezal
+                while target < 0:
+                    cells[0:0] = fresh_byte * length
+                    head += length
+                    target += length
+                    origin += length
+                    length += length
+                while target >= length:
+                    cells.extend(fresh_byte * length)
+                    length += length
+
+                # Las celdas no visitadas que se recorren pasan a ser blancos visitados
+                if covers_blank:
+                    low, high = (head, target) if delta > 0 else (target + 1, head + 1)
+                    segment = cells[low:high]
+                    if fresh in segment:
+                        cells[low:high] = segment.replace(fresh_byte, b'\x00')
+
+                head = target
+                remaining -= count
+                stop = False
+
+            # Extender la cinta duplicando su tamaño (O(1) amortizado)
+            if not 0 <= head < length:
+                if head < 0:
+                    cells[0:0] = fresh_byte * length
+                    head += length
+                    origin += length
+                else:
+                    cells.extend(fresh_byte * length)
+                length += length
+
+            if stop or remaining <= 0:
+                return cells, head, origin, state, limit - remaining, True, None
+
+    def _result(self, cells, tape_start, head_position, state, step_count, max_steps, halt, halted, cycle_length=None):
+        # Arma el diccionario de resultado con el mismo veredicto que TuringMachine.run
+        if not halted:
+            verdict = 'running'
+        elif halt == HALT_ACCEPT:
+            verdict = 'accepted'
+        elif halt == HALT_REJECT:
+            verdict = 'rejected'
+        elif cycle_length:
+            verdict = 'loop'
+        elif step_count >= max_steps:
+            verdict = 'timeout'
+        else:
+            verdict = 'halted'
+
+        return {
+            'verdict': verdict,
+            'tape': cells,
+            'tape_start': tape_start,
+            'head_position': head_position,
+            'state': state,
+            'step_count': step_count,
+            'is_halted': halted,
+            'cycle_length': cycle_length
+        }
+
+    def __getstate__(self):
+        # Las filas derivadas se reconstruyen en el proceso destino
+        state = self.__dict__.copy()
+        state['_rows'] = {}
+
+        # Las tablas cargadas con mmap (ver binary_format) se envían como listas
+        state.pop('_buffer', None)
+        for field in ('halting', 'next_state', 'write_symbol', 'move'):
+            if isinstance(state[field], memoryview):
+                state[field] = state[field].tolist()
+        return state
+
+    def __repr__(self):
+        return f"CompiledMachine(states={self.num_states}, symbols={len(self.symbols)})"
+
+
+def _sweep_length(cells, head, delta, codes):
+    # Cantidad de celdas consecutivas desde `head` (inclusive) en dirección `delta`
+    # cuyos códigos están en `codes`; None si la corrida llega al borde del arreglo.
+    # Se examinan ventanas de tamaño creciente para mantener el costo en O(distancia).
+    window = 64
+    if delta > 0:
+        position = head
+        length = len(cells)
+        while position < length:
+            chunk = cells[position:position + window]
+            rest = chunk.lstrip(codes)
+            if rest:
+                return position + len(chunk) - len(rest) - head
+            position += len(chunk)
+            window *= 2
+        return None
+
+    end = head + 1
+    while end > 0:
+        start = max(0, end - window)
+        rest = cells[start:end].rstrip(codes)
+        if rest:
+            return head - (start + len(rest) - 1)
+        end = start
+        window *= 2
+    return None
+
+
+def compile_machine(tm):
+    return CompiledMachine.from_machine(tm)
@@ -0,0 +1,354 @@
+# Definición inmutable de una Máquina de Turing y ejecuciones livianas sobre ella
+
+import hashlib
+from contextlib import contextmanager
+from types import MappingProxyType
+
+from .budget import BUDGET_VERDICTS
+from .tape import Tape
+from .compiled import CompiledMachine, HALT_ACCEPT, HALT_REJECT
+from .transition import Transition
+
+# Veredictos de una ejecución interrumpida por un límite (ver Execution.stop_reason)
+STOP_VERDICTS = ('timeout',) + BUDGET_VERDICTS
+
+
+def definition_digest(transitions, initial_state, accept_states, reject_states, blank_symbol):
+    #Retorna el SHA-256 (hex) del contenido de una definición
+    #
+    # No depende del orden de las transiciones ni del nombre de la máquina.
+    lines = sorted(
+        '\x1f'.join((t.current_state, t.read_symbol, t.write_symbol, t.move_direction, t.next_state))
+        for t in transitions
+    )
+    lines.append('\x1f'.join((
+        str(initial_state),
+        ','.join(sorted(accept_states)),
+        ','.join(sorted(reject_states)),
+        blank_symbol
+    )))
+    return hashlib.sha256('\n'.join(lines).encode('utf-8')).hexdigest()
+
+
+class MachineDefinition:
+    # Definición congelada (inmutable y hashable) de una Máquina de Turing
+    #
+    # Contiene solo la parte estática de la máquina: transiciones, estados
+    # especiales y blanco. Al no cambiar nunca, una misma instancia puede
+    # compartirse entre hilos y entre miles de ejecuciones sin copiarse.
+    # Ofrece la misma interfaz de lectura que TransitionFunction
+    # (get_transition, get_all_transitions, get_states, ...), por lo que puede
+    # usarse como `transition_function` de una TuringMachine.
+    #
+    # Dos definiciones son iguales si tienen el mismo `digest` (el nombre y la
+    # descripción no cuentan).
+
+    __slots__ = (
+        'name', 'description', 'initial_state', 'accept_states', 'reject_states',
+        'blank_symbol', 'transitions', 'digest', '_compiled'
+    )
+
+    def __init__(self, transitions, initial_state, accept_states, reject_states=(), blank_symbol='_',
+                 name="Máquina de Turing", description=""):
+        #Crea la definición a partir de un iterable de Transition (o de {(estado, símbolo): Transition})
+        if not hasattr(transitions, 'values'):
+            transitions = {(t.current_state, t.read_symbol): t for t in transitions}
+
+        set_field = object.__setattr__
+        set_field(self, 'name', name)
+        set_field(self, 'description', description)
+        set_field(self, 'initial_state', initial_state)
+        set_field(self, 'accept_states', frozenset(accept_states))
+        set_field(self, 'reject_states', frozenset(reject_states))
+        set_field(self, 'blank_symbol', blank_symbol)
+        set_field(self, 'transitions', MappingProxyType(dict(transitions)))
+        set_field(self, 'digest', definition_digest(
+            self.transitions.values(), initial_state, self.accept_states, self.reject_states, blank_symbol
+        ))
+        set_field(self, '_compiled', None)
+
+    @classmethod
+    def from_machine(cls, tm):
+        #Congela la definición actual de una TuringMachine
+        return cls(
+            tm.transition_function.transitions,
+            tm.initial_state,
+            tm.accept_states,
+            tm.reject_states,
+            tm.blank_symbol,
+            tm.name,
+            tm.description
+        )
+
+    @classmethod
+    def from_compiled(cls, compiled, name="Máquina de Turing", description=""):
+        #Reconstruye la definición de una CompiledMachine, reutilizándola como tabla compilada
+        num_states = compiled.num_states
+        states, symbols = compiled.states, compiled.symbols
+        moves = {-1: 'L', 0: 'S', 1: 'R'}
+        transitions = {}
+        for symbol_code, symbol in enumerate(symbols):
+            base = symbol_code * num_states
+            for state_code, state in enumerate(states):
+                target = compiled.next_state[base + state_code]
+                if target >= 0:
+                    transitions[(state, symbol)] = Transition(
+                        state,
+                        symbol,
+                        symbols[compiled.write_symbol[base + state_code]],
+                        moves[compiled.move[base + state_code]],
+                        states[target]
+                    )
+
+        definition = cls(
+            transitions,
+            compiled.initial_state,
+            [state for code, state in enumerate(states) if compiled.halting[code] == HALT_ACCEPT],
+            [state for code, state in enumerate(states) if compiled.halting[code] == HALT_REJECT],
+            symbols[0],
+            name,
+            description
+        )
+        object.__setattr__(definition, '_compiled', compiled)
+        return definition
+
+    def compile(self):
+        #Retorna la tabla compilada (se construye una sola vez por definición)
+        if self._compiled is None:
+            object.__setattr__(self, '_compiled', CompiledMachine.from_transitions(
+                list(self.transitions.values()),
+                self.initial_state,
+                self.accept_states,
+                self.reject_states,
+                self.blank_symbol
+            ))
+        return self._compiled
+
+    def execution(self, input_string=None, max_steps=10000):
+        #Crea una ejecución nueva sobre esta definición
+        return Execution(self, input_string, max_steps)
+
+    def get_transition(self, current_state, read_symbol):
+        #Obtiene la transición para un estado y símbolo dados
+        return self.transitions.get((current_state, read_symbol))
+
+    def has_transition(self, current_state, read_symbol):
+        #Verifica si existe una transición para el estado y símbolo dados
+        return (current_state, read_symbol) in self.transitions
+
+    def get_all_transitions(self):
+        #Retorna todas las transiciones como lista
+        return list(self.transitions.values())
+
+    def get_states(self):
+        #Retorna el conjunto de todos los estados que aparecen en las transiciones
+        states = set()
+        for transition in self.transitions.values():
+            states.add(transition.current_state)
+            states.add(transition.next_state)
+        return states
+
+    def get_symbols(self):
+        #Retorna el conjunto de todos los símbolos que aparecen en las transiciones
+        symbols = set()
+        for transition in self.transitions.values():
+            symbols.add(transition.read_symbol)
+            symbols.add(transition.write_symbol)
+        return symbols
+
+    def to_table(self):
+        #Convierte las transiciones a una tabla legible
+        return [transition.to_dict() for transition in self.transitions.values()]
+
+    def __setattr__(self, name, value):
+        raise AttributeError("MachineDefinition es inmutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("MachineDefinition es inmutable")
+
+    def __reduce__(self):
+        # Para pickle (procesos trabajadores): se reconstruye desde sus campos
+        return (MachineDefinition, (
+            dict(self.transitions), self.initial_state, self.accept_states, self.reject_states,
+            self.blank_symbol, self.name, self.description
+        ))
+
+    def __eq__(self, other):
+        if not isinstance(other, MachineDefinition):
+            return NotImplemented
+        return self.digest == other.digest
+
+    def __hash__(self):
+        return hash(self.digest)
+
+    def __len__(self):
+        return len(self.transitions)
+
+    def __repr__(self):
+        return f"MachineDefinition(name={self.name!r}, transitions={len(self.transitions)}, digest={self.digest[:12]})"
+
+
+class Execution:
+    # Estado de una ejecución sobre una MachineDefinition compartida
+    #
+    # Solo guarda lo que cambia durante la ejecución (cinta, estado, contador
+    # y banderas), con __slots__ para que crear miles de ejecuciones sea barato.
+    # Es la única implementación del paso, de la ejecución compilada y del
+    # veredicto: TuringMachine es una fachada que guarda una Execution (con la
+    # propia máquina como definición) y le agrega historial, perfil, puntos de
+    # interrupción y presupuesto.
+    #
+    # `definition` es cualquier objeto con get_transition(), compile(),
+    # initial_state, accept_states, reject_states y blank_symbol.
+
+    __slots__ = (
+        'definition', 'tape', 'current_state', 'step_count', 'max_steps',
+        'is_halted', 'is_accepted', 'is_rejected', 'cycle_length', 'stop_reason'
+    )
+
+    def __init__(self, definition, input_string=None, max_steps=10000):
+        #Inicializa la ejecución en el estado inicial con la cinta cargada
+        self.definition = definition
+        self.max_steps = max_steps
+        self.load_tape(input_string)
+
+    def load_tape(self, initial_content):
+        #Carga la cinta y vuelve al estado inicial
+        if isinstance(initial_content, str):
+            initial_content = list(initial_content)
+        self.tape = Tape(initial_content, self.definition.blank_symbol)
+        self.restart()
+
+    def restart(self):
+        #Vuelve al estado inicial sin tocar la cinta
+        self.current_state = self.definition.initial_state
+        self.step_count = 0
+        self.is_halted = False
+        self.is_accepted = False
+        self.is_rejected = False
+        self.cycle_length = None
+        self.stop_reason = None  # Límite que detuvo la ejecución: uno de STOP_VERDICTS
+
+    def step(self):
+        #Ejecuta un paso; retorna False si la máquina se detuvo
+        if self.is_halted:
+            return False
+        return self.apply(self.definition.get_transition(self.current_state, self.tape.read()))
+
+    def apply(self, transition):
+        #Aplica una transición a la cinta (o detiene la máquina si es None); retorna False si se detuvo
+        if transition is None:
+            return self.halt()
+
+        tape = self.tape
+        tape.write(transition.write_symbol)
+        if transition.move_direction == 'L':
+            tape.move_left()
+        elif transition.move_direction == 'R':
+            tape.move_right()
+        # 'S' (Stay) no mueve el cabezal
+
+        return self.enter(transition.next_state)
+
+    def halt(self):
+        #Detiene la máquina por falta de transición (acepta o rechaza según el estado actual)
+        definition = self.definition
+        self.is_halted = True
+        if self.current_state in definition.accept_states:
+            self.is_accepted = True
+        elif self.current_state in definition.reject_states:
+            self.is_rejected = True
+        return False
+
+    def enter(self, next_state):
+        #Pasa al estado siguiente después de escribir y mover; retorna False si la máquina se detuvo
+        definition = self.definition
+        self.current_state = next_state
+        self.step_count += 1
+
+        # Verificar estados finales
+        if next_state in definition.accept_states:
+            self.is_halted = self.is_accepted = True
+            return False
+        elif next_state in definition.reject_states:
+            self.is_halted = self.is_rejected = True
+            return False
+
+        # Prevenir bucles infinitos
+        if self.step_count >= self.max_steps:
+            self.is_halted = True
+            self.stop_reason = 'timeout'
+            return False
+
+        return True
+
+    @contextmanager
+    def step_limit(self, max_steps):
+        #Aplica max_steps (si se indica) solo mientras dura una ejecución
+        if not max_steps:
+            yield
+            return
+        previous = self.max_steps
+        self.max_steps = max_steps
+        try:
+            yield
+        finally:
+            self.max_steps = previous
+
+    def run(self, max_steps=None, macro=False, detect_loops=False):
+        #Ejecuta hasta detenerse sobre la tabla compilada; retorna el veredicto
+        #
+        # max_steps limita solo esta llamada (self.max_steps no cambia).
+        with self.step_limit(max_steps):
+            if not self.is_halted:
+                self.execute_compiled(macro=macro, detect_loops=detect_loops)
+            return self.get_verdict()
+
+    def execute_compiled(self, pause_at=None, budget=None, **options):
+        #Ejecuta el motor compilado desde la configuración actual y carga el resultado
+        #
+        # Con budget (un RunBudget no vacío) se ejecuta en porciones que lo
+        # comprueban; options son las de CompiledMachine.execute (macro,
+        # detect_loops, profile, breakpoints).
+        config = (
+            self.tape.get_tape_content(),
+            self.tape.get_tape_start(),
+            self.tape.get_head_position(),
+            self.current_state,
+            self.step_count,
+            self.max_steps
+        )
+        compiled = self.definition.compile()
+        if budget:
+            result = compiled.execute_budgeted(budget, *config, pause_at=pause_at, **options)
+        else:
+            result = compiled.execute(*config, pause_at=pause_at, **options)
+        self.load_result(result)
+        return result
+
+    def load_result(self, result):
+        #Copia la configuración retornada por CompiledMachine.execute
+        self.tape.set_content(result['tape'], result['tape_start'], result['head_position'])
+        self.current_state = result['state']
+        self.step_count = result['step_count']
+        self.is_halted = result['is_halted']
+        self.is_accepted = result['verdict'] == 'accepted'
+        self.is_rejected = result['verdict'] == 'rejected'
+        self.cycle_length = result['cycle_length']
+        self.stop_reason = result['verdict'] if result['verdict'] in STOP_VERDICTS else None
+
+    def get_verdict(self):
+        #Retorna el veredicto de la ejecución según las banderas de estado
+        if self.is_accepted:
+            return 'accepted'
+        elif self.is_rejected:
+            return 'rejected'
+        elif self.cycle_length:
+            return 'loop'
+        elif self.stop_reason:
+            return self.stop_reason
+        else:
+            return 'halted'
+
+    def __repr__(self):
+        return f"Execution(state={self.current_state}, steps={self.step_count}, verdict={self.get_verdict()})"
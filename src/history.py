@@ -0,0 +1,205 @@
+# Módulo para el historial de ejecución de la Máquina de Turing
+
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+
+from .tape import CodedCells
+
+
+class ExecutionHistory:
+    # Historial de ejecución codificado por deltas
+    #
+    # Por cada paso solo se guarda el estado, la posición absoluta del cabezal,
+    # el símbolo leído (valor previo de la celda) y el símbolo escrito. La cinta
+    # completa se guarda únicamente cada `checkpoint_interval` pasos (o cada
+    # tantos pasos como celdas tenga la copia, si son más, para que su costo sea
+    # O(1) amortizado por paso) y cualquier otra instantánea se reconstruye bajo
+    # demanda a partir del checkpoint previo.
+    #
+    # Los números de paso son crecientes, así que una entrada se ubica por paso
+    # con búsqueda binaria (find). Si se registra un paso que ya estaba (la
+    # máquina volvió atrás con seek()), las entradas desde ese paso se descartan.
+
+    def __init__(self, checkpoint_interval=256):
+        #Inicializa el historial vacío
+        self.checkpoint_interval = max(1, int(checkpoint_interval))
+        self.clear()
+
+    def clear(self):
+        #Elimina todas las entradas y checkpoints
+        self._steps = array('q')
+        self._heads = array('q')
+        self._states = []
+        self._symbols = []
+        self._written = []  # None si en ese paso no hubo transición
+        self._checkpoints = {}  # índice de entrada -> (inicio, fin, celdas, blanco); ver Tape.checkpoint
+        self._checkpoint_indices = []
+        self._checkpoint_bytes = 0
+        self._next_checkpoint = 0  # índice de la próxima entrada con checkpoint
+        self._force_checkpoint = True
+
+    def record(self, step, state, tape, symbol, written):
+        #Registra el paso actual (antes de escribir en la cinta)
+        if self._steps and step <= self._steps[-1]:
+            # Se vuelve a ejecutar desde un paso anterior: descartar lo que seguía
+            self.truncate(bisect_left(self._steps, step))
+
+        index = len(self._steps)
+        if self._force_checkpoint or index >= self._next_checkpoint:
+            checkpoint = tape.checkpoint()
+            self._checkpoints[index] = checkpoint
+            self._checkpoint_indices.append(index)
+            self._checkpoint_bytes += sys.getsizeof(checkpoint[2])
+            self._next_checkpoint = index + self._checkpoint_spacing(checkpoint)
+            self._force_checkpoint = False
+
+        self._steps.append(step)
+        self._heads.append(tape.get_head_position())
+        self._states.append(state)
+        self._symbols.append(symbol)
+        self._written.append(written)
+
+    def nbytes(self):
+        #Retorna una estimación en O(1) de la memoria usada por el historial (en bytes)
+        #
+        # Cuenta los arreglos y listas propios y las celdas de los checkpoints;
+        # los símbolos y estados son cadenas compartidas con la máquina.
+        return (
+            self._steps.itemsize * len(self._steps)
+            + self._heads.itemsize * len(self._heads)
+            + sys.getsizeof(self._states)
+            + sys.getsizeof(self._symbols)
+            + sys.getsizeof(self._written)
+            + self._checkpoint_bytes
+        )
+
+    def _checkpoint_spacing(self, checkpoint):
+        # Entradas hasta el próximo checkpoint: al menos tantas como celdas copiadas
+        return max(self.checkpoint_interval, len(checkpoint[2]))
+
+    def truncate(self, index):
+        #Descarta las entradas desde `index` en adelante
+        index = max(0, index)
+        if index >= len(self._steps):
+            return
+
+        # Si la entrada `index` era un checkpoint (p. ej. después de pasos no
+        # registrados), la que la reemplace también debe serlo
+        force_checkpoint = self._force_checkpoint or index in self._checkpoints
+        del self._steps[index:]
+        del self._heads[index:]
+        del self._states[index:]
+        del self._symbols[index:]
+        del self._written[index:]
+        while self._checkpoint_indices and self._checkpoint_indices[-1] >= index:
+            checkpoint = self._checkpoints.pop(self._checkpoint_indices.pop())
+            self._checkpoint_bytes -= sys.getsizeof(checkpoint[2])
+
+        if self._checkpoint_indices:
+            last = self._checkpoint_indices[-1]
+            self._next_checkpoint = last + self._checkpoint_spacing(self._checkpoints[last])
+        self._force_checkpoint = force_checkpoint or not self._checkpoint_indices
+
+    def find(self, step):
+        #Retorna el índice de la última entrada con paso <= `step` (-1 si no hay), en O(log n)
+        return bisect_right(self._steps, step) - 1
+
+    def step_at(self, index):
+        #Retorna el número de paso de una entrada (sin reconstruir la cinta)
+        return self._steps[index]
+
+    def mark_discontinuity(self):
+        #Indica que hubo pasos no registrados; la próxima entrada será un checkpoint
+        self._force_checkpoint = True
+
+    def _rebuild(self, index):
+        # Reconstruye (inicio, celdas) de la cinta para la entrada `index`
+        checkpoint = self._checkpoint_indices[bisect_right(self._checkpoint_indices, index) - 1]
+        start, cells, blank = _expand(self._checkpoints[checkpoint])
+
+        # La cinta se extiende con cada posición visitada por el cabezal
+        heads = self._heads[checkpoint:index + 1]
+        low = min(start, min(heads))
+        high = max(start + len(cells), max(heads) + 1)
+        if low < start or high > start + len(cells):
+            cells = [blank] * (start - low) + cells + [blank] * (high - start - len(cells))
+            start = low
+
+        for j in range(checkpoint, index):
+            written = self._written[j]
+            if written is not None:
+                cells[self._heads[j] - start] = written
+
+        return start, cells
+
+    def _snapshot(self, index, start, cells):
+        return {
+            'step': self._steps[index],
+            'state': self._states[index],
+            'tape': cells,
+            'tape_start': start,
+            'head_position': self._heads[index],
+            'symbol': self._symbols[index]
+        }
+
+    def __getitem__(self, index):
+        #Retorna la instantánea completa de una entrada (o lista si es slice)
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Índice de historial fuera de rango")
+
+        start, cells = self._rebuild(index)
+        return self._snapshot(index, start, cells)
+
+    def __iter__(self):
+        #Recorre las instantáneas completas reconstruyendo la cinta de forma incremental
+        start, cells, blank = None, None, None
+        for index in range(len(self)):
+            if index in self._checkpoints:
+                start, cells, blank = _expand(self._checkpoints[index])
+            else:
+                previous = index - 1
+                if self._written[previous] is not None:
+                    cells[self._heads[previous] - start] = self._written[previous]
+
+            head = self._heads[index]
+            if head < start:
+                cells[0:0] = [blank] * (start - head)
+                start = head
+            elif head >= start + len(cells):
+                cells.extend([blank] * (head - start - len(cells) + 1))
+
+            yield self._snapshot(index, start, list(cells))
+
+    def iter_rows(self):
+        #Recorre las entradas sin reconstruir la cinta (para tablas y exportación)
+        for index in range(len(self)):
+            yield {
+                'step': self._steps[index],
+                'state': self._states[index],
+                'head_position': self._heads[index],
+                'symbol': self._symbols[index]
+            }
+
+    def __len__(self):
+        return len(self._steps)
+
+    def __repr__(self):
+        return f"ExecutionHistory(entries={len(self)}, checkpoints={len(self._checkpoint_indices)})"
+
+
+def _expand(checkpoint):
+    # Convierte un checkpoint en (inicio, lista de celdas nueva, blanco)
+    start, end, cells, blank = checkpoint
+    if isinstance(cells, dict):
+        # Checkpoint disperso {posición: símbolo} (SparseTape)
+        return start, [cells.get(position, blank) for position in range(start, end)], blank
+    if isinstance(cells, CodedCells):
+        # Checkpoint de un byte por celda (MappedTape)
+        return start, cells.symbols(), blank
+    return start, list(cells), blank
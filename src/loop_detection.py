@@ -0,0 +1,190 @@
+# Detección de bucles (no terminación) mediante hashing de configuraciones
+
+# Hash polinomial módulo un primo de Mersenne: H = sum(código(celda_p) * BASE^p)
+MODULUS = (1 << 61) - 1
+BASE = 1000003
+BASE_INVERSE = pow(BASE, -1, MODULUS)
+
+
+class LoopDetector:
+    # Detector incremental de configuraciones repetidas
+    #
+    # Mantiene con costo O(1) por paso:
+    #   - el hash de toda la cinta relativo al cabezal, para detectar
+    #     repeticiones exactas o desplazadas de la configuración completa;
+    #   - el hash de la ventana [cabezal - window, cabezal + window], para
+    #     detectar ciclos desplazados sobre cinta en blanco.
+    #
+    # En ambos casos se usa el algoritmo de Brent, que guarda una sola
+    # configuración de referencia y encuentra la longitud exacta del ciclo.
+    # Un ciclo desplazado solo se reporta entre dos momentos en que el cabezal
+    # está en un extremo nunca antes visitado (todo lo que sigue es blanco) y
+    # si en ese intervalo no se alejó más de `window` celdas hacia atrás, de
+    # modo que el futuro de la máquina es una traslación del intervalo.
+    # El blanco siempre tiene el código 0.
+
+    def __init__(self, window=32):
+        #Inicializa el detector (llamar a start() antes de update())
+        self.window = window
+        self._symbol_codes = {}
+        self._base_window = pow(BASE, window, MODULUS)
+        self._inverse_window = pow(BASE_INVERSE, window, MODULUS)
+
+    def start(self, state, head, cells, tape_start):
+        #Calcula los hashes de la configuración inicial (cells son códigos desde tape_start)
+        full = 0
+        window_hash = 0
+        right_edge = left_edge = head
+        for offset, code in enumerate(cells):
+            if code:
+                position = tape_start + offset
+                term = code * self._power(position) % MODULUS
+                full += term
+                if abs(position - head) <= self.window:
+                    window_hash += term
+                right_edge = max(right_edge, position)
+                left_edge = min(left_edge, position)
+
+        self._full = full % MODULUS
+        self._window_hash = window_hash % MODULUS
+        self._head = head
+        self._head_power = self._power(head)
+        self._head_inverse = pow(self._head_power, -1, MODULUS)
+        self._step = 0
+
+        # Brent sobre todas las configuraciones
+        self._key = (state, self._relative(self._full))
+        self._tortoise = self._key
+        self._brent_power = self._brent_length = 1
+
+        # Brent sobre los récords hacia la derecha y hacia la izquierda
+        self._records = [
+            _RecordTracker(1, right_edge),
+            _RecordTracker(-1, left_edge)
+        ]
+
+    def update(self, state, old_code, new_code, delta, entering_code, leaving_code):
+        #Registra un paso; retorna la longitud del ciclo si se detectó uno, o None
+        #
+        # old_code/new_code: celda escrita (bajo el cabezal anterior).
+        # entering_code/leaving_code: celdas que entran y salen de la ventana
+        # tras moverse delta (-1, 0, +1); se ignoran si delta es 0.
+        self._step += 1
+        if old_code != new_code:
+            change = (new_code - old_code) * self._head_power % MODULUS
+            self._full = (self._full + change) % MODULUS
+            self._window_hash = (self._window_hash + change) % MODULUS
+
+        if delta:
+            head = self._head + delta
+            if delta > 0:
+                self._head_power = self._head_power * BASE % MODULUS
+                self._head_inverse = self._head_inverse * BASE_INVERSE % MODULUS
+                entering_power = self._head_power * self._base_window
+                leaving_power = self._head_power * BASE_INVERSE % MODULUS * self._inverse_window
+            else:
+                self._head_power = self._head_power * BASE_INVERSE % MODULUS
+                self._head_inverse = self._head_inverse * BASE % MODULUS
+                entering_power = self._head_power * self._inverse_window
+                leaving_power = self._head_power * BASE % MODULUS * self._base_window
+            self._window_hash = (
+                self._window_hash + entering_code * entering_power - leaving_code * leaving_power
+            ) % MODULUS
+            self._head = head
+
+        # Repetición (exacta o desplazada) de la configuración completa
+        key = (state, self._relative(self._full))
+        if key == self._tortoise:
+            return self._brent_length
+        if self._brent_power == self._brent_length:
+            self._tortoise = key
+            self._brent_power *= 2
+            self._brent_length = 0
+        self._brent_length += 1
+
+        # Ciclo desplazado sobre cinta en blanco
+        if delta:
+            window_key = (state, self._relative(self._window_hash))
+            for tracker in self._records:
+                cycle = tracker.observe(self._head, self._step, window_key, self.window)
+                if cycle:
+                    return cycle
+        return None
+
+    def symbol_code(self, symbol, blank_symbol):
+        #Código entero de un símbolo (el blanco es 0)
+        if symbol == blank_symbol:
+            return 0
+        code = self._symbol_codes.get(symbol)
+        if code is None:
+            code = self._symbol_codes[symbol] = len(self._symbol_codes) + 1
+        return code
+
+    def start_tape(self, state, tape):
+        #Versión de start() para una Tape de símbolos
+        blank = tape.blank_symbol
+        cells = [self.symbol_code(symbol, blank) for symbol in tape.get_tape_content()]
+        self.start(state, tape.get_head_position(), cells, tape.get_tape_start())
+
+    def update_tape(self, state, tape, old_head, old_symbol):
+        #Versión de update() para una Tape, llamada después de TuringMachine.step()
+        blank = tape.blank_symbol
+        head = tape.get_head_position()
+        delta = head - old_head
+        entering = leaving = 0
+        if delta:
+            entering = self.symbol_code(tape.get_cell(head + delta * self.window), blank)
+            leaving = self.symbol_code(tape.get_cell(head - delta * (self.window + 1)), blank)
+        return self.update(
+            state,
+            self.symbol_code(old_symbol, blank),
+            self.symbol_code(tape.get_cell(old_head), blank),
+            delta,
+            entering,
+            leaving
+        )
+
+    def _relative(self, value):
+        # Hash desplazado para que el cabezal quede en la posición 0
+        return value * self._head_inverse % MODULUS
+
+    def _power(self, position):
+        # BASE^position (admite posiciones negativas)
+        if position >= 0:
+            return pow(BASE, position, MODULUS)
+        return pow(BASE_INVERSE, -position, MODULUS)
+
+
+class _RecordTracker:
+    # Brent sobre los momentos en que el cabezal supera su récord en una dirección
+
+    def __init__(self, direction, edge):
+        self.direction = direction
+        self.edge = edge
+        self.tortoise = None
+        self.power = self.length = 1
+        self.farthest_back = 0  # retroceso máximo desde el récord de referencia
+
+    def observe(self, head, step, key, window):
+        # Retorna la longitud del ciclo desplazado si se detectó, o None
+        if self.tortoise is not None:
+            back = (self.tortoise[2] - head) * self.direction
+            if back > self.farthest_back:
+                self.farthest_back = back
+
+        if (head - self.edge) * self.direction <= 0:
+            return None
+        self.edge = head
+
+        if self.tortoise is not None:
+            tortoise_key, tortoise_step, _ = self.tortoise
+            if key == tortoise_key and self.farthest_back <= window:
+                return step - tortoise_step
+
+        if self.tortoise is None or self.power == self.length:
+            self.tortoise = (key, step, head)
+            self.farthest_back = 0
+            self.power *= 2
+            self.length = 0
+        self.length += 1
+        return None
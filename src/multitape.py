@@ -0,0 +1,715 @@
+# Máquinas de Turing de k cintas
+
+import hashlib
+from bisect import bisect_right, insort
+from operator import getitem
+
+from .tape import TAPE_BACKENDS
+from .definition import STOP_VERDICTS
+from .turing_machine import TuringMachine, StepEvent
+
+VALID_DIRECTIONS = ('L', 'R', 'S')
+MOVE_DELTAS = {'L': -1, 'R': 1, 'S': 0}
+
+# Marca de celda aún no visitada en las cintas del motor compilado
+_FRESH = None
+
+
+class MultiTapeTransition:
+    #Transición de una máquina de k cintas: lee, escribe y mueve en todas a la vez
+
+    __slots__ = ('current_state', 'read_symbols', 'write_symbols', 'move_directions', 'next_state')
+
+    def __init__(self, current_state, read_symbols, write_symbols, move_directions, next_state):
+        #Inicializa la transición (las tres secuencias deben tener una entrada por cinta)
+        self.current_state = current_state
+        self.read_symbols = tuple(read_symbols)
+        self.write_symbols = tuple(write_symbols)
+        self.move_directions = tuple(direction.upper() for direction in move_directions)
+        self.next_state = next_state
+
+        if not len(self.read_symbols) == len(self.write_symbols) == len(self.move_directions):
+            raise ValueError(
+                f"La transición debe leer, escribir y mover la misma cantidad de cintas: "
+                f"{len(self.read_symbols)}, {len(self.write_symbols)}, {len(self.move_directions)}"
+            )
+        for direction in self.move_directions:
+            if direction not in VALID_DIRECTIONS:
+                raise ValueError(f"Dirección inválida: {direction}. Use 'L' (Left), 'R' (Right) o 'S' (Stay)")
+
+    # Vistas como texto con la misma interfaz que Transition (tabla y grafo de la app)
+    @property
+    def read_symbol(self):
+        return _format_tuple(self.read_symbols)
+
+    @property
+    def write_symbol(self):
+        return _format_tuple(self.write_symbols)
+
+    @property
+    def move_direction(self):
+        return _format_tuple(self.move_directions)
+
+    def __str__(self):
+        return f"δ({self.current_state}, {self.read_symbol}) = ({self.next_state}, {self.write_symbol}, {self.move_direction})"
+
+    def __repr__(self):
+        return (
+            f"MultiTapeTransition({self.current_state}, {self.read_symbols}, {self.write_symbols}, "
+            f"{self.move_directions}, {self.next_state})"
+        )
+
+    def to_dict(self):
+        #Convierte la transición a diccionario
+        return {
+            'current_state': self.current_state,
+            'read_symbols': list(self.read_symbols),
+            'write_symbols': list(self.write_symbols),
+            'move_directions': list(self.move_directions),
+            'next_state': self.next_state
+        }
+
+
+class MultiTapeTransitionFunction:
+    #Función de transición de k cintas: {(estado, (s1, ..., sk)): MultiTapeTransition}
+
+    def __init__(self, num_tapes):
+        #Inicializa la función de transición vacía
+        self.num_tapes = num_tapes
+        self.transitions = {}
+        # Se incrementa con cada modificación (invalida tablas compiladas)
+        self.revision = 0
+
+    def add_transition(self, current_state, read_symbols, write_symbols, move_directions, next_state):
+        #Agrega una transición a la función
+        transition = MultiTapeTransition(current_state, read_symbols, write_symbols, move_directions, next_state)
+        if len(transition.read_symbols) != self.num_tapes:
+            raise ValueError(
+                f"Se esperaban {self.num_tapes} símbolos por transición y hay {len(transition.read_symbols)}"
+            )
+        self.transitions[(current_state, transition.read_symbols)] = transition
+        self.revision += 1
+
+    def get_transition(self, current_state, read_symbols):
+        #Obtiene la transición para un estado y una tupla de símbolos leídos
+        return self.transitions.get((current_state, tuple(read_symbols)))
+
+    def has_transition(self, current_state, read_symbols):
+        #Verifica si existe una transición para el estado y los símbolos dados
+        return (current_state, tuple(read_symbols)) in self.transitions
+
+    def get_all_transitions(self):
+        #Retorna todas las transiciones como lista
+        return list(self.transitions.values())
+
+    def get_states(self):
+        #Retorna el conjunto de todos los estados
+        states = set()
+        for transition in self.transitions.values():
+            states.add(transition.current_state)
+            states.add(transition.next_state)
+        return states
+
+    def get_symbols(self):
+        #Retorna el conjunto de todos los símbolos (de todas las cintas)
+        symbols = set()
+        for transition in self.transitions.values():
+            symbols.update(transition.read_symbols)
+            symbols.update(transition.write_symbols)
+        return symbols
+
+    def to_table(self):
+        #Convierte las transiciones a una tabla legible
+        return [transition.to_dict() for transition in self.transitions.values()]
+
+    def load_from_dict(self, transitions_dict):
+        #Carga transiciones desde {estado: {(s1, ..., sk): {'write': (...), 'move': (...), 'next_state': q}}}
+        self.transitions.clear()
+        self.revision += 1
+
+        for state, symbol_dict in transitions_dict.items():
+            for symbols, trans_data in symbol_dict.items():
+                self.add_transition(state, symbols, trans_data['write'], trans_data['move'], trans_data['next_state'])
+
+    def __str__(self):
+        result = f"Función de Transición ({self.num_tapes} cintas):\n"
+        for transition in self.transitions.values():
+            result += f"  {transition}\n"
+        return result
+
+    def __repr__(self):
+        return f"MultiTapeTransitionFunction(tapes={self.num_tapes}, transitions={len(self.transitions)})"
+
+
+class CompiledMultiTape:
+    # Tabla de k cintas preparada para el bucle rápido (ver execute)
+    #
+    # Cada estado tiene un diccionario {símbolos leídos: entrada}, con
+    # entrada = (estado siguiente, símbolos escritos, desplazamientos,
+    # diccionario del estado siguiente, se detiene). Las celdas no visitadas se
+    # marcan con None (como `fresh_code` en CompiledMachine), así que cada
+    # transición que lee blancos se registra también con None en esas cintas;
+    # esto permite recortar las cintas finales a exactamente las celdas que
+    # habría creado Tape. Tiene la misma interfaz que usa src/batch.py.
+
+    def __init__(self, num_tapes, transitions, initial_state, accept_states, reject_states, blank_symbol):
+        #Prepara la tabla a partir de una lista de MultiTapeTransition
+        self.num_tapes = num_tapes
+        self.initial_state = initial_state
+        self.accept_states = frozenset(accept_states)
+        self.reject_states = frozenset(reject_states)
+        self.blank_symbol = blank_symbol
+        self.transitions = list(transitions)
+
+        symbols = [blank_symbol]
+        for transition in self.transitions:
+            for symbol in transition.read_symbols + transition.write_symbols:
+                if symbol not in symbols:
+                    symbols.append(symbol)
+        self.symbols = symbols
+        self._rows = None
+
+    def get_rows(self):
+        #Retorna {estado: {símbolos leídos: entrada}} (se construye una sola vez)
+        if self._rows is not None:
+            return self._rows
+
+        halting = self.accept_states | self.reject_states
+        rows = {}
+        for transition in self.transitions:
+            rows.setdefault(transition.current_state, {})
+            rows.setdefault(transition.next_state, {})
+
+        blank = self.blank_symbol
+        for transition in self.transitions:
+            entry = (
+                transition.next_state,
+                transition.write_symbols,
+                tuple(MOVE_DELTAS[direction] for direction in transition.move_directions),
+                rows[transition.next_state],
+                transition.next_state in halting
+            )
+            # Variantes con celdas no visitadas en lugar de cada blanco leído
+            keys = [()]
+            for symbol in transition.read_symbols:
+                keys = [key + (symbol,) for key in keys] + (
+                    [key + (_FRESH,) for key in keys] if symbol == blank else []
+                )
+            row = rows[transition.current_state]
+            for key in keys:
+                row[key] = entry
+
+        self._rows = rows
+        return rows
+
+    def execute(self, contents, starts, heads, state, step_count, max_steps, pause_at=None):
+        #Ejecuta desde una configuración dada (una lista de celdas, inicio y cabezal por cinta)
+        #
+        # Con pause_at se interrumpe al llegar a esa cantidad de pasos sin dar la
+        # ejecución por terminada ('is_halted' False, veredicto 'running').
+        limit = max_steps if pause_at is None else min(max_steps, pause_at)
+        tapes = [list(content) for content in contents]
+        positions = [head - start for head, start in zip(heads, starts)]
+        origins = [0] * self.num_tapes
+        lengths = [len(tape) for tape in tapes]
+        original_lengths = list(lengths)
+
+        row = self.get_rows().get(state, {})
+        indices = range(self.num_tapes)
+        halted = True
+        remaining = limit - step_count
+
+        while True:
+            entry = row.get(tuple(map(getitem, tapes, positions)))
+            if entry is None:
+                # No hay transición definida - la máquina se detiene
+                break
+
+            state, writes, deltas, row, stop = entry
+            for i in indices:
+                tape = tapes[i]
+                position = positions[i]
+                tape[position] = writes[i]
+                position += deltas[i]
+
+                # Extender la cinta duplicando su tamaño (O(1) amortizado)
+                if not 0 <= position < lengths[i]:
+                    length = lengths[i]
+                    if position < 0:
+                        tape[0:0] = [_FRESH] * length
+                        position += length
+                        origins[i] += length
+                    else:
+                        tape.extend([_FRESH] * length)
+                    lengths[i] = length + length
+                positions[i] = position
+
+            remaining -= 1
+            if stop:
+                break
+            if remaining <= 0:
+                # max_steps alcanzado (timeout) o pausa
+                halted = limit >= max_steps
+                break
+
+        step_count = limit - remaining
+
+        # Recortar a las celdas iniciales más las visitadas; las no visitadas son blancos
+        result_tapes, result_starts, result_heads = [], [], []
+        for i in indices:
+            tape, position, origin = tapes[i], positions[i], origins[i]
+            low = min(origin, position)
+            high = max(origin + original_lengths[i], position + 1)
+            while low > 0 and tape[low - 1] is not _FRESH:
+                low -= 1
+            while high < len(tape) and tape[high] is not _FRESH:
+                high += 1
+            blank = self.blank_symbol
+            result_tapes.append([blank if cell is _FRESH else cell for cell in tape[low:high]])
+            result_starts.append(starts[i] - origin + low)
+            result_heads.append(starts[i] - origin + position)
+
+        return self._result(result_tapes, result_starts, result_heads, state, step_count, max_steps, halted)
+
+    def execute_budgeted(self, budget, contents, starts, heads, state, step_count, max_steps, pause_at=None):
+        #Como execute(), en porciones que comprueban un RunBudget entre ellas (ver CompiledMachine)
+        config = [contents, starts, heads, state, step_count]
+
+        def run_slice(pause):
+            result = self.execute(*config, max_steps, pause)
+            config[:] = result['tapes'], result['tape_starts'], result['head_positions'], result['state'], result['step_count']
+            return result
+
+        return budget.run_sliced(
+            run_slice,
+            step_count,
+            max_steps if pause_at is None else min(max_steps, pause_at),
+            lambda result: sum(len(tape) for tape in result['tapes'])
+        )
+
+    def run_input(self, input_string, max_steps, macro=False, detect_loops=False, budget=None):
+        #Ejecuta desde el estado inicial con la entrada en la primera cinta
+        #
+        # macro y detect_loops se aceptan por compatibilidad con CompiledMachine
+        # y no tienen efecto con varias cintas.
+        contents, starts, heads = [], [], []
+        for i in range(self.num_tapes):
+            tape = TAPE_BACKENDS['dense'](list(input_string) if i == 0 and input_string else None, self.blank_symbol)
+            contents.append(tape.get_tape_content())
+            starts.append(tape.get_tape_start())
+            heads.append(tape.get_head_position())
+        if budget:
+            budget.reset()
+            with budget:
+                result = self.execute_budgeted(budget, contents, starts, heads, self.initial_state, 0, max_steps)
+        else:
+            result = self.execute(contents, starts, heads, self.initial_state, 0, max_steps)
+        result['tape'] = result['tapes'][0]
+        return result
+
+    def _result(self, tapes, starts, heads, state, step_count, max_steps, halted):
+        # Arma el resultado con el mismo veredicto que TuringMachine.run
+        if not halted:
+            verdict = 'running'
+        elif state in self.accept_states:
+            verdict = 'accepted'
+        elif state in self.reject_states:
+            verdict = 'rejected'
+        elif step_count >= max_steps:
+            verdict = 'timeout'
+        else:
+            verdict = 'halted'
+
+        return {
+            'verdict': verdict,
+            'tapes': tapes,
+            'tape_starts': starts,
+            'head_positions': heads,
+            'state': state,
+            'step_count': step_count,
+            'is_halted': halted,
+            'cycle_length': None
+        }
+
+    def __getstate__(self):
+        # Las filas se reconstruyen en el proceso destino
+        state = self.__dict__.copy()
+        state['_rows'] = None
+        return state
+
+    def __repr__(self):
+        return f"CompiledMultiTape(tapes={self.num_tapes}, transitions={len(self.transitions)})"
+
+
+class MultiTapeTuringMachine(TuringMachine):
+    # Máquina de Turing con k cintas independientes, cada una con su cabezal
+    #
+    # La entrada se carga en la primera cinta y las demás empiezan en blanco.
+    # Las transiciones leen una tupla con el símbolo bajo cada cabezal y
+    # escriben y mueven todos los cabezales a la vez. `tape` es la primera
+    # cinta (la que muestra la interfaz de una cinta y registra el historial).
+    # La detección de bucles y los macro-pasos son solo para una cinta.
+
+    supports_definition = False  # compile() retorna una CompiledMultiTape
+
+    def __init__(self, num_tapes, name="Máquina de Turing", description=""):
+        #Inicializa la máquina con num_tapes cintas
+        if num_tapes < 1:
+            raise ValueError("Una máquina necesita al menos una cinta")
+        super().__init__(name, description)
+        self.num_tapes = num_tapes
+        self.transition_function = MultiTapeTransitionFunction(num_tapes)
+        self.tapes = []
+        self._input_contents = []
+        self._configurations = {}  # paso -> (estado, [(celdas, inicio, cabezal) de cada cinta]); ver seek()
+        self._configuration_steps = []
+        self._shared_transitions = False  # True si la función de transición es de otra máquina
+        self._compiled_multitape = None
+        self._compiled_multitape_key = None
+
+    @property
+    def tape(self):
+        return self.tapes[0] if self.tapes else None
+
+    @tape.setter
+    def tape(self, value):
+        # TuringMachine.__init__ asigna tape = None antes de crear las cintas
+        if value is not None:
+            self.tapes[0] = value
+
+    def _editable_transitions(self):
+        # Retorna la función de transición propia (copia la compartida antes de modificarla)
+        if self._shared_transitions:
+            transition_function = MultiTapeTransitionFunction(self.num_tapes)
+            transition_function.transitions = dict(self.transition_function.transitions)
+            self.transition_function = transition_function
+            self._shared_transitions = False
+        return self.transition_function
+
+    def load_tape(self, initial_content, backend='dense'):
+        #Carga la entrada en la primera cinta y deja las demás en blanco
+        self.load_tapes([initial_content], backend)
+
+    def load_tapes(self, contents, backend='dense'):
+        #Carga el contenido de cada cinta (las que falten quedan en blanco)
+        if backend not in TAPE_BACKENDS:
+            raise ValueError(f"Tipo de cinta desconocido: {backend}. Use uno de: {', '.join(TAPE_BACKENDS)}")
+        if len(contents) > self.num_tapes:
+            raise ValueError(f"La máquina tiene {self.num_tapes} cintas y se dieron {len(contents)} contenidos")
+
+        contents = [list(content) if content else [] for content in contents]
+        contents += [[] for _ in range(self.num_tapes - len(contents))]
+        self._input_contents = contents
+        self._input_content = contents[0]
+        self._clear_configurations()
+        self.tapes = [TAPE_BACKENDS[backend](content or None, self.blank_symbol) for content in contents]
+
+    def read_symbols(self):
+        #Retorna la tupla de símbolos bajo los cabezales
+        return tuple(tape.read() for tape in self.tapes)
+
+    def step(self):
+        #Ejecuta un paso de la máquina
+        if self.is_halted:
+            return False
+
+        if not self.step_count % self.ADVANCE_CHECKPOINT_STEPS:
+            self._save_configuration()
+
+        symbols = self.read_symbols()
+        transition = self.transition_function.get_transition(self.current_state, symbols)
+
+        # El historial guarda la primera cinta; el símbolo leído muestra todas
+        self.history.record(
+            self.step_count,
+            self.current_state,
+            self.tapes[0],
+            transition.read_symbol if transition else _format_tuple(symbols),
+            transition.write_symbols[0] if transition else None
+        )
+
+        return self._apply_transition(transition)
+
+    def _apply_transition(self, transition):
+        # Aplica la transición en todas las cintas (o detiene la máquina si es None)
+        if self.profile is not None and transition is not None:
+            # El perfil cuenta las escrituras de la primera cinta
+            self.profile.record(transition.current_state, transition.read_symbol, self.tapes[0].get_head_position())
+
+        if transition is None:
+            return self._execution.halt()
+
+        for tape, symbol, direction in zip(self.tapes, transition.write_symbols, transition.move_directions):
+            tape.write(symbol)
+            if direction == 'L':
+                tape.move_left()
+            elif direction == 'R':
+                tape.move_right()
+
+        return self._execution.enter(transition.next_state)
+
+    def iter_steps(self, max_steps=None):
+        #Generador de StepEvent; head, read, written y move son tuplas (una entrada por cinta)
+        self.history.mark_discontinuity()
+        get_transition = self.transition_function.get_transition
+
+        with self._step_limit(max_steps):
+            while not self.is_halted:
+                step = self.step_count
+                state = self.current_state
+                heads = tuple(tape.get_head_position() for tape in self.tapes)
+                symbols = self.read_symbols()
+                transition = get_transition(state, symbols)
+                can_continue = self._apply_transition(transition)
+
+                if transition is None:
+                    break
+
+                yield StepEvent(
+                    step, state, heads, symbols,
+                    transition.write_symbols, transition.move_directions, transition.next_state
+                )
+
+                if not can_continue:
+                    break
+
+    def run(self, max_steps=None, accelerate=False, detect_loops=False, profile=False):
+        #Ejecuta la máquina hasta que se detenga
+        #
+        # Con accelerate=True se usa el bucle compilado (sin historial), salvo
+        # que se esté perfilando o haya puntos de interrupción: el bucle de k
+        # cintas no lleva contadores ni comprobaciones por paso.
+        # detect_loops no tiene efecto con varias cintas.
+        if profile:
+            self.enable_profiling()
+
+        if accelerate and self.profile is None and not self.breakpoints:
+            return self.run_compiled(max_steps)
+
+        with self._step_limit(max_steps), self.budget:
+            if self.breakpoints or self.budget:
+                return self._run_checked(False)
+
+            while not self.is_halted:
+                if not self.step():
+                    break
+
+            return self.get_verdict()
+
+    def compile(self):
+        #Retorna la tabla compilada de k cintas (se recompila si la máquina cambió)
+        key = self._definition_key()
+        if self._compiled_multitape is None or self._compiled_multitape_key != key:
+            self._compiled_multitape = CompiledMultiTape(
+                self.num_tapes,
+                self.transition_function.get_all_transitions(),
+                self.initial_state,
+                self.accept_states,
+                self.reject_states,
+                self.blank_symbol
+            )
+            self._compiled_multitape_key = key
+        return self._compiled_multitape
+
+    def run_compiled(self, max_steps=None, macro=False, detect_loops=False):
+        #Ejecuta sobre la tabla compilada (mismo resultado que run(), sin historial)
+        if self.profile is not None or self.breakpoints:
+            return self.run(max_steps)
+
+        with self._step_limit(max_steps), self.budget:
+            if not self.is_halted:
+                self._execute_compiled(None)
+            return self.get_verdict()
+
+    def advance(self, steps, detect_loops=False):
+        #Ejecuta hasta `steps` pasos más sin dar por terminada la ejecución; retorna los pasos ejecutados
+        self.breakpoints.hit = None
+        if self.is_halted or steps <= 0:
+            return 0
+
+        start = self.step_count
+        with self.budget:
+            if steps > self.HISTORY_STEP_LIMIT and self.profile is None and not self.breakpoints:
+                # En tramos que empiezan guardando la configuración (ver seek())
+                target = self.step_count + steps
+                while True:
+                    self._save_configuration()
+                    pause = min(target, self.step_count + max(self.ADVANCE_CHECKPOINT_STEPS, 16 * self._tape_cells()))
+                    self._execute_compiled(pause)
+                    if self.is_halted or self.step_count < pause or pause == target:
+                        break
+                return self.step_count - start
+
+            breakpoints = self.breakpoints if self.breakpoints else None
+            budget = self.budget if self.budget else None
+            for _ in range(steps):
+                old_head = self.tapes[0].get_head_position()
+                old_symbol = self.tapes[0].read()
+                if not self.step():
+                    break
+                if breakpoints and self._breakpoint_hit(old_head, old_symbol):
+                    break
+                if budget and not self.step_count % budget.check_interval and self._budget_exceeded(budget):
+                    break
+        return self.step_count - start
+
+    def _breakpoint_hit(self, old_head, old_symbol):
+        # Como en TuringMachine: (estado, símbolos leídos) y posiciones de la primera cinta
+        return self.breakpoints.check(
+            self.current_state,
+            _format_tuple(self.read_symbols()),
+            self.tapes[0].get_head_position(),
+            old_head,
+            old_symbol,
+            self.tapes[0].get_cell(old_head)
+        )
+
+    def _tape_cells(self):
+        # Celdas de todas las cintas (para el presupuesto)
+        return sum(len(tape) for tape in self.tapes)
+
+    def seek(self, step):
+        #Lleva la máquina al paso `step`; retorna el paso alcanzado
+        #
+        # El historial solo guarda la primera cinta, así que se parte de la
+        # configuración completa guardada más cercana anterior a `step` (step()
+        # y advance() guardan una cada ADVANCE_CHECKPOINT_STEPS pasos o menos)
+        # y se vuelve a ejecutar desde ahí con advance().
+        if step < 0:
+            raise ValueError("El paso debe ser mayor o igual a 0")
+
+        index = bisect_right(self._configuration_steps, step) - 1
+        saved = self._configuration_steps[index] if index >= 0 else None
+        if saved is not None and (step < self.step_count or saved > self.step_count):
+            self._restore_configuration(saved)
+        elif step < self.step_count:
+            self.reset(keep_tape_content=True)
+        self.advance(step - self.step_count)
+        return self.step_count
+
+    def _save_configuration(self):
+        # Guarda la configuración actual de todas las cintas para seek()
+        #
+        # La máquina es determinista: las configuraciones guardadas siguen
+        # valiendo después de volver atrás, hasta reset() o load_tapes().
+        step = self.step_count
+        if step in self._configurations:
+            return
+        self._configurations[step] = (
+            self.current_state,
+            [(tape.get_tape_content(), tape.get_tape_start(), tape.get_head_position()) for tape in self.tapes]
+        )
+        insort(self._configuration_steps, step)
+
+    def _restore_configuration(self, step):
+        # Carga una configuración guardada por _save_configuration como configuración actual
+        state, tapes = self._configurations[step]
+        for tape, (cells, start, head) in zip(self.tapes, tapes):
+            tape.set_content(list(cells), start, head)
+        self._execution.restart()
+        self.current_state = state
+        self.step_count = step
+        self.breakpoints.hit = None
+        self.history.mark_discontinuity()
+
+    def _clear_configurations(self):
+        # Descarta las configuraciones guardadas (cambió la entrada)
+        self._configurations.clear()
+        del self._configuration_steps[:]
+
+    def _execute_compiled(self, pause_at, macro=False, detect_loops=False):
+        # Ejecuta el bucle compilado (en porciones si hay presupuesto) y copia el resultado en las cintas
+        config = (
+            [tape.get_tape_content() for tape in self.tapes],
+            [tape.get_tape_start() for tape in self.tapes],
+            [tape.get_head_position() for tape in self.tapes],
+            self.current_state,
+            self.step_count,
+            self.max_steps
+        )
+        if self.budget:
+            result = self.compile().execute_budgeted(self.budget, *config, pause_at)
+        else:
+            result = self.compile().execute(*config, pause_at)
+
+        for tape, cells, start, head in zip(
+            self.tapes, result['tapes'], result['tape_starts'], result['head_positions']
+        ):
+            tape.set_content(cells, start, head)
+        self.current_state = result['state']
+        self.step_count = result['step_count']
+        self.is_halted = result['is_halted']
+        self.is_accepted = result['verdict'] == 'accepted'
+        self.is_rejected = result['verdict'] == 'rejected'
+        self.stop_reason = result['verdict'] if result['verdict'] in STOP_VERDICTS else None
+
+        # Los pasos ejecutados fuera de step() no quedan en el historial
+        self.history.mark_discontinuity()
+
+    def definition(self):
+        raise TypeError("MachineDefinition solo admite máquinas de una cinta")
+
+    def definition_hash(self):
+        #Retorna un hash SHA-256 del contenido de la definición (transiciones y estados)
+        lines = sorted(
+            '\x1f'.join((t.current_state, *t.read_symbols, *t.write_symbols, *t.move_directions, t.next_state))
+            for t in self.transition_function.get_all_transitions()
+        )
+        lines.append('\x1f'.join((
+            str(self.num_tapes),
+            str(self.initial_state),
+            ','.join(sorted(self.accept_states)),
+            ','.join(sorted(self.reject_states)),
+            self.blank_symbol
+        )))
+        return hashlib.sha256('\n'.join(lines).encode('utf-8')).hexdigest()
+
+    def new_run(self):
+        #Retorna una máquina nueva (sin cintas) que comparte la función de transición y la tabla compilada
+        tm = MultiTapeTuringMachine(self.num_tapes, self.name, self.description)
+        tm.transition_function = self.transition_function
+        tm._shared_transitions = True
+        tm.configure(self.initial_state, list(self.accept_states), self.reject_states, self.blank_symbol)
+        tm.max_steps = self.max_steps
+        tm.budget = self.budget.copy()
+        if self._compiled_multitape_key == tm._definition_key():
+            tm._compiled_multitape = self._compiled_multitape
+            tm._compiled_multitape_key = self._compiled_multitape_key
+        return tm
+
+    def reset(self, keep_tape_content=False):
+        #Reinicia la máquina a su estado inicial
+        if keep_tape_content and self.tapes and (self.history or self.step_count):
+            # Restaurar el contenido inicial de cada cinta (hasta el primer blanco)
+            for tape, content in zip(self.tapes, self._input_contents):
+                if self.blank_symbol in content:
+                    content = content[:content.index(self.blank_symbol)]
+                tape.reset(content)
+
+        self._execution.restart()
+        self.history.clear()
+        self._clear_configurations()
+        self.breakpoints.hit = None
+        self.budget.reset()
+        if self.profile is not None:
+            self.profile.clear()
+
+    def get_status(self):
+        #Retorna el estado actual de la máquina (con el contenido y cabezal de cada cinta)
+        status = super().get_status()
+        status['num_tapes'] = self.num_tapes
+        status['tapes'] = [tape.get_tape_content() for tape in self.tapes]
+        status['head_positions'] = [tape.get_head_position() for tape in self.tapes]
+        status['current_symbols'] = self.read_symbols() if self.tapes else None
+        return status
+
+    def __str__(self):
+        return (
+            f"MultiTapeTuringMachine(name='{self.name}', tapes={self.num_tapes}, "
+            f"state={self.current_state}, steps={self.step_count})"
+        )
+
+
+def _format_tuple(values):
+    # Texto de una tupla de símbolos o direcciones: (a, b)
+    return '(' + ', '.join(values) + ')'
@@ -0,0 +1,601 @@
+# Máquinas de Turing no deterministas: búsqueda en el árbol de configuraciones
+
+from collections import deque, namedtuple
+
+from .budget import BUDGET_VERDICTS
+from .transition import Transition
+from .turing_machine import TuringMachine, StepEvent
+from .loop_detection import MODULUS, BASE, BASE_INVERSE
+
+SEARCH_STRATEGIES = ('bfs', 'iddfs')
+
+# Resultado de NondeterministicTuringMachine.search()
+#   verdict: 'accepted', 'rejected' (se agotaron las configuraciones alcanzables
+#            sin aceptar), 'timeout' (quedaron ramas al llegar a max_steps),
+#            'frontier_limit' (la frontera superó max_frontier) o el veredicto
+#            de un RunBudget agotado ('time_limit', 'tape_limit')
+#   witness: transiciones del camino que acepta (vacío si no se aceptó)
+#   tape, tape_start, head_position, state: configuración final del testigo
+#   configurations: configuraciones distintas generadas
+#   peak_frontier: tamaño máximo de la frontera (cola o pila)
+SearchResult = namedtuple('SearchResult', [
+    'verdict', 'witness', 'tape', 'tape_start', 'head_position', 'state',
+    'steps', 'configurations', 'peak_frontier'
+])
+
+
+class NondeterministicTransitionFunction:
+    #Función de transición no determinista: {(estado, símbolo): [Transition, ...]}
+
+    def __init__(self):
+        #Inicializa la función de transición vacía
+        self.transitions = {}
+        # Se incrementa con cada modificación (invalida búsquedas previas)
+        self.revision = 0
+
+    def add_transition(self, current_state, read_symbol, write_symbol, move_direction, next_state):
+        #Agrega una alternativa para (estado, símbolo); las repetidas se ignoran
+        transition = Transition(current_state, read_symbol, write_symbol, move_direction, next_state)
+        choices = self.transitions.setdefault((current_state, read_symbol), [])
+        if not any(_same_transition(transition, choice) for choice in choices):
+            choices.append(transition)
+            self.revision += 1
+
+    def get_transitions(self, current_state, read_symbol):
+        #Retorna todas las alternativas para un estado y símbolo dados
+        return self.transitions.get((current_state, read_symbol), ())
+
+    def get_transition(self, current_state, read_symbol):
+        #Retorna la primera alternativa (o None); para recorrer todas use get_transitions
+        choices = self.transitions.get((current_state, read_symbol))
+        return choices[0] if choices else None
+
+    def has_transition(self, current_state, read_symbol):
+        #Verifica si existe al menos una transición para el estado y símbolo dados
+        return bool(self.transitions.get((current_state, read_symbol)))
+
+    def is_deterministic(self):
+        #Indica si ningún (estado, símbolo) tiene más de una alternativa
+        return all(len(choices) <= 1 for choices in self.transitions.values())
+
+    def get_all_transitions(self):
+        #Retorna todas las transiciones como lista
+        return [transition for choices in self.transitions.values() for transition in choices]
+
+    def get_states(self):
+        #Retorna el conjunto de todos los estados
+        states = set()
+        for transition in self.get_all_transitions():
+            states.add(transition.current_state)
+            states.add(transition.next_state)
+        return states
+
+    def get_symbols(self):
+        #Retorna el conjunto de todos los símbolos
+        symbols = set()
+        for transition in self.get_all_transitions():
+            symbols.add(transition.read_symbol)
+            symbols.add(transition.write_symbol)
+        return symbols
+
+    def to_table(self):
+        #Convierte las transiciones a una tabla legible
+        return [transition.to_dict() for transition in self.get_all_transitions()]
+
+    def load_from_dict(self, transitions_dict):
+        #Carga transiciones desde {estado: {símbolo: datos o [datos, ...]}}
+        self.transitions.clear()
+        self.revision += 1
+
+        for state, symbol_dict in transitions_dict.items():
+            for symbol, choices in symbol_dict.items():
+                if isinstance(choices, dict):
+                    choices = [choices]
+                for trans_data in choices:
+                    self.add_transition(state, symbol, trans_data['write'], trans_data['move'], trans_data['next_state'])
+
+    def __str__(self):
+        result = "Función de Transición (no determinista):\n"
+        for transition in self.get_all_transitions():
+            result += f"  {transition}\n"
+        return result
+
+    def __repr__(self):
+        return f"NondeterministicTransitionFunction(transitions={len(self.get_all_transitions())})"
+
+
+class _Configuration:
+    # Nodo del árbol de búsqueda
+    #
+    # La cinta es un par de listas enlazadas inmutables (símbolo, resto): `left`
+    # son las celdas a la izquierda del cabezal (la más cercana primero) y
+    # `right` la celda del cabezal y las siguientes; None es cinta en blanco.
+    # Escribir o mover crea un solo nodo nuevo y comparte el resto con el
+    # padre (copia en escritura), así que cada rama cuesta O(1) por paso.
+    # `full` es el hash polinomial de la cinta (como en LoopDetector), que se
+    # actualiza en O(1) y permite reconocer configuraciones repetidas.
+
+    __slots__ = (
+        'state', 'left', 'right', 'head', 'full', 'head_power', 'head_inverse',
+        'depth', 'parent', 'transition'
+    )
+
+    def __init__(self, state, left, right, head, full, head_power, head_inverse, depth, parent, transition):
+        self.state = state
+        self.left = left
+        self.right = right
+        self.head = head
+        self.full = full
+        self.head_power = head_power
+        self.head_inverse = head_inverse
+        self.depth = depth
+        self.parent = parent
+        self.transition = transition
+
+
+class NondeterministicTuringMachine(TuringMachine):
+    # Máquina de Turing no determinista
+    #
+    # Acepta si alguna rama del árbol de configuraciones llega a un estado de
+    # aceptación. search() recorre el árbol en anchura ('bfs', encuentra el
+    # testigo más corto) o con profundización iterativa ('iddfs', memoria
+    # proporcional a la profundidad), descartando configuraciones ya vistas.
+    # step() y run() siguen el testigo encontrado, de modo que el historial y
+    # la interfaz muestran el camino que acepta.
+
+    supports_compile = False
+    supports_definition = False
+
+    def __init__(self, name="Máquina de Turing", description=""):
+        #Inicializa la máquina con una función de transición no determinista
+        super().__init__(name, description)
+        self.transition_function = NondeterministicTransitionFunction()
+        self.search_strategy = 'bfs'
+        self.max_frontier = 100000  # Configuraciones en espera como máximo
+        self.search_result = None
+        self._plan = None  # Transiciones del testigo que faltan seguir
+        self._plan_start = 0  # Paso desde el que se buscó el testigo
+        self._shared_transitions = False  # True si la función de transición es de otra máquina
+
+    def new_run(self):
+        #Retorna una máquina nueva (sin cinta) que comparte la función de transición
+        tm = NondeterministicTuringMachine(self.name, self.description)
+        tm.transition_function = self.transition_function
+        tm._shared_transitions = True
+        tm.configure(self.initial_state, list(self.accept_states), self.reject_states, self.blank_symbol)
+        tm.max_steps = self.max_steps
+        tm.budget = self.budget.copy()
+        tm.search_strategy = self.search_strategy
+        tm.max_frontier = self.max_frontier
+        return tm
+
+    def _editable_transitions(self):
+        # Retorna la función de transición propia (copia la compartida antes de modificarla)
+        if self._shared_transitions:
+            transition_function = NondeterministicTransitionFunction()
+            transition_function.transitions = {
+                key: list(choices) for key, choices in self.transition_function.transitions.items()
+            }
+            self.transition_function = transition_function
+            self._shared_transitions = False
+        self._plan = None
+        return self.transition_function
+
+    def search(self, strategy=None, max_steps=None, max_frontier=None):
+        #Busca una rama que acepte desde la configuración actual; retorna un SearchResult
+        #
+        # max_steps limita la profundidad (pasos adicionales) y max_frontier la
+        # cantidad de configuraciones en espera; self.budget se comprueba cada
+        # budget.check_interval configuraciones expandidas (el tiempo cuenta
+        # para el de la ejecución). La máquina no se modifica.
+        strategy = strategy or self.search_strategy
+        if strategy not in SEARCH_STRATEGIES:
+            raise ValueError(f"Estrategia desconocida: {strategy}. Use una de: {', '.join(SEARCH_STRATEGIES)}")
+        max_depth = (max_steps or self.max_steps) - (0 if max_steps else self.step_count)
+        max_frontier = max_frontier or self.max_frontier
+
+        search = _Search(self)
+        with self.budget:
+            root = search.root(self.tape, self.current_state)
+            if strategy == 'bfs':
+                return search.breadth_first(root, max_depth, max_frontier)
+            return search.iterative_deepening(root, max_depth, max_frontier)
+
+    def _next_transition(self):
+        # Siguiente transición del testigo (busca uno la primera vez)
+        if self._plan is None:
+            self.search_result = self.search()
+            self._plan = deque(self.search_result.witness)
+            self._plan_start = self.step_count
+        return self._plan.popleft() if self._plan else None
+
+    def step(self):
+        #Ejecuta un paso siguiendo el testigo (la búsqueda se hace en el primer paso)
+        if self.is_halted:
+            return False
+
+        current_symbol = self.tape.read()
+        transition = self._next_transition()
+        self._save_to_history(current_symbol, transition)
+        return self._apply_transition(transition)
+
+    def _apply_transition(self, transition):
+        # Como en TuringMachine, pero sin testigo la rama se da por rechazada
+        can_continue = super()._apply_transition(transition)
+        if transition is None and self.search_result.verdict == 'rejected':
+            self.is_rejected = True
+        elif transition is None and self.search_result.verdict in BUDGET_VERDICTS:
+            # La búsqueda agotó el presupuesto
+            self.stop_reason = self.search_result.verdict
+        return can_continue
+
+    def iter_steps(self, max_steps=None):
+        #Generador de StepEvent a lo largo del testigo
+        self.history.mark_discontinuity()
+        tape = self.tape
+
+        with self._step_limit(max_steps):
+            while not self.is_halted:
+                step = self.step_count
+                state = self.current_state
+                head = tape.get_head_position()
+                symbol = tape.read()
+                transition = self._next_transition()
+                can_continue = self._apply_transition(transition)
+
+                if transition is None:
+                    break
+
+                yield StepEvent(
+                    step, state, head, symbol,
+                    transition.write_symbol, transition.move_direction, transition.next_state
+                )
+
+                if not can_continue:
+                    break
+
+    def run(self, max_steps=None, accelerate=False, detect_loops=False, profile=False):
+        #Busca un testigo y lo ejecuta paso a paso (queda en el historial)
+        #
+        # accelerate y detect_loops no aplican: la búsqueda ya descarta las
+        # configuraciones repetidas. Con profile=True se perfila el testigo.
+        # El presupuesto se comprueba durante la búsqueda y al seguir el testigo.
+        if profile:
+            self.enable_profiling()
+
+        with self._step_limit(max_steps), self.budget:
+            if self.breakpoints or self.budget:
+                return self._run_checked(False)
+
+            while not self.is_halted:
+                if not self.step():
+                    break
+
+            return self.get_verdict()
+
+    def run_compiled(self, max_steps=None, macro=False, detect_loops=False):
+        #Sin motor compilado: equivale a run()
+        return self.run(max_steps)
+
+    def advance(self, steps, detect_loops=False):
+        #Avanza hasta `steps` pasos por el testigo; retorna los pasos ejecutados
+        self.breakpoints.hit = None
+        breakpoints = self.breakpoints if self.breakpoints else None
+        budget = self.budget if self.budget else None
+        start = self.step_count
+        with self.budget:
+            for _ in range(max(0, steps)):
+                old_head = self.tape.get_head_position()
+                old_symbol = self.tape.read()
+                if not self.step():
+                    break
+                if breakpoints and self._breakpoint_hit(old_head, old_symbol):
+                    break
+                if budget and not self.step_count % budget.check_interval and self._budget_exceeded(budget):
+                    break
+        return self.step_count - start
+
+    def definition(self):
+        raise TypeError("MachineDefinition solo admite máquinas deterministas")
+
+    def compile(self):
+        raise TypeError("El motor compilado solo admite máquinas deterministas")
+
+    def definition_hash(self):
+        #Retorna un hash SHA-256 del contenido de la definición (todas las alternativas)
+        from .definition import definition_digest
+        return definition_digest(
+            self.transition_function.get_all_transitions(),
+            self.initial_state,
+            self.accept_states,
+            self.reject_states,
+            self.blank_symbol
+        )
+
+    def get_verdict(self):
+        #Retorna el veredicto (incluye los de la búsqueda: 'timeout' y 'frontier_limit')
+        if self.is_halted and not self.is_accepted and self.search_result is not None:
+            if self.search_result.verdict in ('timeout', 'frontier_limit'):
+                return self.search_result.verdict
+        return super().get_verdict()
+
+    def get_result_string(self):
+        #Retorna una descripción del resultado
+        verdict = self.get_verdict() if self.is_halted else None
+        if verdict == 'timeout':
+            return "TIMEOUT (ninguna rama aceptó dentro del límite de pasos)"
+        elif verdict == 'frontier_limit':
+            return "LÍMITE DE FRONTERA (demasiadas ramas abiertas)"
+        return super().get_result_string()
+
+    def _restore_snapshot(self, snapshot):
+        # Como en TuringMachine, retomando el testigo desde el paso restaurado
+        super()._restore_snapshot(snapshot)
+        offset = self.step_count - self._plan_start
+        if self._plan is not None and 0 <= offset <= len(self.search_result.witness):
+            self._plan = deque(self.search_result.witness[offset:])
+        else:
+            self._plan = None
+
+    def reset(self, keep_tape_content=False):
+        #Reinicia la máquina a su estado inicial (descarta el testigo)
+        super().reset(keep_tape_content)
+        self.search_result = None
+        self._plan = None
+
+    def __str__(self):
+        return f"NondeterministicTuringMachine(name='{self.name}', state={self.current_state}, steps={self.step_count})"
+
+
+class _Search:
+    # Estado compartido por las estrategias de búsqueda de una máquina
+
+    def __init__(self, tm):
+        self.transitions = tm.transition_function.transitions
+        self.accept_states = tm.accept_states
+        self.reject_states = tm.reject_states
+        self.blank = tm.blank_symbol
+        self.budget = tm.budget if tm.budget else None
+        self.symbol_codes = {tm.blank_symbol: 0}
+        self.state_codes = {}
+
+    def code(self, symbol):
+        # Código entero de un símbolo (el blanco es 0)
+        code = self.symbol_codes.get(symbol)
+        if code is None:
+            code = self.symbol_codes[symbol] = len(self.symbol_codes)
+        return code
+
+    def key(self, config):
+        # Identifica la configuración (estado y cinta relativa al cabezal) con un entero
+        state_code = self.state_codes.get(config.state)
+        if state_code is None:
+            state_code = self.state_codes[config.state] = len(self.state_codes)
+        return state_code * MODULUS + config.full * config.head_inverse % MODULUS
+
+    def root(self, tape, state):
+        # Configuración inicial a partir de una Tape
+        head = tape.get_head_position()
+        cells = tape.get_tape_content()
+        start = tape.get_tape_start()
+
+        full = 0
+        for offset, symbol in enumerate(cells):
+            code = self.code(symbol)
+            if code:
+                full += code * _power(start + offset)
+        head_offset = head - start
+
+        left = None
+        for symbol in cells[:head_offset]:
+            left = (symbol, left)
+        right = None
+        for symbol in reversed(cells[head_offset:]):
+            right = (symbol, right)
+
+        head_power = _power(head)
+        return _Configuration(
+            state, left, right, head, full % MODULUS, head_power, pow(head_power, -1, MODULUS), 0, None, None
+        )
+
+    def children(self, config):
+        # Genera las configuraciones sucesoras de una configuración
+        right = config.right
+        symbol = right[0] if right else self.blank
+        rest = right[1] if right else None
+        blank = self.blank
+
+        for transition in self.transitions.get((config.state, symbol), ()):
+            full = config.full
+            written = transition.write_symbol
+            if written != symbol:
+                full = (full + (self.code(written) - self.code(symbol)) * config.head_power) % MODULUS
+
+            direction = transition.move_direction
+            if direction == 'R':
+                left, right = (written, config.left), rest
+                head_power = config.head_power * BASE % MODULUS
+                head_inverse = config.head_inverse * BASE_INVERSE % MODULUS
+                head = config.head + 1
+            elif direction == 'L':
+                left = config.left
+                right = (left[0] if left else blank, (written, rest))
+                left = left[1] if left else None
+                head_power = config.head_power * BASE_INVERSE % MODULUS
+                head_inverse = config.head_inverse * BASE % MODULUS
+                head = config.head - 1
+            else:
+                left, right = config.left, (written, rest)
+                head_power, head_inverse, head = config.head_power, config.head_inverse, config.head
+
+            yield _Configuration(
+                transition.next_state, left, right, head, full, head_power, head_inverse,
+                config.depth + 1, config, transition
+            )
+
+    def over_budget(self, config):
+        # Comprueba el presupuesto con las celdas de la cinta de `config`; retorna su veredicto o None
+        cells = 0
+        for node in (config.left, config.right):
+            while node is not None:
+                cells += 1
+                node = node[1]
+        return self.budget.check(cells)
+
+    def is_dead_end(self, config):
+        # Indica si la configuración no tiene transiciones
+        symbol = config.right[0] if config.right else self.blank
+        return not self.transitions.get((config.state, symbol))
+
+    def breadth_first(self, root, max_depth, max_frontier):
+        # Búsqueda en anchura: el primer testigo encontrado es el más corto
+        frontier = deque([root])
+        visited = {self.key(root)}
+        peak = 1
+        truncated = False
+        accept_states, reject_states = self.accept_states, self.reject_states
+        budget = self.budget
+        expanded = 0
+
+        while frontier:
+            config = frontier.popleft()
+            expanded += 1
+            if budget and not expanded % budget.check_interval:
+                verdict = self.over_budget(config)
+                if verdict:
+                    return self.result(verdict, None, len(visited), peak)
+            if self.is_dead_end(config):
+                if config.state in accept_states:
+                    return self.result('accepted', config, len(visited), peak)
+                continue
+            if config.depth >= max_depth:
+                truncated = True
+                continue
+
+            for child in self.children(config):
+                if child.state in accept_states:
+                    return self.result('accepted', child, len(visited), peak)
+                if child.state in reject_states:
+                    continue
+                key = self.key(child)
+                if key in visited:
+                    continue
+                visited.add(key)
+                frontier.append(child)
+
+            if len(frontier) > peak:
+                peak = len(frontier)
+                if peak > max_frontier:
+                    return self.result('frontier_limit', None, len(visited), peak)
+
+        return self.result('timeout' if truncated else 'rejected', None, len(visited), peak)
+
+    def iterative_deepening(self, root, max_depth, max_frontier):
+        # Búsqueda en profundidad con límites crecientes (1, 2, 4, ... hasta max_depth)
+        #
+        # La pila solo guarda el camino actual y sus hermanos pendientes. Una
+        # configuración se descarta si ya se vio a igual o menor profundidad
+        # durante la misma iteración.
+        accept_states, reject_states = self.accept_states, self.reject_states
+        budget = self.budget
+        expanded = 0
+        limit = 1
+        peak = 1
+        total = 0
+
+        while True:
+            limit = min(limit, max_depth)
+            stack = [root]
+            visited = {self.key(root): 0}
+            truncated = False
+
+            while stack:
+                config = stack.pop()
+                expanded += 1
+                if budget and not expanded % budget.check_interval:
+                    verdict = self.over_budget(config)
+                    if verdict:
+                        return self.result(verdict, None, total + len(visited), peak)
+                if self.is_dead_end(config):
+                    if config.state in accept_states:
+                        return self.result('accepted', config, total + len(visited), peak)
+                    continue
+                if config.depth >= limit:
+                    truncated = True
+                    continue
+
+                # Apiladas al revés para explorar primero la primera alternativa
+                for child in reversed(list(self.children(config))):
+                    if child.state in accept_states:
+                        return self.result('accepted', child, total + len(visited), peak)
+                    if child.state in reject_states:
+                        continue
+                    key = self.key(child)
+                    seen = visited.get(key)
+                    if seen is not None and seen <= child.depth:
+                        continue
+                    visited[key] = child.depth
+                    stack.append(child)
+
+                if len(stack) > peak:
+                    peak = len(stack)
+                    if peak > max_frontier:
+                        return self.result('frontier_limit', None, total + len(visited), peak)
+
+            total += len(visited)
+            if not truncated:
+                return self.result('rejected', None, total, peak)
+            if limit >= max_depth:
+                return self.result('timeout', None, total, peak)
+            limit *= 2
+
+    def result(self, verdict, config, configurations, peak):
+        # Arma el SearchResult (con el testigo si hay una configuración final)
+        if config is None:
+            return SearchResult(verdict, [], None, None, None, None, 0, configurations, peak)
+
+        witness = []
+        node = config
+        while node.transition is not None:
+            witness.append(node.transition)
+            node = node.parent
+        witness.reverse()
+
+        # Materializar la cinta final (sin los blancos de los extremos)
+        left, right = [], []
+        node = config.left
+        while node is not None:
+            left.append(node[0])
+            node = node[1]
+        node = config.right
+        while node is not None:
+            right.append(node[0])
+            node = node[1]
+        cells = left[::-1] + right
+        low, high = 0, len(cells)
+        while low < high and cells[low] == self.blank:
+            low += 1
+        while high > low and cells[high - 1] == self.blank:
+            high -= 1
+        start = config.head - len(left) + low
+        cells = cells[low:high]
+
+        return SearchResult(
+            verdict, witness, cells, start, config.head, config.state, config.depth, configurations, peak
+        )
+
+
+def _same_transition(first, second):
+    # Compara dos transiciones por contenido
+    return (
+        first.write_symbol == second.write_symbol and
+        first.move_direction == second.move_direction and
+        first.next_state == second.next_state
+    )
+
+
+def _power(position):
+    # BASE^position (admite posiciones negativas)
+    if position >= 0:
+        return pow(BASE, position, MODULUS)
+    return pow(BASE_INVERSE, -position, MODULUS)
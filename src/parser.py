@@ -1,185 +1,319 @@
 # Parser para cargar Máquinas de Turing desde archivos de texto
 
-import re
+import io
+import mmap
+from .transition import TransitionFunction
 from .turing_machine import TuringMachine
+from .multitape import MultiTapeTransitionFunction, MultiTapeTuringMachine
+from .nondeterministic import NondeterministicTransitionFunction, NondeterministicTuringMachine
+
+VALID_DIRECTIONS = ('L', 'R', 'S')
+REQUIRED_SECTIONS = ('config', 'transitions')
+
+# Máximo de errores que se acumulan al validar (la memoria no crece con el archivo)
+MAX_ERRORS = 100
+
 
 class TuringMachineParser:
+    # Parser de una sola pasada
+    #
+    # Lee el archivo línea por línea (texto, archivo abierto o mmap), agrega
+    # cada transición directamente a la función de transición y valida en la
+    # misma pasada, indicando el número de línea de cada error. La memoria
+    # usada es la de la máquina resultante; el archivo nunca se carga entero.
+
     def __init__(self):
         self.sections = {
             'metadata': {},
             'config': {},
             'alphabet': {},
-            'transitions': [],
             'input': ''
         }
+        self.transition_function = TransitionFunction()
+        self.transition_count = 0
+        self.num_tapes = 1
+        self.nondeterministic = False
+        self._names = {}
         self.current_section = None
-    
+        self.seen_sections = set()
+        self.line_number = 0
+        self.errors = []
+        self.collect_errors = False
+
     def parse_file(self, file_content):
+        #Parsea el contenido completo de un archivo (str)
+        return self.parse_stream(io.StringIO(file_content))
+
+    def parse_stream(self, lines):
+        #Parsea un iterable de líneas (archivo abierto, str o bytes por línea)
         try:
-            lines = file_content.split('\n')
             self._parse_lines(lines)
             return self._create_machine()
-        except Exception as e:
+        except ValueError as e:
             raise ValueError(f"Error al parsear el archivo: {str(e)}")
-    
+
+    def parse_path(self, path):
+        #Parsea un archivo del disco mapeándolo en memoria
+        with open(path, 'rb') as machine_file:
+            if not _file_size(machine_file):
+                return self.parse_stream([])
+            with mmap.mmap(machine_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return self.parse_stream(iter(mapped.readline, b''))
+
+    def validate_file(self, file_content):
+        #Valida que el archivo tenga el formato correcto
+        return self.validate_stream(io.StringIO(file_content))
+
+    def validate_stream(self, lines):
+        #Valida un iterable de líneas en una sola pasada; retorna (es_válido, errores)
+        #
+        # Los errores incluyen el número de línea. Se informan a lo sumo
+        # MAX_ERRORS errores de línea, además de los errores globales.
+        self.collect_errors = True
+        self._parse_lines(lines)
+
+        errors = [f"Línea {number}: {message}" for number, message in self.errors]
+        if len(self.errors) >= MAX_ERRORS:
+            errors.append(f"Se muestran solo los primeros {MAX_ERRORS} errores de línea")
+
+        for section in REQUIRED_SECTIONS:
+            if section not in self.seen_sections:
+                errors.append(f"Falta la sección requerida: [{section.upper()}]")
+
+        if 'config' in self.seen_sections and 'initial_state' not in self.sections['config']:
+            errors.append("Falta especificar 'initial_state' en [CONFIG]")
+        if 'transitions' in self.seen_sections and not self.transition_count:
+            errors.append("No se definieron transiciones en [TRANSITIONS]")
+
+        return len(errors) == 0, errors
+
     def _parse_lines(self, lines):
         # Procesa las líneas del archivo
         for line in lines:
+            self.line_number += 1
+            if isinstance(line, bytes):
+                line = line.decode('utf-8')
             line = line.strip()
-            
+
             # Ignorar líneas vacías y comentarios
             if not line or line.startswith('#'):
                 continue
-            
+
             # Detectar secciones
             if line.startswith('[') and line.endswith(']'):
                 section_name = line[1:-1].lower()
                 self.current_section = section_name
+                self.seen_sections.add(section_name)
                 continue
-            
-            # Procesar contenido según la sección
-            self._process_line(line)
-    
+
+            # Procesar contenido según la sección actual
+            try:
+                self._process_line(line)
+            except ValueError as e:
+                self._error(str(e))
+
+    def _error(self, message):
+        # Registra un error de la línea actual (o lo lanza si no se está validando)
+        if not self.collect_errors:
+            raise ValueError(f"Línea {self.line_number}: {message}")
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append((self.line_number, message))
+
     def _process_line(self, line):
         # Procesa una línea según la sección actual
-        if self.current_section == 'metadata':
+        if self.current_section == 'transitions':
+            self._parse_transition(line)
+        elif self.current_section == 'metadata':
             self._parse_metadata(line)
         elif self.current_section == 'config':
             self._parse_config(line)
         elif self.current_section == 'alphabet':
             self._parse_alphabet(line)
-        elif self.current_section == 'transitions':
-            self._parse_transition(line)
         elif self.current_section == 'input':
             self._parse_input(line)
-    
+
     def _parse_metadata(self, line):
         # Parsea metadata: name, description
         if ':' in line:
             key, value = line.split(':', 1)
             self.sections['metadata'][key.strip()] = value.strip()
-    
+
     def _parse_config(self, line):
         # Parsea configuración: estados iniciales, finales, etc.
-        if ':' in line:
-            key, value = line.split(':', 1)
-            key = key.strip()
-            value = value.strip()
-            
-            if key in ['accept_states', 'reject_states']:
-                # Convertir a lista
-                self.sections['config'][key] = [s.strip() for s in value.split(',')]
-            else:
-                self.sections['config'][key] = value
-    
+        if ':' not in line:
+            raise ValueError(f"Se esperaba 'clave: valor' en [CONFIG]: '{line}'")
+
+        key, value = line.split(':', 1)
+        key = key.strip()
+        value = value.strip()
+
+        if key in ['accept_states', 'reject_states']:
+            # Convertir a lista
+            self.sections['config'][key] = [s.strip() for s in value.split(',')]
+        elif key == 'tapes':
+            self._set_num_tapes(value)
+        elif key == 'nondeterministic':
+            self._set_nondeterministic(value)
+        else:
+            self.sections['config'][key] = value
+
+    def _set_num_tapes(self, value):
+        # Configura la cantidad de cintas (debe indicarse antes de las transiciones)
+        if not value.isdigit() or int(value) < 1:
+            raise ValueError(f"'tapes' debe ser un entero positivo: '{value}'")
+        if self.transition_count:
+            raise ValueError("'tapes' debe indicarse en [CONFIG] antes de [TRANSITIONS]")
+
+        if int(value) > 1 and self.nondeterministic:
+            raise ValueError("Las máquinas no deterministas solo admiten una cinta")
+
+        self.num_tapes = int(value)
+        self.sections['config']['tapes'] = self.num_tapes
+        if self.num_tapes > 1:
+            self.transition_function = MultiTapeTransitionFunction(self.num_tapes)
+        else:
+            self.transition_function = TransitionFunction()
+
+    def _set_nondeterministic(self, value):
+        # Permite varias transiciones por (estado, símbolo) (debe indicarse antes de las transiciones)
+        if value.lower() not in ('true', 'false'):
+            raise ValueError(f"'nondeterministic' debe ser 'true' o 'false': '{value}'")
+        if self.transition_count:
+            raise ValueError("'nondeterministic' debe indicarse en [CONFIG] antes de [TRANSITIONS]")
+        if value.lower() == 'true' and self.num_tapes > 1:
+            raise ValueError("Las máquinas no deterministas solo admiten una cinta")
+
+        self.nondeterministic = value.lower() == 'true'
+        self.sections['config']['nondeterministic'] = self.nondeterministic
+        if self.nondeterministic:
+            self.transition_function = NondeterministicTransitionFunction()
+        else:
+            self.transition_function = TransitionFunction()
+
     def _parse_alphabet(self, line):
         """Parsea alfabetos de entrada y cinta"""
         if ':' in line:
             key, value = line.split(':', 1)
             symbols = [s.strip() for s in value.split(',')]
             self.sections['alphabet'][key.strip()] = symbols
-    
+
     def _parse_transition(self, line):
-        # Parsea una transición
-        try:
-            # Dividir por '->'
-            if '->' not in line:
-                return
-            
-            left, right = line.split('->')
-            
-            # Parte izquierda: current_state, read_symbol
-            left_parts = [p.strip() for p in left.split(',')]
-            if len(left_parts) != 2:
-                return
-            
-            current_state, read_symbol = left_parts
-            
-            # Parte derecha: write_symbol, move_direction, next_state
-            right_parts = [p.strip() for p in right.split(',')]
-            if len(right_parts) != 3:
-                return
-            
-            write_symbol, move_direction, next_state = right_parts
-            
-            # Validar dirección
-            if move_direction.upper() not in ['L', 'R', 'S']:
-                raise ValueError(f"Dirección inválida: {move_direction}. Use 'L' (Left), 'R' (Right) o 'S' (Stay)")
-            
-            self.sections['transitions'].append({
-                'current_state': current_state,
-                'read_symbol': read_symbol,
-                'write_symbol': write_symbol,
-                'move_direction': move_direction.upper(),
-                'next_state': next_state
-            })
-        except Exception as e:
-            raise ValueError(f"Error al parsear transición '{line}': {str(e)}")
-    
+        # Parsea una transición y la agrega directamente a la función de transición
+        #
+        # Con k cintas el formato es 'estado, s1, ..., sk -> e1, ..., ek, d1, ..., dk, siguiente'
+        # (con una cinta es el formato habitual).
+        parts = line.split('->')
+        if len(parts) != 2:
+            raise ValueError(f"Se esperaba 'estado, símbolo -> escribe, dirección, siguiente': '{line}'")
+
+        left, right = parts
+        k = self.num_tapes
+
+        # Parte izquierda: current_state, read_symbol (uno por cinta)
+        left_parts = left.split(',')
+        if len(left_parts) != k + 1:
+            raise ValueError(
+                f"Se esperaban {k + 1} valores antes de '->' ({_left_fields(k)}) y hay {len(left_parts)}: '{line}'"
+            )
+
+        # Parte derecha: write_symbol, move_direction (uno por cinta), next_state
+        right_parts = right.split(',')
+        if len(right_parts) != 2 * k + 1:
+            raise ValueError(
+                f"Se esperaban {2 * k + 1} valores después de '->' ({_right_fields(k)}) y hay {len(right_parts)}: '{line}'"
+            )
+
+        move_directions = []
+        for direction in right_parts[k:2 * k]:
+            move_direction = direction.strip().upper()
+            if move_direction not in VALID_DIRECTIONS:
+                raise ValueError(
+                    f"Dirección inválida: {direction.strip()}. Use 'L' (Left), 'R' (Right) o 'S' (Stay): '{line}'"
+                )
+            move_directions.append(move_direction)
+
+        # Los nombres repetidos se comparten (un solo str por estado o símbolo)
+        names = self._names
+        current_state = names.setdefault(left_parts[0].strip(), left_parts[0].strip())
+        read_symbols = [names.setdefault(part.strip(), part.strip()) for part in left_parts[1:]]
+        write_symbols = [names.setdefault(part.strip(), part.strip()) for part in right_parts[:k]]
+        next_state = names.setdefault(right_parts[2 * k].strip(), right_parts[2 * k].strip())
+
+        if k == 1:
+            self.transition_function.add_transition(
+                current_state, read_symbols[0], write_symbols[0], move_directions[0], next_state
+            )
+        else:
+            self.transition_function.add_transition(
+                current_state, read_symbols, write_symbols, move_directions, next_state
+            )
+        self.transition_count += 1
+
     def _parse_input(self, line):
         # Parsea la cadena de entrada
         self.sections['input'] += line
-    
+
     def _create_machine(self):
         # Crea la Máquina de Turing a partir de los datos parseados
         if 'initial_state' not in self.sections['config']:
             raise ValueError("Falta especificar initial_state en [CONFIG]")
-        
-        if not self.sections['transitions']:
+
+        if not self.transition_count:
             raise ValueError("No se definieron transiciones en [TRANSITIONS]")
-        
+
         # Crear máquina
         name = self.sections['metadata'].get('name', 'Máquina Personalizada')
         description = self.sections['metadata'].get('description', '')
-        
-        tm = TuringMachine(name=name, description=description)
-        
+
+        if self.num_tapes > 1:
+            tm = MultiTapeTuringMachine(self.num_tapes, name=name, description=description)
+        elif self.nondeterministic:
+            tm = NondeterministicTuringMachine(name=name, description=description)
+        else:
+            tm = TuringMachine(name=name, description=description)
+
         # Configurar estados
         initial_state = self.sections['config']['initial_state']
         accept_states = self.sections['config'].get('accept_states', [])
         reject_states = self.sections['config'].get('reject_states', [])
         blank_symbol = self.sections['config'].get('blank_symbol', '_')
-        
+
         tm.configure(
             initial_state=initial_state,
             accept_states=accept_states,
             reject_states=reject_states,
             blank_symbol=blank_symbol
         )
-        
-        # Agregar transiciones
-        for trans in self.sections['transitions']:
-            tm.add_transition(
-                current_state=trans['current_state'],
-                read_symbol=trans['read_symbol'],
-                write_symbol=trans['write_symbol'],
-                move_direction=trans['move_direction'],
-                next_state=trans['next_state']
-            )
-        
+
+        # Las transiciones ya se construyeron durante la lectura
+        tm.transition_function = self.transition_function
+
         # Obtener input
         input_string = self.sections['input'].strip()
-        
+
         return tm, input_string
-    
-    def validate_file(self, file_content):
-        
-        #Valida que el archivo tenga el formato correcto
 
-        errors = []
-        
-        # Verificar secciones requeridas
-        required_sections = ['[CONFIG]', '[TRANSITIONS]']
-        for section in required_sections:
-            if section not in file_content:
-                errors.append(f"Falta la sección requerida: {section}")
-        
-        # Verificar campos en CONFIG
-        if '[CONFIG]' in file_content:
-            if 'initial_state:' not in file_content:
-                errors.append("Falta especificar 'initial_state' en [CONFIG]")
-        
-        return len(errors) == 0, errors
+
+def _left_fields(num_tapes):
+    # Descripción de los campos antes de '->' para los mensajes de error
+    if num_tapes == 1:
+        return 'estado, símbolo'
+    return f'estado y {num_tapes} símbolos'
+
+
+def _right_fields(num_tapes):
+    # Descripción de los campos después de '->' para los mensajes de error
+    if num_tapes == 1:
+        return 'escribe, dirección, siguiente'
+    return f'{num_tapes} símbolos, {num_tapes} direcciones y siguiente'
+
+
+def _file_size(machine_file):
+    # Tamaño en bytes de un archivo abierto (mmap no admite archivos vacíos)
+    machine_file.seek(0, io.SEEK_END)
+    size = machine_file.tell()
+    machine_file.seek(0)
+    return size
 
 
 def parse_turing_machine_file(file_content):
@@ -187,6 +321,18 @@ def parse_turing_machine_file(file_content):
     return parser.parse_file(file_content)
 
 
+def parse_turing_machine_stream(lines):
+    #Parsea una máquina desde un archivo abierto o cualquier iterable de líneas
+    parser = TuringMachineParser()
+    return parser.parse_stream(lines)
+
+
+def load_turing_machine(path):
+    #Parsea una máquina desde un archivo del disco (mmap, sin leerlo entero)
+    parser = TuringMachineParser()
+    return parser.parse_path(path)
+
+
 def validate_turing_machine_file(file_content):
     parser = TuringMachineParser()
-    return parser.validate_file(file_content)
\ No newline at end of file
+    return parser.validate_file(file_content)
@@ -0,0 +1,106 @@
+# Perfil de ejecución: dónde gasta sus pasos una Máquina de Turing
+
+import json
+from collections import Counter
+
+
+class ExecutionProfile:
+    # Contadores de una o más ejecuciones
+    #
+    # - transition_counts: disparos de cada transición, por (estado, símbolo leído)
+    # - cell_writes: escrituras en cada posición absoluta de la cinta
+    # Las visitas por estado se derivan de los disparos (un paso en el estado q
+    # es un disparo de alguna transición de q). Con el motor compilado los
+    # contadores viven en arreglos paralelos a la tabla δ y a la cinta, y se
+    # vuelcan aquí al terminar (ver CompiledMachine.execute).
+
+    def __init__(self):
+        #Inicializa el perfil vacío
+        self.transition_counts = Counter()
+        self.cell_writes = Counter()
+
+    def record(self, state, symbol, position):
+        #Registra un disparo de (estado, símbolo) que escribe en `position`
+        self.transition_counts[(state, symbol)] += 1
+        self.cell_writes[position] += 1
+
+    def add_compiled_counts(self, compiled, counts, writes, first_position):
+        #Suma los contadores del motor compilado
+        #
+        # counts[s * num_states + q] son los disparos de la entrada (q, s) de la
+        # tabla (la columna de celdas no visitadas cuenta como blanco) y
+        # writes[i] las escrituras en la posición absoluta first_position + i.
+        num_states = compiled.num_states
+        symbols = compiled.symbols
+        for index, count in enumerate(counts):
+            if count:
+                symbol_code, state_code = divmod(index, num_states)
+                symbol = symbols[symbol_code] if symbol_code < len(symbols) else symbols[0]
+                self.transition_counts[(compiled.states[state_code], symbol)] += count
+        for offset, count in enumerate(writes):
+            if count:
+                self.cell_writes[first_position + offset] += count
+
+    @property
+    def steps(self):
+        #Cantidad total de pasos registrados
+        return sum(self.transition_counts.values())
+
+    def state_visits(self):
+        #Retorna {estado: pasos ejecutados desde ese estado}
+        visits = Counter()
+        for (state, _), count in self.transition_counts.items():
+            visits[state] += count
+        return visits
+
+    def edge_counts(self, transition_function):
+        #Agrupa los disparos por arista del grafo de estados: {(origen, destino): disparos}
+        edges = Counter()
+        for transition in transition_function.get_all_transitions():
+            count = self.transition_counts.get((transition.current_state, transition.read_symbol))
+            if count:
+                edges[(transition.current_state, transition.next_state)] += count
+        return edges
+
+    def hottest(self, limit=10):
+        #Retorna las `limit` transiciones más disparadas: [((estado, símbolo), disparos), ...]
+        return self.transition_counts.most_common(limit)
+
+    def share(self, state, symbol):
+        #Fracción de los pasos en que se disparó (estado, símbolo)
+        steps = self.steps
+        return self.transition_counts.get((state, symbol), 0) / steps if steps else 0.0
+
+    def clear(self):
+        #Pone todos los contadores en cero
+        self.transition_counts.clear()
+        self.cell_writes.clear()
+
+    def to_dict(self):
+        #Convierte el perfil a un diccionario serializable en JSON
+        return {
+            'steps': self.steps,
+            'transitions': [
+                {'state': state, 'symbol': symbol, 'count': count}
+                for (state, symbol), count in self.transition_counts.most_common()
+            ],
+            'states': [
+                {'state': state, 'visits': visits}
+                for state, visits in self.state_visits().most_common()
+            ],
+            'cell_writes': [
+                {'position': position, 'writes': writes}
+                for position, writes in sorted(self.cell_writes.items())
+            ]
+        }
+
+    def to_json(self, path=None):
+        #Retorna el perfil como JSON (y lo guarda en `path` si se indica)
+        text = json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
+        if path:
+            with open(path, 'w', encoding='utf-8') as profile_file:
+                profile_file.write(text)
+        return text
+
+    def __repr__(self):
+        return f"ExecutionProfile(steps={self.steps}, transitions={len(self.transition_counts)})"
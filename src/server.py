@@ -0,0 +1,369 @@
+# Servicio HTTP/JSON local de simulación: python -m src.server
+#
+# Solo usa la biblioteca estándar: asyncio atiende las conexiones (HTTP/1.1
+# con keep-alive) y las ejecuciones se reparten en un ProcessPoolExecutor.
+#
+#   POST /machines                  registra una máquina (texto .txt, o JSON {"source": ...})
+#   GET  /machines/<handle>         información de una máquina registrada
+#   POST /machines/<handle>/run     ejecuta entradas: {"inputs": [...], "max_steps", "time_limit", "max_tape_cells", "detect_loops"}
+#   POST /machines/<handle>/trace   traza paso a paso en streaming (JSON por línea, chunked)
+#   GET  /health                    estado del servicio
+#
+# El handle es el SHA-256 del texto fuente, así que registrar dos veces la
+# misma definición retorna el mismo handle y cada proceso la parsea una vez.
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .budget import RunBudget
+from .cache import DefinitionCache, parse_cached, source_hash
+from .cli import make_runner
+
+# Límites por solicitud (los valores pedidos se recortan a estos máximos)
+DEFAULT_MAX_STEPS = 10000
+MAX_STEPS_LIMIT = 50_000_000
+DEFAULT_TIME_LIMIT = 5.0
+TIME_LIMIT_LIMIT = 60.0
+MAX_INPUTS = 10000
+MAX_BODY_BYTES = 1 << 20
+
+# Margen del servidor sobre el límite de tiempo antes de responder 504
+TIME_LIMIT_GRACE = 1.0
+
+# Eventos por bloque de la traza
+TRACE_BATCH = 1000
+
+REASONS = {
+    200: 'OK', 201: 'Created', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+    413: 'Payload Too Large', 500: 'Internal Server Error', 504: 'Gateway Timeout'
+}
+
+
+class HTTPError(Exception):
+    # Error que se responde al cliente con un código de estado y un JSON {"error": ...}
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def run_inputs(source, inputs, max_steps, time_limit, detect_loops=False, max_tape_cells=None):
+    #Ejecuta una máquina (texto fuente) sobre varias entradas; se llama en un proceso trabajador
+    #
+    # Cada entrada tiene su propio RunBudget de tiempo y celdas de cinta
+    # ('time_limit', 'tape_limit'), que en las máquinas no deterministas
+    # también comprueba la búsqueda.
+    tm, _ = parse_cached(source)
+    run = make_runner(tm, max_steps, detect_loops, RunBudget(time_limit, max_tape_cells))
+
+    results = []
+    for index, input_string in enumerate(inputs):
+        start = time.perf_counter()
+        verdict, steps, tape = run(input_string)
+        results.append({
+            'index': index,
+            'input': input_string,
+            'verdict': verdict,
+            'steps': steps,
+            'tape': tape,
+            'seconds': round(time.perf_counter() - start, 6)
+        })
+    return results
+
+
+class SimulationServer:
+    # Servidor HTTP/JSON de simulación sobre asyncio
+
+    def __init__(self, host='127.0.0.1', port=8765, workers=None, max_machines=256):
+        #Inicializa el servidor (no abre el puerto hasta start())
+        self.host = host
+        self.port = port
+        self.workers = workers or os.cpu_count() or 1
+        self.machines = DefinitionCache(max_machines)  # handle -> (texto fuente, información)
+        self.pool = None
+        self._server = None
+
+    async def start(self):
+        #Abre el puerto y crea el pool de procesos; retorna el puerto real (útil con port=0)
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self.port
+
+    async def serve_forever(self):
+        #Atiende solicitudes hasta que se cancele
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    def close(self):
+        #Cierra el puerto y el pool de procesos
+        if self._server is not None:
+            self._server.close()
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+
+    async def _handle_connection(self, reader, writer):
+        # Atiende las solicitudes de una conexión (keep-alive) hasta que el cliente la cierre
+        try:
+            while True:
+                request = await _read_request(reader)
+                if request is None:
+                    break
+                method, path, headers, body, keep_alive = request
+                try:
+                    await self._dispatch(method, path, headers, body, writer)
+                except HTTPError as e:
+                    await _send_json(writer, e.status, {'error': str(e)})
+                except Exception as e:
+                    await _send_json(writer, 500, {'error': f'{type(e).__name__}: {e}'})
+                if not keep_alive:
+                    break
+        except HTTPError as e:
+            # Solicitud mal formada o demasiado grande: se responde y se cierra la conexión
+            await _send_json(writer, e.status, {'error': str(e)}, keep_alive=False)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method, path, headers, body, writer):
+        # Envía la solicitud a su manejador según el método y la ruta
+        parts = [part for part in path.split('?', 1)[0].split('/') if part]
+        if parts == ['health'] and method == 'GET':
+            return await _send_json(writer, 200, {
+                'status': 'ok', 'machines': len(self.machines), 'workers': self.workers
+            })
+        if parts == ['machines'] and method == 'POST':
+            return await self._register(headers, body, writer)
+        if len(parts) >= 2 and parts[0] == 'machines':
+            source, info = self._lookup(parts[1])
+            if len(parts) == 2 and method == 'GET':
+                return await _send_json(writer, 200, info)
+            if len(parts) == 3 and parts[2] == 'run' and method == 'POST':
+                return await self._run(source, info, _json_body(body), writer)
+            if len(parts) == 3 and parts[2] == 'trace' and method == 'POST':
+                return await self._trace(source, _json_body(body), writer)
+            raise HTTPError(405 if len(parts) <= 3 else 404, f"Ruta o método no soportado: {method} {path}")
+        raise HTTPError(404, f"Ruta desconocida: {path}")
+
+    async def _register(self, headers, body, writer):
+        # POST /machines: parsea la definición (una vez por texto) y retorna su handle
+        if 'json' in headers.get('content-type', ''):
+            source = _json_body(body).get('source')
+            if not isinstance(source, str):
+                raise HTTPError(400, "Falta el campo 'source' con el texto de la máquina")
+        else:
+            source = body.decode('utf-8')
+
+        handle = source_hash(source)
+        known = self.machines.get(handle)
+        if known is not None:
+            return await _send_json(writer, 200, known[1])
+
+        loop = asyncio.get_running_loop()
+        try:
+            tm, input_string = await loop.run_in_executor(None, parse_cached, source)
+        except ValueError as e:
+            raise HTTPError(400, str(e))
+
+        info = {
+            'handle': handle,
+            'name': tm.name,
+            'states': len(tm.transition_function.get_states()),
+            'transitions': len(tm.transition_function.get_all_transitions()),
+            'input': input_string
+        }
+        self.machines.put(handle, (source, info))
+        await _send_json(writer, 201, info)
+
+    def _lookup(self, handle):
+        # Retorna (texto fuente, información) de un handle registrado
+        machine = self.machines.get(handle)
+        if machine is None:
+            raise HTTPError(404, f"Handle desconocido: {handle} (registre la máquina con POST /machines)")
+        return machine
+
+    async def _run(self, source, info, request, writer):
+        # POST /machines/<handle>/run: ejecuta las entradas en el pool de procesos
+        inputs = request.get('inputs')
+        if inputs is None:
+            inputs = [request.get('input', info['input'] or '')]
+        if not isinstance(inputs, list) or not all(isinstance(value, str) for value in inputs):
+            raise HTTPError(400, "'inputs' debe ser una lista de cadenas")
+        if len(inputs) > MAX_INPUTS:
+            raise HTTPError(413, f"Demasiadas entradas: {len(inputs)} (máximo {MAX_INPUTS})")
+        max_steps, time_limit = _limits(request)
+        max_tape_cells = request.get('max_tape_cells')
+        if max_tape_cells is not None and (not isinstance(max_tape_cells, int) or max_tape_cells <= 0):
+            raise HTTPError(400, "'max_tape_cells' debe ser un entero positivo")
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(
+            self.pool, run_inputs, source, inputs, max_steps, time_limit, bool(request.get('detect_loops')),
+            max_tape_cells
+        )
+        try:
+            # Cada entrada tiene su límite; el servidor espera a lo sumo el total más un margen
+            results = await asyncio.wait_for(future, time_limit * len(inputs) + TIME_LIMIT_GRACE)
+        except asyncio.TimeoutError:
+            raise HTTPError(504, f"La ejecución superó el límite de {time_limit} s por entrada")
+        await _send_json(writer, 200, {'handle': info['handle'], 'results': results})
+
+    async def _trace(self, source, request, writer):
+        # POST /machines/<handle>/trace: cada paso como una línea JSON, en bloques chunked
+        #
+        # Los bloques de hasta TRACE_BATCH pasos se generan en un hilo del
+        # executor (la búsqueda de una máquina no determinista no bloquea las
+        # demás conexiones); esperar a que el cliente los consuma (drain)
+        # mantiene acotada la memoria. Los encabezados ya se enviaron, así que
+        # un error a mitad de la traza termina con un registro {"error": ...}.
+        max_steps, time_limit = _limits(request)
+        loop = asyncio.get_running_loop()
+        tm, default_input = await loop.run_in_executor(None, parse_cached, source)
+        tm.load_tape(request.get('input', default_input or ''))
+        tm.budget = RunBudget(time_limit)  # Acota también la búsqueda no determinista
+
+        writer.write(
+            b'HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\n'
+            b'Transfer-Encoding: chunked\r\nConnection: keep-alive\r\n\r\n'
+        )
+        deadline = time.perf_counter() + time_limit
+        events = tm.iter_steps(max_steps)
+        summary = None
+        try:
+            while summary is None:
+                lines, summary = await loop.run_in_executor(None, _trace_batch, tm, events, deadline)
+                if lines:
+                    await _send_chunk(writer, '\n'.join(lines) + '\n')
+        except ConnectionError:
+            raise
+        except Exception as e:
+            summary = {'error': f'{type(e).__name__}: {e}', 'steps': tm.step_count}
+        await _send_chunk(writer, json.dumps(summary, ensure_ascii=False) + '\n')
+        writer.write(b'0\r\n\r\n')
+        await writer.drain()
+
+
+def _trace_batch(tm, events, deadline):
+    # Genera el siguiente bloque de la traza; retorna (líneas, resumen final o None si sigue)
+    lines = []
+    for event in events:
+        lines.append(json.dumps(event._asdict(), ensure_ascii=False))
+        if time.perf_counter() >= deadline:
+            return lines, {'verdict': 'time_limit', 'steps': tm.step_count}
+        if len(lines) >= TRACE_BATCH:
+            return lines, None
+    return lines, {'verdict': tm.get_verdict(), 'steps': tm.step_count}
+
+
+def _limits(request):
+    # Retorna (max_steps, time_limit) de una solicitud, recortados a los máximos del servidor
+    try:
+        max_steps = int(request.get('max_steps', DEFAULT_MAX_STEPS))
+        time_limit = float(request.get('time_limit', DEFAULT_TIME_LIMIT))
+    except (TypeError, ValueError):
+        raise HTTPError(400, "'max_steps' y 'time_limit' deben ser números")
+    if max_steps <= 0 or time_limit <= 0:
+        raise HTTPError(400, "'max_steps' y 'time_limit' deben ser positivos")
+    return min(max_steps, MAX_STEPS_LIMIT), min(time_limit, TIME_LIMIT_LIMIT)
+
+
+def _json_body(body):
+    # Decodifica el cuerpo JSON de una solicitud (vacío: {})
+    if not body:
+        return {}
+    try:
+        value = json.loads(body)
+    except ValueError as e:
+        raise HTTPError(400, f"JSON inválido: {e}")
+    if not isinstance(value, dict):
+        raise HTTPError(400, "El cuerpo debe ser un objeto JSON")
+    return value
+
+
+async def _read_request(reader):
+    # Lee una solicitud HTTP/1.1; retorna (método, ruta, encabezados, cuerpo, keep-alive) o None al cerrar
+    request_line = await reader.readline()
+    if not request_line.strip():
+        return None
+    try:
+        method, path, version = request_line.decode('latin-1').split()
+    except ValueError:
+        raise HTTPError(400, "Línea de solicitud inválida")
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get('content-length', 0))
+    except ValueError:
+        raise HTTPError(400, "Content-Length inválido")
+    if length > MAX_BODY_BYTES:
+        raise HTTPError(413, f"Cuerpo demasiado grande (máximo {MAX_BODY_BYTES} bytes)")
+    body = await reader.readexactly(length) if length else b''
+
+    connection = headers.get('connection', '').lower()
+    keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+    return method, path, headers, body, keep_alive
+
+
+async def _send_json(writer, status, payload, keep_alive=True):
+    # Envía una respuesta JSON completa
+    body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    writer.write(
+        f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+        f"Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode('latin-1') + body
+    )
+    await writer.drain()
+
+
+async def _send_chunk(writer, text):
+    # Envía un bloque de una respuesta chunked
+    data = text.encode('utf-8')
+    writer.write(f"{len(data):x}\r\n".encode('latin-1') + data + b'\r\n')
+    await writer.drain()
+
+
+def main(argv=None):
+    #Punto de entrada de línea de comandos
+    parser = argparse.ArgumentParser(
+        prog='python -m src.server',
+        description='Servicio HTTP/JSON local para registrar Máquinas de Turing y ejecutarlas en un pool de procesos'
+    )
+    parser.add_argument('--host', default='127.0.0.1', help='Dirección en la que escuchar')
+    parser.add_argument('--port', type=int, default=8765, help='Puerto (0 elige uno libre)')
+    parser.add_argument('--workers', type=int, default=None, help='Procesos trabajadores (por defecto, uno por CPU)')
+    args = parser.parse_args(argv)
+
+    server = SimulationServer(args.host, args.port, args.workers)
+
+    async def serve():
+        port = await server.start()
+        print(f"Escuchando en http://{args.host}:{port} ({server.workers} trabajadores)", file=sys.stderr, flush=True)
+        await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,86 +1,532 @@
 #Módulo para manejar la cinta de la Máquina de Turing
 
+import mmap
+import os
+
+# Bytes mínimos que crece de una vez la cinta de MappedTape (y su archivo)
+GROW_CHUNK = 1 << 16
+
+# Bytes que se copian por lectura o escritura de archivo en MappedTape
+IO_CHUNK = 1 << 20
+
+# Códigos para símbolos que no caben en un byte latin-1 (controles, poco comunes en archivos de texto)
+_SPARE_CODES = tuple(range(0x80, 0xA0)) + tuple(code for code in range(0x20) if code not in (0x09, 0x0A, 0x0D))
+
+
 class Tape:
 
     #Representa la cinta infinita de la Máquina de Turing
+    #
+    # Las posiciones son absolutas: la celda 0 es el primer símbolo del
+    # contenido inicial y las celdas a su izquierda tienen índices negativos.
+    # Internamente se usan dos pilas: `_right` guarda las celdas 0, 1, 2, ...
+    # y `_left` las celdas -1, -2, -3, ..., de modo que extender la cinta en
+    # cualquiera de los dos extremos es un append O(1) amortizado.
 
     def __init__(self, initial_content=None, blank_symbol='_'):
         #Inicializa la cinta
         self.blank_symbol = blank_symbol
-        
-        if initial_content:
-            # Agregar espacios en blanco alrededor del contenido inicial
-            self.tape = [blank_symbol] * 10 + list(initial_content) + [blank_symbol] * 10
-            self.head_position = 10  # Posición inicial en el contenido
-        else:
-            self.tape = [blank_symbol] * 20
-            self.head_position = 10
-    
+        self.reset(initial_content)
+
     def read(self):
         #Lee el símbolo en la posición actual del cabezal
-        return self.tape[self.head_position]
-    
+        position = self.head_position
+        if position >= 0:
+            return self._right[position]
+        return self._left[~position]
+
     def write(self, symbol):
 
         #Escribe un símbolo en la posición actual
-        self.tape[self.head_position] = symbol
-    
+        position = self.head_position
+        if position >= 0:
+            self._right[position] = symbol
+        else:
+            self._left[~position] = symbol
+
     def move_left(self):
         #Mueve el cabezal una posición a la izquierda
         self.head_position -= 1
-        
-        # Extender la cinta si es necesario
-        if self.head_position < 0:
-            self.tape.insert(0, self.blank_symbol)
-            self.head_position = 0
-    
+
+        # Extender la cinta si es necesario (~p es el índice en _left para p < 0)
+        if ~self.head_position >= len(self._left):
+            self._left.append(self.blank_symbol)
+
     def move_right(self):
         #Mueve el cabezal una posición a la derecha
         self.head_position += 1
-        
+
         # Extender la cinta si es necesario
-        if self.head_position >= len(self.tape):
-            self.tape.append(self.blank_symbol)
-    
+        if self.head_position >= len(self._right):
+            self._right.append(self.blank_symbol)
+
+    def get_cell(self, position):
+        #Lee la celda en una posición absoluta (blanco si aún no existe)
+        if position >= 0:
+            return self._right[position] if position < len(self._right) else self.blank_symbol
+        return self._left[~position] if ~position < len(self._left) else self.blank_symbol
+
     def get_tape_content(self):
-        #Retorna el contenido actual de la cinta
-        return self.tape.copy()
-    
+        #Retorna el contenido actual de la cinta (desde get_tape_start())
+        return self._left[::-1] + self._right
+
     def get_head_position(self):
-        #Retorna la posición actual del cabezal
+        #Retorna la posición absoluta del cabezal
         return self.head_position
-    
+
+    def get_tape_start(self):
+        #Retorna la posición absoluta de la primera celda de la cinta
+        return -len(self._left)
+
+    def get_tape_end(self):
+        #Retorna la posición absoluta siguiente a la última celda de la cinta
+        return len(self._right)
+
+    def get_slice(self, start, end):
+        #Retorna las celdas en el rango absoluto [start, end)
+        cells = []
+        if start < 0:
+            # _left está invertida: la celda p (< 0) está en _left[~p]
+            cells = self._left[~min(end, 0) + 1:~start + 1][::-1]
+            start = 0
+        if end > start:
+            cells += self._right[start:end]
+        return cells
+
     def get_visible_tape(self, window_size=20):
         #Retorna una ventana visible de la cinta centrada en el cabezal
         half_window = window_size // 2
-        start = max(0, self.head_position - half_window)
-        end = min(len(self.tape), self.head_position + half_window)
-        
+        tape_start = self.get_tape_start()
+        tape_end = self.get_tape_end()
+        start = max(tape_start, self.head_position - half_window)
+        end = min(tape_end, self.head_position + half_window)
+
         # Asegurar que siempre tengamos el tamaño de ventana completo
         if end - start < window_size:
-            if start == 0:
-                end = min(len(self.tape), start + window_size)
+            if start == tape_start:
+                end = min(tape_end, start + window_size)
             else:
-                start = max(0, end - window_size)
-        
-        visible = self.tape[start:end]
+                start = max(tape_start, end - window_size)
+
+        visible = self.get_slice(start, end)
         relative_pos = self.head_position - start
-        
+
         return visible, relative_pos, start
-    
+
     def reset(self, initial_content=None):
         # Reinicia la cinta a su estado inicial
+        self._left = [self.blank_symbol] * 10
         if initial_content:
-            self.tape = [self.blank_symbol] * 10 + list(initial_content) + [self.blank_symbol] * 10
+            self._right = list(initial_content) + [self.blank_symbol] * 10
         else:
-            self.tape = [self.blank_symbol] * 20
-        self.head_position = 10
+            self._right = [self.blank_symbol] * 10
+        self.head_position = 0
+
+    def set_content(self, cells, start=0, head_position=0):
+        #Reemplaza la cinta por `cells`, cuya primera celda está en la posición absoluta `start`
+        blank = self.blank_symbol
+        end = start + len(cells)
+        if start > 0:
+            cells = [blank] * start + list(cells)
+            start = 0
+        if end <= 0:
+            cells = list(cells) + [blank] * (1 - end)
+        self._left = cells[:-start][::-1] if start < 0 else []
+        self._right = cells[-start:] if start < 0 else list(cells)
+        self.head_position = head_position
+
+    def checkpoint(self):
+        #Retorna una copia del contenido para el historial: (inicio, fin, celdas, blanco)
+        cells = self.get_tape_content()
+        start = self.get_tape_start()
+        return start, start + len(cells), cells, self.blank_symbol
     
+    def __len__(self):
+        return len(self._left) + len(self._right)
+
     def __str__(self):
         #Representación en string de la cinta
-        tape_str = ''.join(self.tape)
-        pointer = ' ' * self.head_position + '^'
+        tape_str = ''.join(self.get_tape_content())
+        pointer = ' ' * (self.head_position - self.get_tape_start()) + '^'
         return f"{tape_str}\n{pointer}"
-    
+
+    def __repr__(self):
+        return f"Tape(position={self.head_position}, start={self.get_tape_start()}, content={self.get_tape_content()})"
+
+
+class SparseTape(Tape):
+
+    #Cinta dispersa: solo guarda las celdas no blancas, indexadas por posición absoluta
+    #
+    # La memoria depende de la cantidad de celdas escritas y no de la distancia
+    # entre ellas (p. ej. marcadores muy separados). Los extremos [_low, _high)
+    # cubren todas las celdas escritas y visitadas, más el mismo margen de 10
+    # blancos que Tape, para que get_tape_content(), get_visible_tape() y
+    # __str__ se vean igual que con la cinta densa.
+
+    def read(self):
+        #Lee el símbolo en la posición actual del cabezal
+        return self._cells.get(self.head_position, self.blank_symbol)
+
+    def write(self, symbol):
+        #Escribe un símbolo en la posición actual (escribir el blanco libera la celda)
+        if symbol == self.blank_symbol:
+            self._cells.pop(self.head_position, None)
+        else:
+            self._cells[self.head_position] = symbol
+
+    def move_left(self):
+        #Mueve el cabezal una posición a la izquierda
+        self.head_position -= 1
+        if self.head_position < self._low:
+            self._low = self.head_position
+
+    def move_right(self):
+        #Mueve el cabezal una posición a la derecha
+        self.head_position += 1
+        if self.head_position >= self._high:
+            self._high = self.head_position + 1
+
+    def get_cell(self, position):
+        #Lee la celda en una posición absoluta
+        return self._cells.get(position, self.blank_symbol)
+
+    def get_tape_content(self):
+        #Retorna el contenido entre los extremos (los blancos se generan aquí)
+        return self.get_slice(self._low, self._high)
+
+    def get_tape_start(self):
+        #Retorna la posición absoluta de la primera celda de la cinta
+        return self._low
+
+    def get_tape_end(self):
+        #Retorna la posición absoluta siguiente a la última celda de la cinta
+        return self._high
+
+    def get_slice(self, start, end):
+        #Retorna las celdas en el rango absoluto [start, end)
+        get = self._cells.get
+        blank = self.blank_symbol
+        return [get(position, blank) for position in range(start, end)]
+
+    def get_written_cells(self):
+        #Retorna {posición: símbolo} de las celdas no blancas
+        return dict(self._cells)
+
+    def reset(self, initial_content=None):
+        # Reinicia la cinta a su estado inicial
+        blank = self.blank_symbol
+        content = list(initial_content) if initial_content else []
+        self._cells = {position: symbol for position, symbol in enumerate(content) if symbol != blank}
+        self._low = -10
+        self._high = len(content) + 10
+        self.head_position = 0
+
+    def set_content(self, cells, start=0, head_position=0):
+        #Reemplaza la cinta por `cells`, cuya primera celda está en la posición absoluta `start`
+        blank = self.blank_symbol
+        self._cells = {start + offset: symbol for offset, symbol in enumerate(cells) if symbol != blank}
+        self._low = min(start, head_position)
+        self._high = max(start + len(cells), head_position + 1)
+        self.head_position = head_position
+
+    def checkpoint(self):
+        #Copia para el historial: solo las celdas escritas (el historial las expande al consultarlo)
+        return self._low, self._high, dict(self._cells), self.blank_symbol
+
+    def __len__(self):
+        return self._high - self._low
+
     def __repr__(self):
-        return f"Tape(position={self.head_position}, content={self.tape})"
\ No newline at end of file
+        return f"SparseTape(position={self.head_position}, start={self._low}, end={self._high}, written={len(self._cells)})"
+
+
+class CodedCells(bytes):
+
+    #Celdas codificadas con un byte cada una (checkpoint de MappedTape); `names` decodifica cada código
+
+    def __new__(cls, codes, names):
+        cells = super().__new__(cls, codes)
+        cells.names = names
+        return cells
+
+    def symbols(self):
+        #Retorna la lista de símbolos de las celdas
+        names = self.names
+        return [names[code] for code in self]
+
+
+class MappedTape(Tape):
+
+    #Cinta de un byte por celda sobre un bytearray o un archivo mapeado en memoria (mmap)
+    #
+    # Pensada para entradas y salidas de cientos de MB: cada celda ocupa un
+    # byte en lugar de un puntero a una cadena. Los símbolos de un carácter
+    # latin-1 se guardan con su propio byte (el archivo se lee como texto) y
+    # los demás reciben códigos de control libres (ver _SPARE_CODES). Con
+    # `path` el contenido vive en ese archivo, que crece por bloques de al
+    # menos GROW_CHUNK bytes cuando el cabezal pasa de los extremos. Como
+    # SparseTape, los extremos [_low, _high) son los de Tape (10 blancos de
+    # margen más las celdas visitadas), así que el contenido se ve igual que
+    # con la cinta densa.
+    #
+    # from_file() carga la entrada desde un archivo sin pasar por una cadena,
+    # save() escribe la cinta en otro y close() deja en el archivo de respaldo
+    # solo la cinta final (sin los blancos de los extremos).
+
+    def __init__(self, initial_content=None, blank_symbol='_', path=None):
+        #Inicializa la cinta (en memoria, o respaldada por el archivo `path`, que se sobrescribe)
+        self.blank_symbol = blank_symbol
+        self.path = path
+        self._file = open(path, 'w+b') if path is not None else None
+        self._buffer = None
+        self._source = None
+        self._names = [chr(code) for code in range(256)]
+        self._codes = {}
+        self._spare = iter(_SPARE_CODES)
+        self._blank_code = self._code(blank_symbol)
+        self.reset(initial_content)
+
+    @classmethod
+    def from_file(cls, input_path, blank_symbol='_', path=None):
+        #Crea la cinta con el contenido del archivo `input_path` (un byte por celda)
+        tape = cls(None, blank_symbol, path)
+        try:
+            tape.load_file(input_path)
+        except (OSError, ValueError):
+            tape.close()
+            raise
+        return tape
+
+    def _code(self, symbol):
+        # Código de un símbolo; asigna uno nuevo la primera vez que aparece
+        code = self._codes.get(symbol)
+        if code is not None:
+            return code
+
+        if len(symbol) == 1 and ord(symbol) < 256 and self._names[ord(symbol)] == symbol:
+            code = ord(symbol)
+        else:
+            taken = set(self._codes.values())
+            code = next((code for code in self._spare if code not in taken), None)
+            if code is None:
+                raise ValueError(f"MappedTape admite hasta 256 símbolos; no hay código para '{symbol}'")
+            self._names[code] = symbol
+        self._codes[symbol] = code
+        return code
+
+    def read(self):
+        #Lee el símbolo en la posición actual del cabezal
+        return self._names[self._buffer[self.head_position + self._origin]]
+
+    def write(self, symbol):
+        #Escribe un símbolo en la posición actual
+        code = self._codes.get(symbol)
+        if code is None:
+            code = self._code(symbol)
+        self._buffer[self.head_position + self._origin] = code
+
+    def move_left(self):
+        #Mueve el cabezal una posición a la izquierda
+        self.head_position -= 1
+        if self.head_position < self._low:
+            self._low = self.head_position
+            if self.head_position + self._origin < 0:
+                self._grow(left=True)
+
+    def move_right(self):
+        #Mueve el cabezal una posición a la derecha
+        self.head_position += 1
+        if self.head_position >= self._high:
+            self._high = self.head_position + 1
+            if self.head_position + self._origin >= len(self._buffer):
+                self._grow(left=False)
+
+    def _grow(self, left):
+        # Agrega blancos en un extremo: al menos GROW_CHUNK bytes o un cuarto del tamaño actual
+        size = len(self._buffer)
+        extra = max(GROW_CHUNK, size // 4)
+        blanks = bytes([self._blank_code]) * extra
+        if self._file is None:
+            if left:
+                self._buffer[0:0] = blanks
+            else:
+                self._buffer.extend(blanks)
+        else:
+            self._map(size + extra)
+            if left:
+                self._buffer.move(extra, 0, size)
+                self._buffer[0:extra] = blanks
+            else:
+                self._buffer[size:] = blanks
+        if left:
+            self._origin += extra
+
+    def _map(self, size):
+        # Redimensiona el archivo de respaldo y lo vuelve a mapear completo
+        if self._buffer is not None:
+            self._buffer.close()
+        self._file.truncate(size)
+        self._buffer = mmap.mmap(self._file.fileno(), size)
+
+    def _allocate(self, low, high):
+        # Crea el almacenamiento para las posiciones [low, high), lleno de blancos
+        size = high - low
+        if self._file is None:
+            self._buffer = bytearray([self._blank_code]) * size
+        else:
+            self._map(size)
+            for offset in range(0, size, IO_CHUNK):
+                end = min(size, offset + IO_CHUNK)
+                self._buffer[offset:end] = bytes([self._blank_code]) * (end - offset)
+        self._origin = -low
+        self._low = low
+        self._high = high
+
+    def _encode(self, cells):
+        # Codifica una secuencia de símbolos como bytes
+        code = self._code
+        return bytes(code(symbol) for symbol in cells)
+
+    def get_cell(self, position):
+        #Lee la celda en una posición absoluta (blanco si aún no existe)
+        index = position + self._origin
+        if 0 <= index < len(self._buffer):
+            return self._names[self._buffer[index]]
+        return self.blank_symbol
+
+    def get_tape_content(self):
+        #Retorna el contenido actual de la cinta (desde get_tape_start())
+        return self.get_slice(self._low, self._high)
+
+    def get_tape_start(self):
+        #Retorna la posición absoluta de la primera celda de la cinta
+        return self._low
+
+    def get_tape_end(self):
+        #Retorna la posición absoluta siguiente a la última celda de la cinta
+        return self._high
+
+    def get_slice(self, start, end):
+        #Retorna las celdas en el rango absoluto [start, end)
+        blank = self.blank_symbol
+        first = max(start + self._origin, 0)
+        last = min(end + self._origin, len(self._buffer))
+        if first >= last:
+            return [blank] * max(0, end - start)
+        names = self._names
+        cells = [names[code] for code in self._buffer[first:last]]
+        before = first - self._origin - start
+        after = end - (last - self._origin)
+        if before or after:
+            cells = [blank] * before + cells + [blank] * after
+        return cells
+
+    def reset(self, initial_content=None):
+        # Reinicia la cinta a su estado inicial
+        encoded = self._encode(initial_content) if initial_content else b''
+        self._source = None
+        self._allocate(-10, len(encoded) + 10)
+        self._buffer[self._origin:self._origin + len(encoded)] = encoded
+        self.head_position = 0
+
+    def load_file(self, input_path):
+        #Reinicia la cinta con el contenido de un archivo, copiado por bloques (un byte por celda)
+        if self.path is not None and os.path.exists(input_path) and os.path.samefile(input_path, self.path):
+            raise ValueError("El archivo de entrada no puede ser el archivo de respaldo de la cinta")
+        size = os.path.getsize(input_path)
+        self._allocate(-10, size + 10)
+        view = memoryview(self._buffer)
+        try:
+            with open(input_path, 'rb') as input_file:
+                offset = self._origin
+                while offset < self._origin + size:
+                    read = input_file.readinto(view[offset:min(offset + IO_CHUNK, self._origin + size)])
+                    if not read:
+                        break
+                    offset += read
+        finally:
+            view.release()
+        self._source = input_path
+        self.head_position = 0
+
+    def reload(self):
+        #Vuelve a cargar la entrada original (la de load_file() si la hubo); False si no la hay
+        if self._source is None:
+            return False
+        self.load_file(self._source)
+        return True
+
+    def set_content(self, cells, start=0, head_position=0):
+        #Reemplaza la cinta por `cells`, cuya primera celda está en la posición absoluta `start`
+        encoded = self._encode(cells)
+        self._allocate(min(start, head_position), max(start + len(encoded), head_position + 1))
+        index = start + self._origin
+        self._buffer[index:index + len(encoded)] = encoded
+        self.head_position = head_position
+
+    def checkpoint(self):
+        #Copia para el historial: un byte por celda (el historial las decodifica al consultarlo)
+        cells = CodedCells(self._buffer[self._low + self._origin:self._high + self._origin], tuple(self._names))
+        return self._low, self._high, cells, self.blank_symbol
+
+    def _content_bounds(self):
+        # Índices [inicio, fin) del almacenamiento sin los blancos de los extremos (por bloques)
+        blank = bytes([self._blank_code])
+        start, end = self._low + self._origin, self._high + self._origin
+        while start < end:
+            chunk = bytes(self._buffer[start:min(end, start + IO_CHUNK)])
+            stripped = chunk.lstrip(blank)
+            start += len(chunk) - len(stripped)
+            if stripped:
+                break
+        while end > start:
+            chunk = bytes(self._buffer[max(start, end - IO_CHUNK):end])
+            stripped = chunk.rstrip(blank)
+            end -= len(chunk) - len(stripped)
+            if stripped:
+                break
+        return start, end
+
+    def save(self, output_path):
+        #Escribe la cinta sin los blancos de los extremos en un archivo (un byte por celda)
+        start, end = self._content_bounds()
+        with open(output_path, 'wb') as output_file:
+            for offset in range(start, end, IO_CHUNK):
+                output_file.write(self._buffer[offset:min(end, offset + IO_CHUNK)])
+
+    def close(self):
+        #Libera el almacenamiento; el archivo de respaldo queda con la cinta sin los blancos de los extremos
+        if self._file is None:
+            self._buffer = None
+            return
+        if self._buffer is not None:
+            start, end = self._content_bounds()
+            self._buffer.move(0, start, end - start)
+            self._buffer.flush()
+            self._buffer.close()
+            self._buffer = None
+            self._file.truncate(end - start)
+        self._file.close()
+        self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    def __len__(self):
+        return self._high - self._low
+
+    def __repr__(self):
+        return f"MappedTape(position={self.head_position}, start={self._low}, end={self._high}, path={self.path!r})"
+
+
+# Implementaciones de cinta seleccionables en TuringMachine.load_tape
+TAPE_BACKENDS = {
+    'dense': Tape,
+    'sparse': SparseTape,
+    'mapped': MappedTape
+}
@@ -0,0 +1,91 @@
+# Trazas de ejecución en streaming a partir de TuringMachine.iter_steps()
+
+import csv
+import json
+from collections import deque
+
+TRACE_FIELDS = ['step', 'state', 'head', 'read', 'written', 'move', 'next_state']
+
+
+class _FileSink:
+    # Base para sumideros que escriben en un archivo (ruta o archivo abierto)
+
+    def __init__(self, target):
+        if hasattr(target, 'write'):
+            self.file = target
+            self._owns_file = False
+        else:
+            self.file = open(target, 'w', encoding='utf-8', newline='')
+            self._owns_file = True
+
+    def close(self):
+        #Cierra el archivo si fue abierto por el sumidero
+        if self._owns_file:
+            self.file.close()
+        else:
+            self.file.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class JSONLSink(_FileSink):
+    #Escribe cada paso como un objeto JSON por línea
+
+    def write(self, event):
+        self.file.write(json.dumps(event._asdict(), ensure_ascii=False) + '\n')
+
+
+class CSVSink(_FileSink):
+    #Escribe cada paso como una fila CSV (con encabezado)
+
+    def __init__(self, target):
+        super().__init__(target)
+        self._writer = csv.writer(self.file)
+        self._writer.writerow(TRACE_FIELDS)
+
+    def write(self, event):
+        self._writer.writerow(event)
+
+
+class RingBufferSink:
+    #Conserva en memoria solo los últimos `capacity` pasos
+
+    def __init__(self, capacity=1000):
+        self.events = deque(maxlen=capacity)
+
+    def write(self, event):
+        self.events.append(event)
+
+    def close(self):
+        pass
+
+    def __iter__(self):
+        return iter(self.events)
+
+    def __len__(self):
+        return len(self.events)
+
+
+def trace(tm, sinks, max_steps=None):
+    #Ejecuta la máquina enviando cada paso a los sumideros; retorna el veredicto
+    #
+    # La memoria usada no depende de la cantidad de pasos (salvo lo que guarde
+    # cada sumidero). Los sumideros no se cierran aquí.
+    if not isinstance(sinks, (list, tuple)):
+        sinks = [sinks]
+
+    writers = [sink.write for sink in sinks]
+    if len(writers) == 1:
+        write = writers[0]
+        for event in tm.iter_steps(max_steps):
+            write(event)
+    else:
+        for event in tm.iter_steps(max_steps):
+            for write in writers:
+                write(event)
+
+    return tm.get_verdict()
@@ -3,6 +3,9 @@
 class Transition:
     #Representa una transición individual en la Máquina de Turing
 
+    # Sin __dict__: las tablas grandes tienen cientos de miles de transiciones
+    __slots__ = ('current_state', 'read_symbol', 'write_symbol', 'move_direction', 'next_state')
+
     def __init__(self, current_state, read_symbol, write_symbol, move_direction, next_state):
         #Inicializa una transición
         self.current_state = current_state
@@ -39,12 +42,15 @@ class TransitionFunction:
         #Inicializa la función de transición vacía
         # Estructura: {(estado, símbolo): Transition}
         self.transitions = {}
+        # Se incrementa con cada modificación (invalida tablas compiladas)
+        self.revision = 0
     
     def add_transition(self, current_state, read_symbol, write_symbol, move_direction, next_state):
         #Agrega una transición a la función
         transition = Transition(current_state, read_symbol, write_symbol, move_direction, next_state)
         key = (current_state, read_symbol)
         self.transitions[key] = transition
+        self.revision += 1
     
     def get_transition(self, current_state, read_symbol):
         #Obtiene la transición para un estado y símbolo dados
@@ -86,6 +92,7 @@ class TransitionFunction:
     def load_from_dict(self, transitions_dict):
         #Carga transiciones desde un diccionario
         self.transitions.clear()
+        self.revision += 1
         
         for state, symbol_dict in transitions_dict.items():
             for symbol, trans_data in symbol_dict.items():
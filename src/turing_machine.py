@@ -1,12 +1,70 @@
 # Módulo principal de la Máquina de Turing
 
-from .tape import Tape
+from .tape import TAPE_BACKENDS, MappedTape
 from .transition import TransitionFunction
-import copy
+from .history import ExecutionHistory
+from .definition import MachineDefinition, Execution
+from .loop_detection import LoopDetector
+from .profiler import ExecutionProfile
+from .breakpoints import Breakpoints
+from .budget import RunBudget
+from collections import namedtuple
+from operator import attrgetter
+
+
+# Evento liviano producido por TuringMachine.iter_steps()
+StepEvent = namedtuple('StepEvent', ['step', 'state', 'head', 'read', 'written', 'move', 'next_state'])
+
+
+def _execution_field(name):
+    # Atributo de la ejecución expuesto por la fachada (lectura y escritura)
+    def set_field(self, value):
+        setattr(self._execution, name, value)
+    return property(attrgetter('_execution.' + name), set_field)
 
 
 class TuringMachine:
     # Implementación completa de una Máquina de Turing
+    #
+    # Es la fachada mutable que usa la aplicación: reúne la definición
+    # (transiciones y estados especiales) con una Execution (cinta, estado,
+    # contador y banderas), a la que delega el paso, la ejecución compilada y
+    # el veredicto, y le agrega historial, perfil, puntos de interrupción y
+    # presupuesto. definition() congela la parte estática en una
+    # MachineDefinition, que puede compartirse entre muchas ejecuciones.
+    
+    # Porción máxima de advance() que se ejecuta paso a paso (con historial)
+    HISTORY_STEP_LIMIT = 1000
+    
+    # Pasos entre los checkpoints que deja en el historial una porción mayor
+    # (al menos 16 por celda de la cinta, para que copiarla sea O(1) por paso):
+    # seek() vuelve a ejecutar como mucho esa cantidad de pasos
+    ADVANCE_CHECKPOINT_STEPS = 1 << 16
+    
+    # Descripción del resultado según el límite que detuvo la ejecución
+    # (stop_reason, uno de STOP_VERDICTS)
+    STOP_MESSAGES = {
+        'timeout': "TIMEOUT (excedió pasos máximos)",
+        'time_limit': "LÍMITE DE TIEMPO (excedió el tiempo de ejecución)",
+        'tape_limit': "LÍMITE DE CINTA (excedió las celdas de cinta)",
+        'memory_limit': "LÍMITE DE MEMORIA (excedió la memoria del historial)"
+    }
+    
+    # Capacidades de la clase: las subclases que no las tienen las desactivan y
+    # sus métodos lanzan TypeError (consultar antes de llamarlos)
+    supports_compile = True  # compile(): tabla para el motor compilado
+    supports_definition = True  # definition(): MachineDefinition compartible
+    
+    # Estado de la ejecución, guardado en self._execution
+    tape = _execution_field('tape')
+    current_state = _execution_field('current_state')
+    step_count = _execution_field('step_count')
+    max_steps = _execution_field('max_steps')
+    is_halted = _execution_field('is_halted')
+    is_accepted = _execution_field('is_accepted')
+    is_rejected = _execution_field('is_rejected')
+    cycle_length = _execution_field('cycle_length')  # Longitud del ciclo si se detectó un bucle
+    stop_reason = _execution_field('stop_reason')  # Límite que detuvo la ejecución: uno de STOP_VERDICTS
  
     def __init__(self, name="Máquina de Turing", description=""):
         #Inicializa la Máquina de Turing
@@ -14,23 +72,28 @@ class TuringMachine:
         self.description = description
         
         # Componentes de la MT
-        self.tape = None
+        self._input_content = []
         self.transition_function = TransitionFunction()
-        self.current_state = None
         self.initial_state = None
         self.accept_states = set()
         self.reject_states = set()
         self.blank_symbol = '_'
         
-        # Control de ejecución
-        self.step_count = 0
-        self.is_halted = False
-        self.is_accepted = False
-        self.is_rejected = False
-        self.history = []
+        # Control de ejecución (la propia máquina es la definición de su Execution)
+        self._execution = Execution(self)
+        self.tape = None
+        self.history = ExecutionHistory()
+        self._advance_detector = None  # (LoopDetector, paso) usado por advance()
+        self.profile = None  # ExecutionProfile si se perfila la ejecución (ver enable_profiling())
+        self.breakpoints = Breakpoints()  # Puntos de interrupción de run(), run_compiled() y advance()
+        self.budget = RunBudget()  # Límites de tiempo, cinta e historial (vacío: solo max_steps)
         
         # Configuración
         self.max_steps = 10000  # Prevenir bucles infinitos
+        
+        # Definición congelada en caché (ver definition())
+        self._definition = None
+        self._definition_key_cache = None
     
     def configure(self, initial_state, accept_states, reject_states=None, blank_symbol='_'):
         #Configura los estados de la máquina   
@@ -40,121 +103,447 @@ class TuringMachine:
         self.reject_states = set(reject_states) if reject_states else set()
         self.blank_symbol = blank_symbol
     
-    def load_tape(self, initial_content):
+    @classmethod
+    def from_definition(cls, definition):
+        #Crea una máquina (sin cinta) sobre una MachineDefinition, sin copiar sus transiciones
+        #
+        # La definición se usa directamente como función de transición; si luego
+        # se agregan transiciones, la máquina pasa a tener su propia copia.
+        tm = cls(definition.name, definition.description)
+        tm.transition_function = definition
+        tm.configure(
+            definition.initial_state,
+            list(definition.accept_states),
+            definition.reject_states,
+            definition.blank_symbol
+        )
+        tm._definition = definition
+        tm._definition_key_cache = tm._definition_key()
+        return tm
+    
+    def new_run(self):
+        #Retorna una máquina nueva (sin cinta) que comparte la definición con esta
+        tm = TuringMachine.from_definition(self.definition())
+        tm.max_steps = self.max_steps
+        tm.budget = self.budget.copy()
+        return tm
+    
+    def load_tape(self, initial_content, backend='dense'):
         #Carga la cinta con contenido inicial
+        #
+        # backend elige la implementación de la cinta (ver TAPE_BACKENDS):
+        # 'dense' (Tape, por defecto), 'sparse' (SparseTape, que solo guarda
+        # las celdas no blancas) o 'mapped' (MappedTape, un byte por celda).
+        if backend not in TAPE_BACKENDS:
+            raise ValueError(f"Tipo de cinta desconocido: {backend}. Use uno de: {', '.join(TAPE_BACKENDS)}")
+        
         if isinstance(initial_content, str):
             initial_content = list(initial_content)
         
-        self.tape = Tape(initial_content, self.blank_symbol)
+        self._input_content = list(initial_content) if initial_content else []
+        self.tape = TAPE_BACKENDS[backend](initial_content, self.blank_symbol)
+    
+    def load_tape_file(self, input_path, output_path=None):
+        #Carga la cinta desde un archivo (un byte por celda) sobre una MappedTape y la retorna
+        #
+        # La entrada se copia por bloques sin pasar por una cadena. Con
+        # output_path la cinta vive en ese archivo (mapeado en memoria), que al
+        # cerrarla con tape.close() queda con la cinta final. Para entradas muy
+        # largas conviene iter_steps(), que no guarda historial.
+        self._input_content = []
+        self.tape = MappedTape.from_file(input_path, self.blank_symbol, output_path)
+        return self.tape
+    
+    def _editable_transitions(self):
+        # Retorna una TransitionFunction modificable (copia la definición congelada si hace falta)
+        if isinstance(self.transition_function, MachineDefinition):
+            transition_function = TransitionFunction()
+            transition_function.transitions = dict(self.transition_function.transitions)
+            self.transition_function = transition_function
+        return self.transition_function
     
     def add_transition(self, current_state, read_symbol, write_symbol, move_direction, next_state):
         #Agrega una transición a la máquina
-        self.transition_function.add_transition(
+        self._editable_transitions().add_transition(
             current_state, read_symbol, write_symbol, move_direction, next_state
         )
     
     def load_transitions_from_dict(self, transitions_dict):
         #Carga transiciones desde un diccionario
-        self.transition_function.load_from_dict(transitions_dict)
+        self._editable_transitions().load_from_dict(transitions_dict)
+    
+    def get_transition(self, current_state, read_symbol):
+        #Obtiene la transición para un estado y símbolo dados (interfaz de definición de Execution)
+        return self.transition_function.get_transition(current_state, read_symbol)
     
     def step(self):
         #Ejecuta un paso de la máquina
-        if self.is_halted:
+        execution = self._execution
+        if execution.is_halted:
             return False
         
-        # Guardar estado actual en historial
-        self._save_to_history()
-        
         # Leer símbolo actual
-        current_symbol = self.tape.read()
+        current_symbol = execution.tape.read()
         
         # Buscar transición
-        transition = self.transition_function.get_transition(self.current_state, current_symbol)
+        transition = self.transition_function.get_transition(execution.current_state, current_symbol)
+        
+        # Guardar estado actual en historial
+        self._save_to_history(current_symbol, transition)
+        
+        return self._apply_transition(transition)
+    
+    def _apply_transition(self, transition):
+        # Aplica la transición encontrada (o detiene la máquina si es None) con Execution.apply
+        execution = self._execution
+        if self.profile is not None and transition is not None:
+            self.profile.record(transition.current_state, transition.read_symbol, execution.tape.get_head_position())
+        
+        return execution.apply(transition)
+    
+    def iter_steps(self, max_steps=None):
+        #Generador que ejecuta la máquina y produce un StepEvent por cada paso
+        #
+        # Los pasos no se guardan en el historial, así que la memoria es constante
+        # sin importar la cantidad de pasos; el consumidor decide qué conservar
+        # (ver src/trace.py). La ejecución puede interrumpirse dejando de iterar.
+        self.history.mark_discontinuity()
+        execution = self._execution
+        tape = execution.tape
+        get_transition = self.transition_function.get_transition
+        
+        with self._step_limit(max_steps):
+            while not execution.is_halted:
+                step = execution.step_count
+                state = execution.current_state
+                head = tape.get_head_position()
+                symbol = tape.read()
+                transition = get_transition(state, symbol)
+                can_continue = self._apply_transition(transition)
+                
+                if transition is None:
+                    break
+                
+                yield StepEvent(
+                    step, state, head, symbol,
+                    transition.write_symbol, transition.move_direction, transition.next_state
+                )
+                
+                if not can_continue:
+                    break
+    
+    def enable_profiling(self):
+        #Activa el perfil de ejecución (si no lo estaba) y lo retorna
+        #
+        # Mientras self.profile no sea None, todos los motores (step, run_compiled,
+        # advance) cuentan los disparos de cada transición y las escrituras en
+        # cada celda. Para desactivarlo basta con asignar None.
+        if self.profile is None:
+            self.profile = ExecutionProfile()
+        return self.profile
+    
+    def run(self, max_steps=None, accelerate=False, detect_loops=False, profile=False):
+        #Ejecuta la máquina hasta que se detenga
+        #
+        # Con profile=True se activa el perfil de ejecución (ver enable_profiling()).
+        #
+        # Con accelerate=True se usa el motor compilado con macro-pasos: los
+        # barridos sobre corridas de símbolos se saltan en una sola operación.
+        # El resultado es el mismo, pero esos pasos no quedan en el historial.
+        #
+        # Con detect_loops=True la ejecución termina con el veredicto 'loop' en
+        # cuanto se repite una configuración (ver LoopDetector); la longitud
+        # del ciclo queda en cycle_length.
+        #
+        # Si hay puntos de interrupción (self.breakpoints) la ejecución se
+        # detiene después del primer paso que cumple alguno y retorna
+        # 'breakpoint'; llamar de nuevo a run() continúa desde ahí.
+        #
+        # max_steps limita solo esta llamada (self.max_steps no cambia) y
+        # self.budget agrega límites de tiempo, cinta e historial.
+        if profile:
+            self.enable_profiling()
+        
+        if accelerate:
+            return self.run_compiled(max_steps, macro=True, detect_loops=detect_loops)
+        
+        with self._step_limit(max_steps), self.budget:
+            if detect_loops or self.breakpoints or self.budget:
+                return self._run_checked(detect_loops)
+            
+            execution = self._execution
+            while not execution.is_halted:
+                can_continue = self.step()
+                if not can_continue:
+                    break
+            
+            return self.get_verdict()
+    
+    def _step_limit(self, max_steps):
+        # Aplica max_steps (si se indica) solo mientras dura una ejecución (ver Execution.step_limit)
+        return self._execution.step_limit(max_steps)
+    
+    def _run_checked(self, detect_loops):
+        # Igual que run(), comprobando después de cada paso los bucles y los puntos de interrupción
+        # (y el presupuesto cada budget.check_interval pasos)
+        detector = None
+        if detect_loops:
+            detector = LoopDetector()
+            detector.start_tape(self.current_state, self.tape)
+        breakpoints = self.breakpoints if self.breakpoints else None
+        budget = self.budget if self.budget else None
+        self.breakpoints.hit = None
         
-        if transition is None:
-            # No hay transición definida - la máquina se detiene
-            self.is_halted = True
+        while not self.is_halted:
+            old_head = self.tape.get_head_position()
+            old_symbol = self.tape.read()
+            if not self.step():
+                break
             
-            # Verificar si está en estado de aceptación o rechazo
-            if self.current_state in self.accept_states:
-                self.is_accepted = True
-            elif self.current_state in self.reject_states:
-                self.is_rejected = True
+            if detector:
+                cycle_length = detector.update_tape(self.current_state, self.tape, old_head, old_symbol)
+                if cycle_length:
+                    self.is_halted = True
+                    self.cycle_length = cycle_length
+                    break
             
+            if breakpoints and self._breakpoint_hit(old_head, old_symbol):
+                return 'breakpoint'
+            
+            if budget and not self.step_count % budget.check_interval and self._budget_exceeded(budget):
+                break
+        
+        return self.get_verdict()
+    
+    def _budget_exceeded(self, budget):
+        # Comprueba el presupuesto; si se agotó, detiene la máquina con el veredicto del límite
+        verdict = budget.check(self._tape_cells(), self.history.nbytes())
+        if verdict is None:
             return False
+        self.is_halted = True
+        self.stop_reason = verdict
+        return True
+    
+    def _tape_cells(self):
+        # Celdas de la cinta (para el presupuesto)
+        return len(self.tape)
+    
+    def _breakpoint_hit(self, old_head, old_symbol):
+        # Comprueba los puntos de interrupción después de un paso de step()
+        return self.breakpoints.check(
+            self.current_state,
+            self.tape.read(),
+            self.tape.get_head_position(),
+            old_head,
+            old_symbol,
+            self.tape.get_cell(old_head)
+        )
+    
+    def _definition_key(self):
+        # Identifica la revisión actual de la definición (no del contenido)
+        return (
+            self.transition_function,
+            getattr(self.transition_function, 'revision', 0),
+            self.initial_state,
+            frozenset(self.accept_states),
+            frozenset(self.reject_states),
+            self.blank_symbol
+        )
+    
+    def definition(self):
+        #Retorna la definición actual congelada (se vuelve a congelar solo si la máquina cambió)
+        key = self._definition_key()
+        if self._definition is None or self._definition_key_cache != key:
+            self._definition = MachineDefinition.from_machine(self)
+            self._definition_key_cache = key
+        return self._definition
+    
+    def definition_hash(self):
+        #Retorna un hash SHA-256 del contenido de la definición (transiciones y estados)
+        #
+        # Dos máquinas con la misma tabla y configuración tienen el mismo hash,
+        # sin importar el orden en que se agregaron las transiciones.
+        return self.definition().digest
+    
+    def compile(self):
+        #Retorna la tabla de transiciones compilada (se recompila si la máquina cambió)
+        return self.definition().compile()
+    
+    def execution(self, input_string=None):
+        #Crea una ejecución liviana (Execution) sobre la definición actual
+        return Execution(self.definition(), input_string, self.max_steps)
+    
+    def run_compiled(self, max_steps=None, macro=False, detect_loops=False):
+        #Ejecuta la máquina sobre la tabla compilada (mismo resultado que run(), sin historial)
+        #
+        # Como run(), retorna 'breakpoint' si se detuvo en un punto de interrupción.
+        self.breakpoints.hit = None
+        if self.is_halted:
+            return self.get_verdict()
         
-        # Ejecutar transición
-        self.tape.write(transition.write_symbol)
+        with self._step_limit(max_steps), self.budget:
+            self._execute_compiled(None, macro, detect_loops)
+            if self.breakpoints.hit and not self.is_halted:
+                return 'breakpoint'
+            return self.get_verdict()
+    
+    def _execute_compiled(self, pause_at, macro=False, detect_loops=False):
+        # Ejecuta el motor compilado desde la configuración actual (en porciones si hay presupuesto)
+        self._execution.execute_compiled(
+            pause_at,
+            self.budget,
+            macro=macro,
+            detect_loops=detect_loops,
+            profile=self.profile,
+            breakpoints=self.breakpoints
+        )
         
-        if transition.move_direction == 'L':
-            self.tape.move_left()
-        elif transition.move_direction == 'R':
-            self.tape.move_right()
-        # 'S' (Stay) no mueve el cabezal
+        # Los pasos ejecutados fuera de step() no quedan en el historial
+        self.history.mark_discontinuity()
+    
+    def advance(self, steps, detect_loops=False):
+        #Ejecuta hasta `steps` pasos más sin dar por terminada la ejecución; retorna los pasos ejecutados
+        #
+        # Pensado para animaciones: cada cuadro avanza una porción de la
+        # ejecución. Las porciones de hasta HISTORY_STEP_LIMIT pasos usan step()
+        # y quedan en el historial; las mayores usan el motor compilado con
+        # macro-pasos, en tramos que empiezan con un checkpoint en el historial
+        # (ver ADVANCE_CHECKPOINT_STEPS). Con detect_loops el detector empieza
+        # de nuevo en cada tramo. La detección de bucles continúa entre porciones mientras
+        # nadie más haya movido la máquina. Un punto de interrupción detiene la
+        # porción y queda en self.breakpoints.hit.
+        self.breakpoints.hit = None
+        if self.is_halted or steps <= 0:
+            return 0
         
-        self.current_state = transition.next_state
-        self.step_count += 1
+        start = self.step_count
+        if steps > self.HISTORY_STEP_LIMIT:
+            self._advance_detector = None
+            target = self.step_count + steps
+            with self.budget:
+                while True:
+                    self._record_checkpoint()
+                    pause = min(target, self.step_count + max(self.ADVANCE_CHECKPOINT_STEPS, 16 * len(self.tape)))
+                    self._execute_compiled(pause, macro=True, detect_loops=detect_loops)
+                    if self.is_halted or self.breakpoints.hit or self.step_count < pause or pause == target:
+                        break
+            return self.step_count - start
         
-        # Verificar estados finales
-        if self.current_state in self.accept_states:
-            self.is_halted = True
-            self.is_accepted = True
-            return False
-        elif self.current_state in self.reject_states:
-            self.is_halted = True
-            self.is_rejected = True
-            return False
+        detector = None
+        if detect_loops:
+            detector, detector_step = self._advance_detector or (None, None)
+            if detector is None or detector_step != self.step_count:
+                detector = LoopDetector()
+                detector.start_tape(self.current_state, self.tape)
+        breakpoints = self.breakpoints if self.breakpoints else None
+        budget = self.budget if self.budget else None
         
-        # Prevenir bucles infinitos
-        if self.step_count >= self.max_steps:
-            self.is_halted = True
-            return False
+        with self.budget:
+            for _ in range(steps):
+                old_head = self.tape.get_head_position()
+                old_symbol = self.tape.read()
+                if not self.step():
+                    break
+                if detector:
+                    cycle_length = detector.update_tape(self.current_state, self.tape, old_head, old_symbol)
+                    if cycle_length:
+                        self.is_halted = True
+                        self.cycle_length = cycle_length
+                        break
+                if breakpoints and self._breakpoint_hit(old_head, old_symbol):
+                    break
+                if budget and not self.step_count % budget.check_interval and self._budget_exceeded(budget):
+                    break
         
-        return True
+        self._advance_detector = (detector, self.step_count) if detector else None
+        return self.step_count - start
     
-    def run(self, max_steps=None):
-        #Ejecuta la máquina hasta que se detenga
-        if max_steps:
-            self.max_steps = max_steps
-        
-        while not self.is_halted:
-            can_continue = self.step()
-            if not can_continue:
-                break
+    def _record_checkpoint(self):
+        # Registra la configuración actual como checkpoint antes de ejecutar pasos fuera de step()
+        #
+        # La entrada no tiene símbolo escrito: si step() ejecuta después ese
+        # mismo paso, la reemplaza (ver ExecutionHistory.truncate).
+        self.history.mark_discontinuity()
+        self.history.record(self.step_count, self.current_state, self.tape, self.tape.read(), None)
+    
+    def seek(self, step):
+        #Lleva la máquina al paso `step` (hacia atrás o hacia adelante); retorna el paso alcanzado
+        #
+        # Hacia atrás la configuración se reconstruye desde el historial: la
+        # entrada se ubica con búsqueda binaria y la cinta sale del checkpoint
+        # previo más sus deltas, sin volver a ejecutar desde el paso 0. Las
+        # entradas posteriores se conservan (seek() puede volver a ellas) hasta
+        # que la máquina ejecute un paso desde ahí. Los pasos que no están en el
+        # historial (ejecutados con el motor compilado) se vuelven a ejecutar con
+        # advance() desde la entrada anterior más cercana, que advance() deja a
+        # lo sumo cada ADVANCE_CHECKPOINT_STEPS pasos (o 16 por celda).
+        if step < 0:
+            raise ValueError("El paso debe ser mayor o igual a 0")
         
-        if self.is_accepted:
-            return 'accepted'
-        elif self.is_rejected:
-            return 'rejected'
-        elif self.step_count >= self.max_steps:
-            return 'timeout'
+        index = self.history.find(step)
+        recorded = self.history.step_at(index) if index >= 0 else None
+        if step >= self.step_count and (recorded is None or recorded <= self.step_count):
+            # La configuración actual es el punto de partida más cercano
+            self.advance(step - self.step_count)
+        elif recorded is not None:
+            self._restore_snapshot(self.history[index])
+            self.advance(step - recorded)
         else:
-            return 'halted'
+            # Anterior a todo el historial: se vuelve a ejecutar desde el inicio
+            self.reset(keep_tape_content=True)
+            self.advance(step)
+        
+        return self.step_count
+    
+    def step_back(self):
+        #Retrocede un paso (ver seek()); retorna False si la máquina ya está en el paso 0
+        if self.step_count == 0:
+            return False
+        
+        self.seek(self.step_count - 1)
+        return True
+    
+    def _restore_snapshot(self, snapshot):
+        # Carga una instantánea del historial como configuración actual
+        self.tape.set_content(snapshot['tape'], snapshot['tape_start'], snapshot['head_position'])
+        self._execution.restart()
+        self.current_state = snapshot['state']
+        self.step_count = snapshot['step']
+        self._advance_detector = None
+    
+    def get_verdict(self):
+        #Retorna el veredicto de la ejecución según las banderas de estado (ver Execution.get_verdict)
+        return self._execution.get_verdict()
     
     def reset(self, keep_tape_content=False):
         #Reinicia la máquina a su estado inicial
-        if keep_tape_content and self.history:
-            # Restaurar contenido inicial de la cinta
-            initial_tape = self.history[0]['tape']
-            self.tape.reset(initial_tape[10:initial_tape.index(self.blank_symbol, 10)])
-        
-        self.current_state = self.initial_state
-        self.step_count = 0
-        self.is_halted = False
-        self.is_accepted = False
-        self.is_rejected = False
-        self.history = []
-    
-    def _save_to_history(self):
-        #Guarda el estado actual en el historial
-        state_snapshot = {
-            'step': self.step_count,
-            'state': self.current_state,
-            'tape': self.tape.get_tape_content(),
-            'head_position': self.tape.get_head_position(),
-            'symbol': self.tape.read()
-        }
-        self.history.append(state_snapshot)
+        if keep_tape_content and self.tape and (self.history or self.step_count):
+            # Restaurar contenido inicial de la cinta (hasta el primer blanco)
+            # (una MappedTape cargada con load_tape_file() vuelve a leer su archivo)
+            if not (isinstance(self.tape, MappedTape) and self.tape.reload()):
+                content = self._input_content
+                if self.blank_symbol in content:
+                    content = content[:content.index(self.blank_symbol)]
+                self.tape.reset(content)
+        
+        self._execution.restart()
+        self._advance_detector = None
+        self.history.clear()
+        self.breakpoints.hit = None
+        self.budget.reset()
+        if self.profile is not None:
+            self.profile.clear()
+    
+    def _save_to_history(self, current_symbol, transition):
+        #Guarda el paso actual en el historial (solo el delta, no la cinta completa)
+        execution = self._execution
+        self.history.record(
+            execution.step_count,
+            execution.current_state,
+            execution.tape,
+            current_symbol,
+            transition.write_symbol if transition else None
+        )
     
     def get_status(self):
         #Retorna el estado actual de la máquina
@@ -165,6 +554,7 @@ class TuringMachine:
             'is_halted': self.is_halted,
             'is_accepted': self.is_accepted,
             'is_rejected': self.is_rejected,
+            'cycle_length': self.cycle_length,
             'tape_content': self.tape.get_tape_content() if self.tape else [],
             'head_position': self.tape.get_head_position() if self.tape else 0,
             'current_symbol': self.tape.read() if self.tape else None
@@ -178,8 +568,10 @@ class TuringMachine:
             return "ACEPTADO ✓"
         elif self.is_rejected:
             return "RECHAZADO ✗"
-        elif self.step_count >= self.max_steps:
-            return "TIMEOUT (excedió pasos máximos)"
+        elif self.cycle_length:
+            return f"BUCLE DETECTADO (ciclo de {self.cycle_length} pasos)"
+        elif self.stop_reason:
+            return self.STOP_MESSAGES.get(self.stop_reason, self.stop_reason)
         else:
             return "DETENIDO"
     
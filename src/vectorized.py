@@ -0,0 +1,237 @@
+# Motor vectorizado: una misma máquina sobre muchas entradas a la vez (NumPy)
+#
+# NumPy figura en requirements.txt (también lo instala pandas); sin él
+# run_lockstep() lanza ImportError y el resto del simulador funciona igual.
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .compiled import CompiledMachine
+from .tape import Tape
+
+# Con esta cantidad de filas activas o menos, cada una termina con el motor compilado
+TAIL_ROWS = 16
+
+# Celdas máximas de la matriz de cintas; si crecería más, las filas en el borde terminan con el motor compilado
+MAX_CELLS = 1 << 26
+
+# Celdas que se decodifican a la vez al armar los resultados
+DECODE_CELLS = 1 << 20
+
+
+def run_lockstep(machine, inputs, max_steps=10000):
+    #Ejecuta la máquina sobre todas las entradas en lockstep; retorna un resultado por entrada (como run_input)
+    #
+    # Las B cintas son las filas de una matriz (uint8 con hasta 256 símbolos)
+    # con un vector de cabezales y otro de estados; cada iteración avanza un
+    # paso de todas las filas activas con operaciones vectorizadas sobre la
+    # tabla δ compilada, y las filas que se detienen salen del conjunto
+    # activo. Cuando quedan pocas filas activas, o la matriz crecería demasiado,
+    # cada una continúa desde su configuración con CompiledMachine.execute. El
+    # resultado (veredicto, pasos, cinta) es el mismo que el de run_input y el
+    # de TuringMachine.run.
+    if np is None:
+        raise ImportError("run_lockstep requiere NumPy (pip install numpy o pip install -r requirements.txt)")
+    compiled = machine if isinstance(machine, CompiledMachine) else machine.compile()
+    if not isinstance(compiled, CompiledMachine):
+        raise ValueError("run_lockstep solo admite máquinas deterministas de una cinta")
+    inputs = list(inputs)
+    if not inputs:
+        return []
+    return _Lockstep(compiled, inputs, max_steps).run()
+
+
+class _Lockstep:
+    # Estado de una ejecución en lockstep
+    #
+    # La posición absoluta p de cada cinta está en la columna origin + p. Como
+    # en CompiledMachine, las celdas que Tape aún no creó tienen el código
+    # fresh_code (se comporta como el blanco), lo que permite recortar cada
+    # cinta final exactamente como la de Tape.
+
+    def __init__(self, compiled, inputs, max_steps):
+        self.compiled = compiled
+        self.inputs = inputs
+        self.max_steps = max_steps
+        self.results = [None] * len(inputs)
+
+        # Símbolos: los de la tabla, el código fresco y los de la entrada que la tabla no conoce
+        blank = compiled.symbols[0]
+        self.fresh = compiled.fresh_code
+        names = compiled.symbols + [blank]
+        codes = dict(compiled.symbol_codes)
+        for symbol in sorted(set(''.join(inputs)) - codes.keys()):
+            codes[symbol] = len(names)
+            names.append(symbol)
+        self.names = np.array(names, dtype=object)
+        self.dtype = np.uint8 if len(names) <= 256 else np.int32
+
+        # Tabla δ extendida: las columnas de símbolos desconocidos no tienen transiciones
+        num_states = compiled.num_states
+        size = len(names) * num_states
+        known = len(compiled.next_state)
+        self.num_states = num_states
+        self.next_state = np.full(size, -1, np.int32)
+        self.next_state[:known] = np.asarray(compiled.next_state, np.int32)
+        self.write_symbol = np.zeros(size, self.dtype)
+        self.write_symbol[:known] = np.asarray(compiled.write_symbol, self.dtype)
+        self.move = np.zeros(size, np.int64)
+        self.move[:known] = np.asarray(compiled.move, np.int64)
+        self.halting = np.asarray(compiled.halting, np.int8)
+
+        self._load_inputs(codes)
+
+    def _load_inputs(self, codes):
+        # Arma la matriz de cintas con el mismo contenido inicial que Tape
+        probe = Tape(None, self.compiled.symbols[0])
+        left = -probe.get_tape_start()  # Celdas a la izquierda de la entrada
+        right = probe.get_tape_end()  # Celdas después de la entrada
+        lengths = np.fromiter(map(len, self.inputs), np.int64, len(self.inputs))
+        count = len(self.inputs)
+
+        self.origin = left + 1
+        self.width = self.origin + int(lengths.max()) + right + 1
+        self.tape = np.full((count, self.width), self.fresh, self.dtype)
+
+        # Blancos iniciales: columnas [origin - left, origin + len + right) de cada fila
+        columns = np.arange(self.width)
+        self.tape[
+            (columns >= self.origin - left) & (columns[None, :] < (self.origin + lengths + right)[:, None])
+        ] = 0
+
+        # Entradas: todas concatenadas y repartidas con un solo índice plano
+        joined = ''.join(self.inputs)
+        if joined:
+            if self.dtype is np.uint8:
+                table = str.maketrans({symbol: chr(code) for symbol, code in codes.items() if len(symbol) == 1})
+                values = np.frombuffer(joined.translate(table).encode('latin-1'), np.uint8)
+            else:
+                values = np.array([codes[symbol] for symbol in joined], self.dtype)
+            rows = np.repeat(np.arange(count), lengths)
+            offsets = np.arange(len(joined)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+            self.tape.reshape(-1)[rows * self.width + self.origin + offsets] = values
+
+        # Filas activas: índice de la entrada, fila en la matriz, cabezal (columna) y estado
+        self.ids = np.arange(count)
+        self.rows = np.arange(count)
+        self.heads = np.full(count, self.origin, np.int64)
+        self.states = np.zeros(count, np.int32)  # El estado inicial tiene el código 0
+
+    def run(self):
+        # Avanza todas las filas activas un paso por iteración
+        step = 0
+        num_states = self.num_states
+        next_state, write_symbol, move, halting = self.next_state, self.write_symbol, self.move, self.halting
+
+        while self.ids.size > TAIL_ROWS and step < self.max_steps:
+            positions = self.rows * self.width + self.heads
+            flat = self.tape.reshape(-1)
+            keys = flat[positions].astype(np.intp) * num_states + self.states
+            targets = next_state[keys]
+
+            blocked = targets < 0
+            if blocked.any():
+                # Sin transición: la fila se detiene sin contar el paso
+                self._finish(blocked, step)
+                keep = ~blocked
+                positions, keys, targets = positions[keep], keys[keep], targets[keep]
+                self._select(keep)
+                if not self.ids.size:
+                    break
+
+            flat[positions] = write_symbol[keys]
+            self.heads += move[keys]
+            self.states = targets
+            step += 1
+
+            stopped = halting[targets] != 0
+            if stopped.any():
+                self._finish(stopped, step)
+                self._select(~stopped)
+                if not self.ids.size:
+                    break
+
+            if step >= self.max_steps:
+                # Las filas activas terminan por timeout (abajo), aunque estén en un borde
+                break
+
+            # Se crece al llegar a un borde, de modo que los cabezales nunca quedan fuera de la matriz
+            at_left, at_right = bool(self.heads.min() <= 0), bool(self.heads.max() >= self.width - 1)
+            if (at_left or at_right) and not self._grow(at_left, at_right):
+                # La matriz crecería demasiado: las filas en el borde continúan con el motor compilado
+                edge = (self.heads <= 0) | (self.heads >= self.width - 1)
+                self._finish_compiled(edge, step)
+                self._select(~edge)
+
+        if step >= self.max_steps:
+            # Límite de pasos alcanzado (timeout)
+            self._finish(np.ones(self.ids.size, bool), step)
+        else:
+            self._finish_compiled(np.ones(self.ids.size, bool), step)
+        return self.results
+
+    def _select(self, mask):
+        # Conserva solo las filas activas marcadas
+        self.ids, self.rows, self.heads, self.states = (
+            self.ids[mask], self.rows[mask], self.heads[mask], self.states[mask]
+        )
+
+    def _grow(self, left, right):
+        # Duplica el ancho de la matriz hacia los bordes alcanzados (solo con las filas activas)
+        # Retorna False si crecería más allá de MAX_CELLS
+        width = self.width * (1 + left + right)
+        if self.ids.size * width > MAX_CELLS:
+            return False
+        tape = np.full((self.ids.size, width), self.fresh, self.dtype)
+        shift = self.width if left else 0
+        tape[:, shift:shift + self.width] = self.tape[self.rows]
+        self.tape = tape
+        self.width = width
+        self.origin += shift
+        self.heads += shift
+        self.rows = np.arange(self.ids.size)
+        return True
+
+    def _configurations(self, rows, heads):
+        # Decodifica filas como Tape: lista de (celdas, inicio absoluto) recortando las celdas frescas de los extremos
+        # (las celdas no frescas son contiguas e incluyen el contenido inicial); por bloques de hasta DECODE_CELLS celdas
+        configurations = []
+        chunk = max(1, DECODE_CELLS // self.width)
+        for offset in range(0, len(rows), chunk):
+            block = self.tape[rows[offset:offset + chunk]]
+            block_heads = heads[offset:offset + chunk]
+            written = block != self.fresh
+            starts = np.minimum(written.argmax(axis=1), block_heads).tolist()
+            ends = np.maximum(self.width - written[:, ::-1].argmax(axis=1), block_heads + 1).tolist()
+            configurations.extend(
+                (cells[start:end], start - self.origin)
+                for cells, start, end in zip(self.names[block].tolist(), starts, ends)
+            )
+        return configurations
+
+    def _finish(self, mask, step):
+        # Arma el resultado de las filas detenidas (mask sobre las filas activas)
+        compiled = self.compiled
+        heads, states = self.heads[mask], self.states[mask]
+        configurations = self._configurations(self.rows[mask], heads)
+        for index, (cells, start), head, state in zip(
+            self.ids[mask].tolist(), configurations, heads.tolist(), states.tolist()
+        ):
+            self.results[index] = compiled._result(
+                cells, start, head - self.origin, compiled.states[state], step, self.max_steps,
+                compiled.halting[state], True
+            )
+
+    def _finish_compiled(self, mask, step):
+        # Continúa cada fila marcada desde su configuración con el motor compilado
+        compiled = self.compiled
+        heads, states = self.heads[mask], self.states[mask]
+        configurations = self._configurations(self.rows[mask], heads)
+        for index, (cells, start), head, state in zip(
+            self.ids[mask].tolist(), configurations, heads.tolist(), states.tolist()
+        ):
+            self.results[index] = compiled.execute(
+                cells, start, head - self.origin, compiled.states[state], step, self.max_steps, macro=True
+            )
@@ -0,0 +1,37 @@
+# Ejecución por lotes: mismos resultados que la ejecución directa, también sin motor compilado
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.batch import main, run_batch
+from src.parser import load_turing_machine
+
+EXAMPLES_DIR = Path(__file__).resolve().parent.parent / 'ejemplos'
+INPUTS = ['', 'a', 'ab', 'aba', 'abab', 'bbabb', 'babab']
+
+
+def _expected(tm, input_string):
+    run = tm.new_run()
+    run.load_tape(input_string)
+    verdict = run.run(1000)
+    return verdict, run.step_count, ''.join(run.tape.get_tape_content()).strip(run.blank_symbol)
+
+
+@pytest.mark.parametrize('name', ['subcadena_no_determinista.txt', 'lenguaje_anbn.txt'])
+@pytest.mark.parametrize('workers', [1, 2])
+def test_run_batch_matches_run(name, workers):
+    tm, _ = load_turing_machine(EXAMPLES_DIR / name)
+    results = list(run_batch(tm, INPUTS, 1000, workers=workers, chunk_size=3))
+    assert [result['input'] for result in results] == INPUTS
+    for result in results:
+        assert (result['verdict'], result['steps'], result['tape']) == _expected(tm, result['input'])
+
+
+def test_main_nondeterministic(tmp_path, capsys):
+    inputs = tmp_path / 'inputs.txt'
+    inputs.write_text('ab\nabab\n', encoding='utf-8')
+    assert main([str(EXAMPLES_DIR / 'subcadena_no_determinista.txt'), str(inputs), '--workers', '1']) == 0
+    verdicts = [json.loads(line)['verdict'] for line in capsys.readouterr().out.splitlines()]
+    assert verdicts == ['rejected', 'accepted']
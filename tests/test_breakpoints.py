@@ -0,0 +1,46 @@
+# Puntos de interrupción: run() y run_compiled() deben detenerse igual
+
+from src.turing_machine import TuringMachine
+
+
+def _alternating_machine():
+    # a y b alternan sobre los '1'; en el primer blanco ninguno tiene transición
+    tm = TuringMachine()
+    tm.configure('a', ['h'], [])
+    tm.add_transition('a', '1', '1', 'R', 'b')
+    tm.add_transition('b', '1', '1', 'R', 'a')
+    return tm
+
+
+def _stop(tm, engine, input_string, state):
+    run = tm.new_run()
+    run.load_tape(input_string)
+    run.breakpoints.toggle_state(state)
+    verdict = getattr(run, engine)()
+    return verdict, run.step_count, run.is_halted, run.breakpoints.hit
+
+
+def test_breakpoint_before_missing_transition():
+    # El punto de interrupción tiene prioridad sobre la detención del paso siguiente
+    tm = _alternating_machine()
+    expected = ('breakpoint', 1, False, ('state', 'b'))
+    assert _stop(tm, 'run', '1', 'b') == expected
+    assert _stop(tm, 'run_compiled', '1', 'b') == expected
+
+
+def test_continue_after_breakpoint_halts():
+    tm = _alternating_machine()
+    for engine in ('run', 'run_compiled'):
+        run = tm.new_run()
+        run.load_tape('1')
+        run.breakpoints.toggle_state('b')
+        assert getattr(run, engine)() == 'breakpoint'
+        assert getattr(run, engine)() == 'halted'
+        assert run.step_count == 1
+
+
+def test_breakpoint_in_the_middle():
+    tm = _alternating_machine()
+    assert _stop(tm, 'run', '111', 'b') == _stop(tm, 'run_compiled', '111', 'b') == (
+        'breakpoint', 1, False, ('state', 'b')
+    )
@@ -0,0 +1,45 @@
+# Línea de comandos (python -m src): veredictos con --tape-file
+
+import json
+
+from src.cli import main
+
+SCANNER = """\
+[CONFIG]
+initial_state: a
+accept_states: h
+blank_symbol: _
+
+[ALPHABET]
+input: 1
+tape: 1, _
+
+[TRANSITIONS]
+a, 1 -> 1, R, a
+"""
+
+
+def _tape_file_run(tmp_path, capsys, cells, *options):
+    # Ejecuta el escáner sobre una cinta de `cells` unos y retorna la línea JSON de salida
+    machine = tmp_path / 'scanner.txt'
+    machine.write_text(SCANNER, encoding='utf-8')
+    tape = tmp_path / 'tape.bin'
+    tape.write_bytes(b'1' * cells)
+    code = main([
+        str(machine), '--tape-file', str(tape), '--tape-out', str(tmp_path / 'out.bin'),
+        '--format', 'json', *options
+    ])
+    return code, json.loads(capsys.readouterr().out)
+
+
+def test_tape_file_halts_after_default_max_steps(tmp_path, capsys):
+    # 20000 pasos: más que el límite por defecto (10000) pero dentro de --max-steps
+    code, result = _tape_file_run(tmp_path, capsys, 20000, '--max-steps', '100000', '--expect', 'halted')
+    assert code == 0
+    assert (result['verdict'], result['steps']) == ('halted', 20000)
+
+
+def test_tape_file_timeout(tmp_path, capsys):
+    code, result = _tape_file_run(tmp_path, capsys, 20000, '--max-steps', '15000')
+    assert code == 0
+    assert (result['verdict'], result['steps']) == ('timeout', 15000)
@@ -0,0 +1,118 @@
+# Equivalencia de motores: run() contra run_compiled(), run_input() y run_lockstep()
+
+from itertools import product
+from pathlib import Path
+
+import pytest
+
+from src.examples import EXAMPLES, get_example
+from src.multitape import MultiTapeTuringMachine
+from src.parser import load_turing_machine
+
+EXAMPLES_DIR = Path(__file__).resolve().parent.parent / 'ejemplos'
+MAX_STEPS = 10000
+
+
+def _machines():
+    # (id, máquina, entrada por defecto) de los ejemplos de EXAMPLES y de ejemplos/
+    machines = [(key,) + get_example(key) for key in EXAMPLES]
+    for path in sorted(EXAMPLES_DIR.glob('*.txt')):
+        machines.append((path.name,) + load_turing_machine(path))
+    return machines
+
+
+MACHINES = _machines()
+DETERMINISTIC = [machine for machine in MACHINES if machine[1].supports_compile]
+SINGLE_TAPE = [machine for machine in DETERMINISTIC if machine[1].supports_definition]
+
+
+def _inputs(tm, default_input):
+    # La entrada por defecto y todas las cadenas de hasta 3 símbolos (de los 3 primeros del alfabeto)
+    symbols = sorted(symbol for symbol in tm.transition_function.get_symbols() if len(symbol) == 1)
+    symbols = [symbol for symbol in symbols if symbol != tm.blank_symbol][:3]
+    inputs = [default_input or '']
+    for length in range(4):
+        inputs += [''.join(letters) for letters in product(symbols, repeat=length)]
+    return inputs
+
+
+def _outcome(verdict, step_count, state, cells, tape_start, head_position, blank):
+    # Resultado comparable: veredicto, pasos, estado, cabezal y celdas no blancas con su posición
+    used = [index for index, symbol in enumerate(cells) if symbol != blank]
+    if not used:
+        return verdict, step_count, state, head_position, None, ''
+    return (
+        verdict, step_count, state, head_position,
+        tape_start + used[0], ''.join(cells[used[0]:used[-1] + 1])
+    )
+
+
+def _machine_outcome(tm, verdict):
+    return _outcome(
+        verdict, tm.step_count, tm.current_state, tm.tape.get_tape_content(),
+        tm.tape.get_tape_start(), tm.tape.get_head_position(), tm.blank_symbol
+    )
+
+
+def _result_outcome(result, blank):
+    return _outcome(
+        result['verdict'], result['step_count'], result['state'], result['tape'],
+        result['tape_start'], result['head_position'], blank
+    )
+
+
+def _run(tm, input_string, engine, **options):
+    run = tm.new_run()
+    run.load_tape(input_string)
+    verdict = getattr(run, engine)(MAX_STEPS, **options)
+    return _machine_outcome(run, verdict)
+
+
+@pytest.mark.parametrize('name, tm, default_input', DETERMINISTIC, ids=[m[0] for m in DETERMINISTIC])
+def test_run_compiled_matches_run(name, tm, default_input):
+    for input_string in _inputs(tm, default_input):
+        expected = _run(tm, input_string, 'run')
+        assert _run(tm, input_string, 'run_compiled') == expected, input_string
+        if not isinstance(tm, MultiTapeTuringMachine):
+            assert _run(tm, input_string, 'run_compiled', macro=True) == expected, input_string
+
+
+@pytest.mark.parametrize('name, tm, default_input', SINGLE_TAPE, ids=[m[0] for m in SINGLE_TAPE])
+def test_run_input_matches_run(name, tm, default_input):
+    compiled = tm.compile()
+    for input_string in _inputs(tm, default_input):
+        result = compiled.run_input(input_string, MAX_STEPS, macro=True)
+        assert _result_outcome(result, tm.blank_symbol) == _run(tm, input_string, 'run'), input_string
+
+
+@pytest.mark.parametrize('name, tm, default_input', SINGLE_TAPE, ids=[m[0] for m in SINGLE_TAPE])
+def test_run_lockstep_matches_run(name, tm, default_input):
+    pytest.importorskip('numpy')
+    from src.vectorized import run_lockstep
+
+    inputs = _inputs(tm, default_input)
+    for max_steps in (1, 7, MAX_STEPS):
+        results = run_lockstep(tm, inputs, max_steps)
+        for input_string, result in zip(inputs, results):
+            run = tm.new_run()
+            run.load_tape(input_string)
+            expected = _machine_outcome(run, run.run(max_steps))
+            assert _result_outcome(result, tm.blank_symbol) == expected, (input_string, max_steps)
+
+
+def _stops(tm, input_string, engine, state):
+    # Veredictos sucesivos con un punto de interrupción en `state` hasta que la máquina se detiene
+    run = tm.new_run()
+    run.load_tape(input_string)
+    run.breakpoints.toggle_state(state)
+    stops = []
+    while not run.is_halted:
+        verdict = getattr(run, engine)(MAX_STEPS)
+        stops.append((verdict, run.step_count, run.current_state, run.breakpoints.hit))
+    return stops
+
+
+@pytest.mark.parametrize('name, tm, default_input', DETERMINISTIC, ids=[m[0] for m in DETERMINISTIC])
+def test_breakpoints_match_run(name, tm, default_input):
+    for state in sorted(tm.transition_function.get_states()):
+        assert _stops(tm, default_input or '', 'run_compiled', state) == _stops(tm, default_input or '', 'run', state), state
@@ -0,0 +1,25 @@
+# Ejemplos de EXAMPLES: cada uno llega al resultado que describe (el blanco es '_')
+
+import pytest
+
+from src.examples import get_example
+
+CASES = [
+    ('binary_increment', '1011', 'accepted', '1100'),
+    ('binary_increment', '111', 'accepted', '1000'),
+    ('palindrome', 'abba', 'accepted', ''),
+    ('palindrome', 'aba', 'accepted', ''),
+    ('palindrome', '', 'accepted', ''),
+    ('palindrome', 'abab', 'rejected', 'bab'),
+    ('unary_addition', '111+11', 'accepted', '11111'),
+    ('binary_multiplication', '10*11', 'accepted', '10*11')
+]
+
+
+@pytest.mark.parametrize('key, input_string, verdict, tape', CASES)
+def test_example_result(key, input_string, verdict, tape):
+    tm, _ = get_example(key)
+    run = tm.new_run()
+    run.load_tape(input_string)
+    assert run.run() == verdict
+    assert ''.join(run.tape.get_tape_content()).strip(run.blank_symbol) == tape
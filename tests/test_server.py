@@ -0,0 +1,49 @@
+# Servicio HTTP: /trace (_trace_batch) y /run (run_inputs) deben informar el mismo veredicto
+
+import time
+
+import pytest
+
+from src.budget import RunBudget
+from src.cache import parse_cached
+from src.server import _trace_batch, run_inputs
+
+SCANNER = """\
+[CONFIG]
+initial_state: a
+accept_states: h
+blank_symbol: _
+
+[ALPHABET]
+input: 1
+tape: 1, _
+
+[TRANSITIONS]
+a, 1 -> 1, R, a
+"""
+TIME_LIMIT = 30.0
+
+
+def _trace(source, input_string, max_steps):
+    # Recorre la traza por bloques como SimulationServer._trace; retorna (eventos, resumen final)
+    tm, _ = parse_cached(source)
+    tm.load_tape(input_string)
+    tm.budget = RunBudget(TIME_LIMIT)
+    events = tm.iter_steps(max_steps)
+    deadline = time.perf_counter() + TIME_LIMIT
+    count, summary = 0, None
+    while summary is None:
+        lines, summary = _trace_batch(tm, events, deadline)
+        count += len(lines)
+    return count, summary
+
+
+@pytest.mark.parametrize('max_steps, verdict, steps', [(100000, 'halted', 20000), (15000, 'timeout', 15000)])
+def test_trace_matches_run(max_steps, verdict, steps):
+    # 20000 pasos: más que el límite por defecto (10000), dentro o fuera de max_steps
+    input_string = '1' * 20000
+    count, summary = _trace(SCANNER, input_string, max_steps)
+    [result] = run_inputs(SCANNER, [input_string], max_steps, TIME_LIMIT)
+    assert summary == {'verdict': verdict, 'steps': steps}
+    assert count == steps
+    assert (result['verdict'], result['steps']) == (verdict, steps)
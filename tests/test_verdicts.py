@@ -0,0 +1,72 @@
+# Veredictos leídos después de una ejecución (max_steps solo rige durante la llamada)
+
+import pytest
+
+from src.budget import RunBudget
+from src.multitape import MultiTapeTuringMachine
+from src.turing_machine import TuringMachine
+
+LONG_INPUT = '1' * 20000  # Más pasos que el max_steps por defecto (10000)
+
+
+def _scanner():
+    # Recorre los '1' hacia la derecha y se detiene en el primer blanco (un paso por símbolo)
+    tm = TuringMachine()
+    tm.configure('a', ['h'], [])
+    tm.add_transition('a', '1', '1', 'R', 'a')
+    return tm
+
+
+@pytest.mark.parametrize('engine', ['run', 'run_compiled'])
+def test_verdict_after_run_with_larger_max_steps(engine):
+    tm = _scanner()
+    tm.load_tape(LONG_INPUT)
+    assert getattr(tm, engine)(max_steps=100000) == 'halted'
+    assert tm.step_count == 20000
+    assert tm.max_steps == 10000
+    assert tm.get_verdict() == 'halted'
+    assert tm.get_result_string() == "DETENIDO"
+
+
+def test_timeout_is_kept_after_run():
+    tm = _scanner()
+    tm.load_tape(LONG_INPUT)
+    assert tm.run(max_steps=500) == 'timeout'
+    assert tm.get_verdict() == 'timeout'
+    assert tm.get_result_string() == "TIMEOUT (excedió pasos máximos)"
+
+
+def test_execution_verdict_after_run():
+    execution = _scanner().execution(LONG_INPUT)
+    assert execution.run(100000) == 'halted'
+    assert execution.get_verdict() == 'halted'
+
+
+def test_multitape_verdict_after_run():
+    tm = MultiTapeTuringMachine(2)
+    tm.configure('a', ['h'], [])
+    tm.add_transition('a', ('1', '_'), ('1', '1'), ('R', 'R'), 'a')
+    for engine in ('run', 'run_compiled'):
+        run = tm.new_run()
+        run.load_tape(LONG_INPUT)
+        assert getattr(run, engine)(max_steps=100000) == 'halted'
+        assert run.get_verdict() == 'halted'
+
+
+@pytest.mark.parametrize('engine, budget, verdict', [
+    ('run', RunBudget(time_limit=1e-9, check_interval=16), 'time_limit'),
+    ('run_compiled', RunBudget(time_limit=1e-9, check_interval=16), 'time_limit'),
+    ('run', RunBudget(max_tape_cells=1000, check_interval=16), 'tape_limit'),
+    ('run_compiled', RunBudget(max_tape_cells=1000, check_interval=16), 'tape_limit'),
+    ('run', RunBudget(max_history_bytes=1000, check_interval=16), 'memory_limit')  # El compilado no guarda historial
+])
+def test_budget_verdict_is_not_timeout(engine, budget, verdict):
+    # Una ejecución detenida por el presupuesto informa su propio veredicto, no 'timeout'
+    tm = _scanner()
+    tm.budget = budget
+    tm.load_tape(LONG_INPUT)
+    assert getattr(tm, engine)(max_steps=100000) == verdict
+    assert tm.step_count < 20000
+    assert tm.get_verdict() == verdict
+    assert tm.get_result_string() == TuringMachine.STOP_MESSAGES[verdict]
+    assert tm.get_result_string() != TuringMachine.STOP_MESSAGES['timeout']